@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from Application.ranking import rescore_all
+
+
+class Command(BaseCommand):
+    help = "Recompute the applicant match scores used by the ranked applications view"
+
+    def handle(self, *args, **options):
+        count = rescore_all()
+        self.stdout.write(f"Rescored {count} applications.")
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Application", "0001_initial"),
+        ("JobSeekerProfile", "0001_initial"),
+        ("Jobs", "0002_jobsearchterm"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="savejob",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["job_seeker_profile", "applied_at", "id"],
+                name="app_seeker_applied_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["job", "applied_at", "id"], name="app_job_applied_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="savejob",
+            index=models.Index(
+                fields=["profile", "created_at", "id"],
+                name="savejob_profile_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,104 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:31
+
+import math
+import re
+import unicodedata
+import zlib
+from collections import Counter, defaultdict
+
+from django.db import migrations, models
+from django.utils.html import strip_tags
+
+# Frozen copy of the Application.ranking scoring as of this migration, so
+# later changes to the app code can't break it. Zawgyi text is not
+# converted here; `manage.py rescore_applications` recomputes every score
+# with the current code.
+DIMENSIONS = 1 << 20
+_SPLIT_RE = re.compile(r"[\s!-/:-@\[-`{-~]+")
+
+
+def _words(text):
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    return [w for w in _SPLIT_RE.split(text) if len(w) > 1]
+
+
+def _vector(tokens):
+    #{slot: weight}, L2-normalized
+    slots = Counter()
+    for token, weight in tokens.items():
+        slots[zlib.crc32(token.encode()) & (DIMENSIONS - 1)] += weight
+    norm = math.sqrt(sum(w * w for w in slots.values())) or 1.0
+    return {slot: weight / norm for slot, weight in slots.items()}
+
+
+def _job_vector(title, description):
+    tokens = Counter()
+    for word in _words(title):
+        tokens[f"w:{word}"] += 3.0
+    for word, n in Counter(_words(strip_tags(description or ""))).items():
+        tokens[f"w:{word}"] += 0.5 * (1 + math.log(n))
+    return _vector(tokens)
+
+
+def _applicant_vector(skills, experiences, languages):
+    tokens = Counter()
+    for name, level in skills:
+        for word in _words(name):
+            tokens[f"w:{word}"] += 1.5 + 0.5 * (level or 1)
+    for job_title, position in experiences:
+        for word in _words(job_title) + _words(position):
+            tokens[f"w:{word}"] += 2.0
+    for name in languages:
+        for word in _words(name):
+            tokens[f"w:{word}"] += 1.0
+    return _vector(tokens)
+
+
+def backfill_scores(apps, schema_editor):
+    Application = apps.get_model("Application", "Application")
+    Skill = apps.get_model("JobSeekerProfile", "Skill")
+    Experience = apps.get_model("JobSeekerProfile", "Experience")
+    Language = apps.get_model("JobSeekerProfile", "Language")
+    skills, experiences, languages = defaultdict(list), defaultdict(list), defaultdict(list)
+    for profile_id, name, level in Skill.objects.values_list("profile_id", "name", "proficiency_level"):
+        skills[profile_id].append((name, level))
+    for profile_id, job_title, position in Experience.objects.values_list("profile_id", "job_title", "position"):
+        experiences[profile_id].append((job_title, position))
+    for profile_id, name in Language.objects.values_list("profile_id", "name"):
+        languages[profile_id].append(name)
+    profiles, jobs, updated = {}, {}, []
+    for app_id, job_id, profile_id, title, description in Application.objects.filter(
+        job_seeker_profile__isnull=False
+    ).values_list("id", "job_id", "job_seeker_profile_id", "job__title", "job__description").iterator():
+        if profile_id not in profiles:
+            profiles[profile_id] = _applicant_vector(skills[profile_id], experiences[profile_id], languages[profile_id])
+        if job_id not in jobs:
+            jobs[job_id] = _job_vector(title, description)
+        job, profile = jobs[job_id], profiles[profile_id]
+        score = sum(weight * job.get(slot, 0.0) for slot, weight in profile.items())
+        updated.append(Application(id=app_id, match_score=round(score, 4)))
+    Application.objects.bulk_update(updated, ["match_score"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Application", "0002_savejob_created_at_and_more"),
+        ("JobSeekerProfile", "0003_recommendation_vectors"),
+        ("Jobs", "0010_search_term_stats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="application",
+            name="match_score",
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["job", "match_score", "id"], name="app_job_score_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_scores, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+from django.db import migrations, models
+from django.db.models.functions import Coalesce, Now
+
+
+def backfill_timestamps(apps, schema_editor):
+    Application = apps.get_model("Application", "Application")
+    SaveJob = apps.get_model("Application", "SaveJob")
+    Application.objects.filter(applied_at__isnull=True).update(applied_at=Coalesce("updated_at", Now()))
+    SaveJob.objects.filter(created_at__isnull=True).update(created_at=Now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Application", "0003_application_match_score"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_timestamps, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="application",
+            name="applied_at",
+            field=models.DateTimeField(auto_now_add=True, blank=True),
+        ),
+        migrations.AlterField(
+            model_name="savejob",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, blank=True),
+        ),
+    ]
@@ -13,14 +13,20 @@ class SaveJob(models.Model):
     )
     profile = models.ForeignKey(JobseekerProfile, on_delete=models.CASCADE,related_name='saved_jobs', null=True, blank=True)
     job = models.ForeignKey(Jobs, on_delete=models.CASCADE, null=True, blank=True)
+    #NOT NULL so the keyset pagination seek is a plain (created_at, id) range
+    created_at = models.DateTimeField(auto_now_add=True, blank=True)
 
     class Meta:
         constraints = [
             models.UniqueConstraint(
                 fields=["profile", "job"],
                 name="unique_save_job_per_jobseeker_job"
-        )
-    ]
+            )
+        ]
+        indexes = [
+            models.Index(fields=["profile", "created_at", "id"], name="savejob_profile_created_idx"),
+        ]
+
     def __str__(self):
         return f"{self.profile} saved {self.job}"
 
@@ -65,11 +71,21 @@ class Application(models.Model):
     job = models.ForeignKey(Jobs, on_delete=models.CASCADE,related_name='applications')
     status = models.CharField(max_length=50,choices=STATUS_CHOICES,default='P',null=True, blank=True)
     cover_letter_text = models.TextField(null=True)
-    applied_at = models.DateTimeField(auto_now_add=True,null=True, blank=True)
+    #NOT NULL so the keyset pagination seek is a plain (applied_at, id) range
+    applied_at = models.DateTimeField(auto_now_add=True, blank=True)
     updated_at=models.DateTimeField(auto_now=True,null=True, blank=True)
+    #fit of the seeker's profile to the job text, kept current by Application.ranking
+    match_score = models.FloatField(null=True, blank=True, editable=False)
 
     objects = ApplicationManager()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["job_seeker_profile", "applied_at", "id"], name="app_seeker_applied_idx"),
+            models.Index(fields=["job", "applied_at", "id"], name="app_job_applied_idx"),
+            models.Index(fields=["job", "match_score", "id"], name="app_job_score_idx"),
+        ]
+
     def __str__(self):
         return f"{self.job_seeker_profile} applied for {self.job}"
         
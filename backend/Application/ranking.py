@@ -0,0 +1,86 @@
+from collections import defaultdict
+
+from Application.models import Application
+from Jobs.models import Jobs
+from JobSeekerProfile.models import Experience, Language, Skill
+from JobSeekerProfile.recommendations import applicant_tokens, encode, job_tokens, sparse_scores, stack
+
+BATCH_SIZE = 500
+
+
+def job_vector(title, description):
+    return encode(job_tokens(title, description, None, ""))
+
+
+def applicant_vectors(profile_ids):
+    """{profile_id: encoded vector} from skills, experience titles and languages, in three queries."""
+    skills, experiences, languages = defaultdict(list), defaultdict(list), defaultdict(list)
+    for profile_id, name, level in Skill.objects.filter(profile_id__in=profile_ids).values_list(
+        "profile_id", "name", "proficiency_level"
+    ):
+        skills[profile_id].append((name, level))
+    for profile_id, job_title, position in Experience.objects.filter(profile_id__in=profile_ids).values_list(
+        "profile_id", "job_title", "position"
+    ):
+        experiences[profile_id].append((job_title, position))
+    for profile_id, name in Language.objects.filter(profile_id__in=profile_ids).values_list("profile_id", "name"):
+        languages[profile_id].append(name)
+    return {
+        profile_id: encode(applicant_tokens(skills[profile_id], experiences[profile_id], languages[profile_id]))
+        for profile_id in profile_ids
+    }
+
+
+def _save_scores(scores):
+    #bulk_update skips auto_now, so rescoring leaves updated_at alone
+    Application.objects.bulk_update(
+        [Application(id=app_id, match_score=score) for app_id, score in scores.items()],
+        ["match_score"],
+        batch_size=BATCH_SIZE,
+    )
+
+
+def rescore_job(job):
+    """Score every application to ``job`` against its title and description in one vectorized batch."""
+    applications = list(
+        Application.objects.filter(job=job, job_seeker_profile__isnull=False).values_list("id", "job_seeker_profile_id")
+    )
+    if not applications:
+        return 0
+    vectors = applicant_vectors({profile_id for _, profile_id in applications})
+    rows, indices, weights = stack([vectors[profile_id] for _, profile_id in applications])
+    totals = sparse_scores(*job_vector(job.title, job.description), rows, indices, weights, len(applications))
+    _save_scores({app_id: round(float(score), 4) for (app_id, _), score in zip(applications, totals)})
+    return len(applications)
+
+
+def rescore_profile(profile_id):
+    """Rescore the applications of one seeker after their profile changed: the profile against each job applied to."""
+    applications = list(
+        Application.objects.filter(job_seeker_profile_id=profile_id).values_list("id", "job__title", "job__description")
+    )
+    if not applications:
+        return 0
+    rows, indices, weights = stack([job_vector(title, description) for _, title, description in applications])
+    totals = sparse_scores(*applicant_vectors([profile_id])[profile_id], rows, indices, weights, len(applications))
+    _save_scores({app_id: round(float(score), 4) for (app_id, _, _), score in zip(applications, totals)})
+    return len(applications)
+
+
+def score_application(application):
+    if not application.job_seeker_profile_id:
+        return
+    profile_indices, profile_weights = applicant_vectors([application.job_seeker_profile_id])[
+        application.job_seeker_profile_id
+    ]
+    rows, indices, weights = stack([job_vector(application.job.title, application.job.description)])
+    score = round(float(sparse_scores(profile_indices, profile_weights, rows, indices, weights, 1)[0]), 4)
+    Application.objects.filter(pk=application.pk).update(match_score=score)
+    application.match_score = score
+
+
+def rescore_all():
+    count = 0
+    for job in Jobs.objects.filter(applications__isnull=False).distinct().only("id", "title", "description").iterator():
+        count += rescore_job(job)
+    return count
@@ -23,6 +23,11 @@ class ApplicationListSerializer(serializers.ModelSerializer):
         model=Application
         fields = ["id", "job_seeker_profile","jobseeker_email","jobseeker_name", "job","status_display", "status", "applied_at","cover_letter_text"]
 
+#employer ranked applicants only; seekers must not see how they rank
+class RankedApplicationSerializer(ApplicationListSerializer):
+    class Meta(ApplicationListSerializer.Meta):
+        fields = ApplicationListSerializer.Meta.fields + ["match_score"]
+
 class ApplicationDetailSerializer(serializers.ModelSerializer):
     job = JobsSerializer(read_only=True)
     resume = serializers.SerializerMethodField()
@@ -32,7 +37,7 @@ class ApplicationDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Application
-        fields = "__all__"
+        exclude = ["match_score"]
     
     
     # Get the default resume for this jobseeker profile
@@ -64,6 +69,9 @@ class SaveJobsSerializer(serializers.ModelSerializer):
         fields='__all__'
 
     def get_is_applied(self, obj):
+        #saved_jobs annotates this with an EXISTS subquery
+        if hasattr(obj, "has_applied"):
+            return obj.has_applied
         user_profile = obj.profile
         if not user_profile:
             return False
@@ -1,3 +1,65 @@
+import numpy as np
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from Accounts.models import CustomUser
+from EmployerProfile.models import EmployerProfile
+from Jobs.models import JobCategory, Jobs
+from JobSeekerProfile.models import JobseekerProfile, ProfileVector, SeekerCategoryInterest
+from JobSeekerProfile.recommendations import _slot
+from .models import Application
+
+
+class ApplyTests(TestCase):
+    def setUp(self):
+        employer_user = CustomUser.objects.create_user(email="employer@example.com", password="pw", role="employer")
+        employer = EmployerProfile.objects.create(
+            user=employer_user, first_name="A", last_name="B", business_name="Arakkha Co", city="Sittwe"
+        )
+        self.employer_user = employer_user
+        self.category = JobCategory.objects.create(name="Engineering", user=employer_user)
+        self.job = Jobs.objects.create(employer=employer, title="Backend Engineer", category=self.category)
+        seeker = CustomUser.objects.create_user(email="seeker@example.com", password="pw")
+        self.profile = JobseekerProfile.objects.create(user=seeker, full_name="Seeker")
+        self.client = APIClient()
+        self.client.force_authenticate(seeker)
+
+    def apply(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(reverse("apply-job", args=[self.job.id]), {}, format="json")
+
+    def test_apply_bumps_application_count(self):
+        self.assertEqual(self.apply().status_code, 201)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.application_count, 1)
+        self.assertEqual(self.apply().status_code, 400)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.application_count, 1)
+
+    def test_removing_the_application_gives_the_slot_back(self):
+        self.apply()
+        application = Application.objects.get(job=self.job)
+        self.client.delete(reverse("apply-job-remove", args=[application.id]))
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.application_count, 0)
+
+    def test_applied_category_reaches_the_recommendation_vector(self):
+        self.apply()
+        self.assertTrue(SeekerCategoryInterest.objects.filter(profile=self.profile, category=self.category).exists())
+        vector = ProfileVector.objects.get(profile=self.profile)
+        indices = np.frombuffer(vector.indices, dtype="<i4")
+        self.assertIn(_slot(f"c:{self.category.id}"), indices)
+
+    def test_match_score_is_only_shown_to_the_employer(self):
+        self.apply()
+        application = Application.objects.get(job=self.job)
+        seeker_list = self.client.get(reverse("apply-jobs-list")).json()["apply_jobs"]
+        self.assertNotIn("match_score", seeker_list[0])
+        seeker_detail = self.client.get(reverse("apply-job-detail", args=[application.id])).json()
+        self.assertNotIn("match_score", seeker_detail["application_detail"])
+
+        employer_client = APIClient()
+        employer_client.force_authenticate(self.employer_user)
+        ranked = employer_client.get(reverse("employer-ranked-applications", args=[self.job.id])).json()
+        self.assertIn("match_score", ranked["applications"][0])
@@ -10,6 +10,7 @@ urlpatterns = [
 
     #applications for employer dashboard
     path("employer/applications/",applications,name="employer-applications"),
+    path("employer/job/<uuid:job_id>/applications/ranked/",ranked_applications,name="employer-ranked-applications"),
     path("employer/application/detail/<uuid:app_id>/",application_detail,name="employer-application-detail"),
     path("employer/application/delete/<uuid:app_id>/",application_delete,name="employer-application-delete"),
     path("employer/application/pending/",pending_applications,name="employer-pending-applicatons"),
@@ -1,10 +1,16 @@
 from django.db import transaction
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.contrib.contenttypes.models import ContentType
 from .models import Jobs
 from Application.models import Application
 from Notification.models import Notification
+from JobSeekerProfile.models import Experience, Language, SeekerCategoryInterest, Skill
+from JobSeekerProfile.recommendations import update_profile_vector
+from .ranking import rescore_job, rescore_profile, score_application
+
+#job fields the applicant match score is computed from
+RANKING_FIELDS = ("title", "description")
 
 
 
@@ -21,3 +27,50 @@ def notify_on_application_created(sender, instance, created, **kwargs):
         content_type=ContentType.objects.get_for_model(Application),
         object_id=instance.id,
     ))
+
+
+#Application created -> remember the seeker's category for new-job alerts
+@receiver(post_save, sender=Application)
+def record_category_interest(sender, instance, created, **kwargs):
+    if not created or not instance.job_seeker_profile_id or not instance.job.category_id:
+        return
+    profile_id = instance.job_seeker_profile_id
+    SeekerCategoryInterest.objects.bulk_create(
+        [SeekerCategoryInterest(category_id=instance.job.category_id, profile_id=profile_id)],
+        ignore_conflicts=True,
+    )
+    #bulk_create sends no post_save, so the recommendation vector is refreshed here
+    transaction.on_commit(lambda: update_profile_vector(profile_id))
+
+
+#Application created -> score the applicant against the job
+@receiver(post_save, sender=Application)
+def score_new_application(sender, instance, created, **kwargs):
+    if created:
+        score_application(instance)
+
+
+#Job text about to change -> remember it so post_save rescores only on a real edit
+@receiver(pre_save, sender=Jobs)
+def detect_ranking_change(sender, instance, update_fields=None, **kwargs):
+    instance._ranking_changed = False
+    if instance._state.adding:
+        return
+    if update_fields is not None and not set(RANKING_FIELDS).intersection(update_fields):
+        return
+    previous = Jobs.objects.filter(pk=instance.pk).values_list(*RANKING_FIELDS).first()
+    instance._ranking_changed = previous != tuple(getattr(instance, field) for field in RANKING_FIELDS)
+
+
+@receiver(post_save, sender=Jobs)
+def rescore_job_applications(sender, instance, **kwargs):
+    if getattr(instance, "_ranking_changed", False):
+        rescore_job(instance)
+
+
+#Profile skills / experience / languages changed -> rescore that seeker's applications
+@receiver([post_save, post_delete], sender=Skill)
+@receiver([post_save, post_delete], sender=Experience)
+@receiver([post_save, post_delete], sender=Language)
+def rescore_profile_applications(sender, instance, **kwargs):
+    rescore_profile(instance.profile_id)
@@ -17,8 +17,13 @@ from Application.models import *
 from Notification.models import *
 from Jobs.models import *
 from .serializers import *
+from Jobs.pagination import paginated_response
+from django.db.models import Exists, OuterRef
 #hello wrold
 
+#everything ApplicationListSerializer touches, so a page serializes without per-row queries
+APPLICATION_LIST_RELATED = ("job__employer", "job__category", "job_seeker_profile__user")
+
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 @parser_classes([JSONParser, MultiPartParser, FormParser])
@@ -38,7 +43,7 @@ def apply_job(request, job_id):
 
     #Max applicants null-safe check
     max_limit = getattr(job, "max_applicants", None)
-    total = Application.objects.filter(job=job).count()
+    total = job.application_count
 
     # Treat 0 or None as unlimited
     if max_limit is None or max_limit <= 0:
@@ -62,15 +67,24 @@ def apply_job(request, job_id):
     #Create application inside a transaction
     try:
         with transaction.atomic():
+            #lock the job row so concurrent applies see the same counter
+            job = Jobs.objects.select_for_update().select_related("employer", "category").get(id=job.id)
+            if max_limit is not None and job.application_count >= max_limit:
+                return Response(
+                    {"message": "The maximum number of applicants for this job has been reached."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
             application = Application.objects.create(
                 job_seeker_profile=profile,
                 job=job,
                 status=serializer.validated_data.get("status", "P"),
                 cover_letter_text=serializer.validated_data.get("cover_letter_text", "")
             )
+            Jobs.objects.adjust_application_count(job.id, 1)
+            job.application_count += 1
 
-            #Re-count AFTER creating; close job if hitting limit
-            total_after = Application.objects.filter(job=job).count()
+            #close job if hitting limit
+            total_after = job.application_count
             if max_limit is not None and total_after >= max_limit and job.is_active:
                 job.is_active = False
                 job.save(update_fields=["is_active"])
@@ -121,9 +135,10 @@ def saved_jobs(request):
     except JobseekerProfile.DoesNotExist:
         return Response({"detail": "Ah! You have to create profile before save job"}, status=status.HTTP_404_NOT_FOUND)
     
-    savejobs=SaveJob.objects.filter(profile=profile)
-    s_savejobs=SaveJobsSerializer(savejobs,many=True).data
-    return Response({"s_savejobs":s_savejobs})
+    savejobs=SaveJob.objects.filter(profile=profile).select_related("job__employer", "job__category").annotate(
+        has_applied=Exists(Application.objects.filter(job=OuterRef("job"), job_seeker_profile=OuterRef("profile")))
+    )
+    return paginated_response(request, savejobs, SaveJobsSerializer, "s_savejobs")
 
     
 @api_view(['GET'])
@@ -159,9 +174,8 @@ def saved_job_remove(request,sj_id):
 
 @api_view(['GET'])
 def applied_jobs(request):
-    applications = Application.objects.filter(job_seeker_profile__user=request.user)
-    app_job=ApplicationListSerializer(applications,many=True).data
-    return Response({"apply_jobs": app_job})
+    applications = Application.objects.filter(job_seeker_profile__user=request.user).select_related(*APPLICATION_LIST_RELATED)
+    return paginated_response(request, applications, ApplicationListSerializer, "apply_jobs", ordering_field="applied_at")
 
 @api_view(['GET'])
 def applied_job_detail(request,app_id):
@@ -173,7 +187,9 @@ def applied_job_detail(request,app_id):
 def applied_job_remove(request,app_id):
     if request.method == "DELETE":
         application=get_object_or_404(Application,id=app_id,job_seeker_profile__user=request.user)
-        application.delete()
+        with transaction.atomic():
+            application.delete()
+            Jobs.objects.adjust_application_count(application.job_id, -1)
         return Response({"Message":f"Job {application.job.title} Succssfully Remove"},status=status.HTTP_200_OK)
     else:
         return Response({"Message":"Something Wrong Please try again"})
@@ -183,9 +199,17 @@ def applied_job_remove(request,app_id):
 @api_view(['GET'])
 def applications(request):
     employer=get_object_or_404(EmployerProfile,user=request.user)
-    query=Application.objects.applications_for_employer(employer)
-    applications=ApplicationListSerializer(query,many=True).data
-    return Response({"applications":applications})
+    query=Application.objects.applications_for_employer(employer).select_related(*APPLICATION_LIST_RELATED)
+    return paginated_response(request, query, ApplicationListSerializer, "applications", ordering_field="applied_at")
+
+
+#applicants of one job, best profile match first; scores are kept current on write
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def ranked_applications(request, job_id):
+    job = get_object_or_404(Jobs, id=job_id, employer__user=request.user)
+    query = Application.objects.filter(job=job).select_related(*APPLICATION_LIST_RELATED)
+    return paginated_response(request, query, RankedApplicationSerializer, "applications", ordering_field="match_score")
 
 
 @api_view(["GET"])
@@ -200,7 +224,9 @@ def application_detail(request, app_id):
 def application_delete(request,app_id):
     if request.method == "DELETE":
         app = get_object_or_404(Application, id=app_id, job__employer__user=request.user)
-        app.delete()
+        with transaction.atomic():
+            app.delete()
+            Jobs.objects.adjust_application_count(app.job_id, -1)
         return Response({"Message":f"{app} Delete Successfully"})
     else:
         return Response({"Message":"Something Wrong Please try again"})
@@ -209,54 +235,49 @@ def application_delete(request,app_id):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def pending_applications(request):
-    apps = Application.objects.submitted_applications(request.user)
-    s_apps=ApplicationListSerializer(apps,many=True).data
-    return Response({
-        "pending_apps":s_apps,
-        "count": len(s_apps)
-        })
+    apps = Application.objects.submitted_applications(request.user).select_related(*APPLICATION_LIST_RELATED)
+    return paginated_response(
+        request, apps, ApplicationListSerializer, "pending_apps",
+        ordering_field="applied_at", count=apps.count()
+        )
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def reviewed_applications(request):
-    apps = Application.objects.reviewed_applications(request.user)
-    s_apps=ApplicationListSerializer(apps,many=True).data
-    return Response({
-        "reviewed_apps":s_apps,
-        "count": len(s_apps)
-        })
+    apps = Application.objects.reviewed_applications(request.user).select_related(*APPLICATION_LIST_RELATED)
+    return paginated_response(
+        request, apps, ApplicationListSerializer, "reviewed_apps",
+        ordering_field="applied_at", count=apps.count()
+        )
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def rejected_applications(request):
-    apps = Application.objects.rejected_applications(request.user)
-    s_apps=ApplicationListSerializer(apps,many=True).data
-    return Response({
-        "rejected_apps":s_apps,
-        "count": len(s_apps)
-        })
+    apps = Application.objects.rejected_applications(request.user).select_related(*APPLICATION_LIST_RELATED)
+    return paginated_response(
+        request, apps, ApplicationListSerializer, "rejected_apps",
+        ordering_field="applied_at", count=apps.count()
+        )
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def shortlist_applications(request):
-    apps = Application.objects.shortlist_applications(request.user)
-    s_apps=ApplicationListSerializer(apps,many=True).data
-    return Response({
-        "shorlist_apps":s_apps,
-        "count": len(s_apps)
-        })
+    apps = Application.objects.shortlist_applications(request.user).select_related(*APPLICATION_LIST_RELATED)
+    return paginated_response(
+        request, apps, ApplicationListSerializer, "shorlist_apps",
+        ordering_field="applied_at", count=apps.count()
+        )
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def hired_applications(request):
-    apps = Application.objects.hired_applications(request.user)
-    s_apps=ApplicationListSerializer(apps,many=True).data
-    return Response({
-        "hired_apps":s_apps,
-        "count": len(s_apps)
-        })
+    apps = Application.objects.hired_applications(request.user).select_related(*APPLICATION_LIST_RELATED)
+    return paginated_response(
+        request, apps, ApplicationListSerializer, "hired_apps",
+        ordering_field="applied_at", count=apps.count()
+        )
 
 
 
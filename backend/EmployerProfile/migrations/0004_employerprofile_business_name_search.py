@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:16
+
+from django.db import migrations, models
+
+from JobSeeker.normalize import compact_text
+
+
+def backfill_business_name_search(apps, schema_editor):
+    EmployerProfile = apps.get_model("EmployerProfile", "EmployerProfile")
+    rows = list(EmployerProfile.objects.only("pk", "business_name"))
+    for row in rows:
+        row.business_name_search = compact_text(row.business_name)
+    EmployerProfile.objects.bulk_update(rows, ["business_name_search"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("EmployerProfile", "0003_employeremailverification"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="employerprofile",
+            name="business_name_search",
+            field=models.CharField(
+                blank=True, db_index=True, default="", editable=False, max_length=300
+            ),
+        ),
+        migrations.RunPython(backfill_business_name_search, migrations.RunPython.noop),
+    ]
@@ -4,6 +4,7 @@ import uuid
 from django.utils import timezone
 from datetime import timedelta
 from django.conf import settings
+from JobSeeker.normalize import compact_text
 
 class EmployerProfile(models.Model):
 
@@ -23,6 +24,8 @@ class EmployerProfile(models.Model):
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
     business_name = models.CharField(max_length=255)
+    #normalized copy of business_name (Zawgyi -> Unicode, case folded, no spaces)
+    business_name_search = models.CharField(max_length=300, blank=True, default="", editable=False, db_index=True)
     city = models.CharField(max_length=100)
     phone = models.CharField(max_length=50, blank=True,null=True)
     #  size = models.CharField(max_length=20, choices=COMPANY_SIZE_CHOICES)
@@ -36,7 +39,13 @@ class EmployerProfile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True,null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True,null=True, blank=True)
 
-    
+    def save(self, *args, **kwargs):
+        self.business_name_search = compact_text(self.business_name)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "business_name" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "business_name_search"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.business_name
     
@@ -41,9 +41,10 @@ class CompanySerializer(serializers.ModelSerializer):
         fields=['id','first_name','last_name','business_name','city','phone','size','website','industry','logo','founded_year','contact_email','job_count', 'description',]
 
 class JobcompanySerializer(serializers.ModelSerializer):
-    
+    #public endpoint: listed explicitly so counters and *_search columns never leak
     class Meta:
         model=Jobs
-        fields='__all__'
+        fields=['id','employer','title','description','location','job_type','salary','category','is_active',
+                'max_applicants','deadline','created_at','updated_at','priority']
 
     
\ No newline at end of file
@@ -1,3 +1,45 @@
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from Accounts.models import CustomUser
+from Jobs.models import Jobs
+from .models import EmployerProfile
+
+
+def make_employer(email, business_name):
+    user = CustomUser.objects.create_user(email=email, password="pw", role="employer")
+    return EmployerProfile.objects.create(
+        user=user, first_name="A", last_name="B", business_name=business_name, city="Sittwe"
+    )
+
+
+class CompanySearchTests(TestCase):
+    def setUp(self):
+        make_employer("a@example.com", "Arakkha Tech")
+        make_employer("b@example.com", "Tech Hub Sittwe")
+        self.client = APIClient()
+
+    def names(self, q):
+        response = self.client.get(reverse("company-search"), {"q": q})
+        self.assertEqual(response.status_code, 200)
+        return sorted(company["business_name"] for company in response.data["companies"])
+
+    def test_prefix_match_ignores_case_and_spaces(self):
+        self.assertEqual(self.names("tech hub"), ["Tech Hub Sittwe"])
+        self.assertEqual(self.names("ARAKKHA"), ["Arakkha Tech"])
+
+    def test_inner_match_when_no_name_starts_with_the_query(self):
+        self.assertEqual(self.names("hubsitt"), ["Tech Hub Sittwe"])
+
+
+class JobsInCompanyTests(TestCase):
+    def test_public_job_rows_hide_counters_and_search_columns(self):
+        employer = make_employer("a@example.com", "Arakkha Tech")
+        Jobs.objects.create(employer=employer, title="Backend Engineer")
+        response = APIClient().get(reverse("job-in-company", args=[employer.id]))
+        self.assertEqual(response.status_code, 200)
+        job = response.data["jobs_in_com_s"][0]
+        self.assertEqual(job["title"], "Backend Engineer")
+        for field in ("application_count", "view_count", "impression_count", "title_search"):
+            self.assertNotIn(field, job)
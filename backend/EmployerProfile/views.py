@@ -24,12 +24,15 @@ from Application.serializers import ApplicationListSerializer
 from Jobs.models import Jobs
 from Application.models import Application
 from .models import EmployerProfile
-from django.db.models import Count
+from django.db.models import Count, Max
 from .models import EmployerEmailVerification
 from django.views.decorators.http import require_POST
 User = get_user_model()
 from Accounts.services.device_service import record_login_device
 from Accounts.emails.device_alert import send_new_device_email
+from JobSeeker.normalize import compact_text
+from JobSeeker.conditional import conditional
+from Jobs.services import trigram
 
 
 
@@ -364,7 +367,15 @@ def update_employer_profile(request, pk):
 #end update employer profile
 
 #start company list
+def company_list_state(request):
+    #job_count comes from the jobs table, so its size is part of the validator
+    companies = EmployerProfile.objects.aggregate(n=Count("id"), last=Max("updated_at"))
+    jobs = Jobs.objects.aggregate(n=Count("id"), last=Max("created_at"))
+    return ["companies", *companies.values(), *jobs.values()]
+
+
 @api_view(['GET'])
+@conditional(company_list_state)
 def company_list(request):
     companies_q = EmployerProfile.objects.annotate(job_count=Count("jobs"))
     companies_s=CompanySerializer(companies_q,many=True).data
@@ -374,7 +385,16 @@ def company_list(request):
 #end
 
 #start jobs in company
+def jobs_in_company_state(request, com_id):
+    company = EmployerProfile.objects.filter(id=com_id).values_list("updated_at").first()
+    if company is None:
+        return None
+    jobs = Jobs.objects.filter(employer__id=com_id).aggregate(n=Count("id"), last=Max("updated_at"))
+    return ["company", com_id, company[0], *jobs.values()]
+
+
 @api_view(['GET'])
+@conditional(jobs_in_company_state)
 def jobs_in_company(request,com_id):
     company=EmployerProfile.objects.filter(id=com_id)
     if not company:
@@ -389,10 +409,22 @@ def jobs_in_company(request,com_id):
 @api_view(['GET'])
 def company_search(request):
     query=request.GET.get('q','')
-    companies=EmployerProfile.objects.filter(business_name__icontains=query)
+    fuzzy=request.GET.get('fuzzy','').lower() in ("1","true","yes")
+    #indexed prefix range on the precomputed normalized column
+    key=compact_text(query)
+    companies=EmployerProfile.objects.filter(business_name_search__startswith=key)
+    #a name that only contains the query (not starts with it) needs a LIKE '%q%' scan, so only when the prefix misses
+    if key and not companies.exists():
+        companies=EmployerProfile.objects.filter(business_name_search__contains=key)
+    #typo tolerant fallback from the trigram table, best match first
+    if query.strip() and (fuzzy or not companies.exists()):
+        scores=dict(trigram.similar("company",query))
+        companies=sorted(EmployerProfile.objects.filter(id__in=scores),key=lambda c:-scores[c.id])
+        fuzzy=True
     companies_s=CompanySerializer(companies,many=True).data
     return Response({
-        "companies":companies_s
+        "companies":companies_s,
+        "fuzzy":fuzzy
     })
 #end
 
@@ -0,0 +1,52 @@
+import hashlib
+from functools import wraps
+
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import quote_etag
+
+
+def make_etag(request, parts):
+    #the query string is part of the representation (page, cursor, filters)
+    raw = "|".join(str(part) for part in (*parts, request.META.get("QUERY_STRING", "")))
+    return quote_etag(hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest())
+
+
+def conditional(state, private=False):
+    """
+    ETag handling for a function view, placed under @api_view.
+
+    ``state(request, *args, **kwargs)`` returns the validator parts from
+    cheap aggregates such as Max("updated_at") and Count("id"), or None to
+    skip validation (e.g. for a 404). The view only runs, and serializes,
+    when the client's If-None-Match no longer matches; otherwise the answer
+    is an empty 304. ``private`` marks responses that depend on the user, so
+    shared caches keep them apart.
+
+    No Last-Modified is sent: counts, deletions and the passing of deadlines
+    change the representation without moving any updated_at, so a client
+    revalidating with If-Modified-Since alone would get a stale 304.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return view(request, *args, **kwargs)
+            parts = state(request, *args, **kwargs)
+            if parts is None:
+                return view(request, *args, **kwargs)
+            etag = make_etag(request, parts)
+            response = get_conditional_response(request, etag=etag)
+            if response is None:
+                response = view(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+            response.headers["ETag"] = etag
+            #clients may keep the body but must revalidate before reusing it
+            if private:
+                patch_cache_control(response, no_cache=True, private=True)
+                patch_vary_headers(response, ("Authorization", "Cookie"))
+            else:
+                patch_cache_control(response, no_cache=True)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,107 @@
+import re
+import unicodedata
+
+# Zawgyi -> Unicode conversion for Myanmar text.
+# Rule table follows the Rabbit converter (MIT): first map Zawgyi-only code
+# points to their Unicode sequences, then move the pre-base vowel (\u1031) and
+# medial ra (\u103c), which Zawgyi stores before the consonant, to after it.
+_ZAWGYI_RULES = [
+    ("\u200b", ""),
+    ("(\u103d|\u1087)", "\u103e"),
+    ("\u103c", "\u103d"),
+    ("(\u103b|\u107e|\u107f|\u1080|\u1081|\u1082|\u1083|\u1084)", "\u103c"),
+    ("(\u103a|\u107d)", "\u103b"),
+    ("\u1039", "\u103a"),
+    ("(\u1066|\u1067)", "\u1039\u1006"),
+    ("\u106a", "\u1009"),
+    ("\u106b", "\u100a"),
+    ("\u106c", "\u1039\u100b"),
+    ("\u106d", "\u1039\u100c"),
+    ("\u106e", "\u100d\u1039\u100d"),
+    ("\u106f", "\u100d\u1039\u100e"),
+    ("\u1070", "\u1039\u100f"),
+    ("(\u1071|\u1072)", "\u1039\u1010"),
+    ("\u1060", "\u1039\u1000"),
+    ("\u1061", "\u1039\u1001"),
+    ("\u1062", "\u1039\u1002"),
+    ("\u1063", "\u1039\u1003"),
+    ("\u1065", "\u1039\u1005"),
+    ("\u1068", "\u1039\u1007"),
+    ("\u1069", "\u1039\u1008"),
+    ("(\u1073|\u1074)", "\u1039\u1011"),
+    ("\u1075", "\u1039\u1012"),
+    ("\u1076", "\u1039\u1013"),
+    ("\u1077", "\u1039\u1014"),
+    ("\u1078", "\u1039\u1015"),
+    ("\u1079", "\u1039\u1016"),
+    ("\u107a", "\u1039\u1017"),
+    ("\u107c", "\u1039\u1019"),
+    ("\u1085", "\u1039\u101c"),
+    ("\u1033", "\u102f"),
+    ("\u1034", "\u1030"),
+    ("\u103f", "\u1030"),
+    ("\u1086", "\u103f"),
+    ("\u1036\u1088", "\u1088\u1036"),
+    ("\u1088", "\u103e\u102f"),
+    ("\u1089", "\u103e\u1030"),
+    ("\u108a", "\u103d\u103e"),
+    # kinzi is written after the consonant in Zawgyi, before it in Unicode
+    ("([\u1000-\u1021])\u1064", "\u1004\u103a\u1039\\1"),
+    ("([\u1000-\u1021])\u108b", "\u1004\u103a\u1039\\1\u102d"),
+    ("([\u1000-\u1021])\u108c", "\u1004\u103a\u1039\\1\u102e"),
+    ("([\u1000-\u1021])\u108d", "\u1004\u103a\u1039\\1\u1036"),
+    ("\u108e", "\u102d\u1036"),
+    ("\u108f", "\u1014"),
+    ("\u1090", "\u101b"),
+    ("\u1091", "\u100f\u1039\u100d"),
+    ("\u1092", "\u100b\u1039\u100c"),
+    ("\u1019\u102c(\u107b|\u1093)", "\u1019\u1039\u1018\u102c"),
+    ("(\u107b|\u1093)", "\u1039\u1018"),
+    ("(\u1094|\u1095)", "\u1037"),
+    ("\u1096", "\u1039\u1010\u103d"),
+    ("\u1097", "\u100b\u1039\u100b"),
+    # reorder: \u1031 / \u103c typed before the consonant (and its stacked letter)
+    ("\u1031\u103c([\u1000-\u1021])(\u1039[\u1000-\u1021])?", "\\1\\2\u103c\u1031"),
+    ("\u103c([\u1000-\u1021])(\u1039[\u1000-\u1021])?", "\\1\\2\u103c"),
+    ("\u1031([\u1000-\u1021])(\u1039[\u1000-\u1021])?(\u103b)?(\u103c)?(\u103d)?(\u103e)?",
+     "\\1\\2\\3\\4\\5\\6\u1031"),
+    # canonical Unicode order of marks
+    ("\u103e\u103d", "\u103d\u103e"),
+    ("\u103a\u1037", "\u1037\u103a"),
+    ("\u1036\u102f", "\u102f\u1036"),
+    ("\u102f\u102d", "\u102d\u102f"),
+    ("\u1037\u102f", "\u102f\u1037"),
+    ("\u1037\u1036", "\u1036\u1037"),
+]
+_ZAWGYI_RULES = [(re.compile(pattern), replacement) for pattern, replacement in _ZAWGYI_RULES]
+
+# Zawgyi-only glyph code points, a syllable-initial \u1031, or a medial ra typed
+# before its consonant never occur in well-formed Unicode Myanmar text
+_ZAWGYI_HINT = re.compile(
+    "[\u1060-\u1097]"
+    "|(?:^|[^\u1000-\u1021\u1025\u1027\u1029\u103b-\u103e])\u1031"
+    "|(?:^|\\s)[\u103b\u107e-\u1084][\u1000-\u1021]"
+)
+
+
+def looks_like_zawgyi(text):
+    return bool(text) and _ZAWGYI_HINT.search(text) is not None
+
+
+def zawgyi_to_unicode(text):
+    for pattern, replacement in _ZAWGYI_RULES:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def normalize_text(text):
+    """Unicode-encoded, NFKC, case-folded form of ``text`` used for search."""
+    text = unicodedata.normalize("NFKC", text or "")
+    if looks_like_zawgyi(text):
+        text = zawgyi_to_unicode(text)
+    return text.casefold()
+
+
+def compact_text(text):
+    """normalize_text() with all whitespace removed, stored in *_search columns."""
+    return "".join(normalize_text(text).split())
@@ -0,0 +1,40 @@
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+#UUID, datetime, date and time are encoded natively; "Z" for UTC matches DRF's encoder
+OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+#only types orjson doesn't know (Decimal in values() rows, lazy strings, querysets) reach this
+_fallback = JSONEncoder().default
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer on orjson. Output is the same JSON; orjson writes UTF-8 bytes
+    straight from the serialized dicts instead of going through json.JSONEncoder.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        #indented output (browsable API, "; indent=N") is for people; orjson can only indent by 2
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+        ret = orjson.dumps(data, default=_fallback, option=OPTIONS)
+        #same as JSONRenderer: U+2028 / U+2029 are valid JSON but break inline <script>
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
+
+class FastJSONParser(JSONParser):
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -157,6 +157,42 @@ else:  # production (Render + Aiven)
     }
 
 
+# Cache shared by every gunicorn worker and by management commands
+# (expire_jobs, rescore_applications): search / detail cache version tokens
+# and rate limits live here. Production needs Redis (REDIS_URL, enforced by
+# `manage.py check --deploy`, Jobs.E002); the database tables below are a
+# development fallback (manage.py createcachetable).
+# Version tokens have their own alias so culling cached payloads never
+# evicts them; with Redis use a volatile-* maxmemory policy, they have no TTL.
+if config("REDIS_URL", default=""):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": config("REDIS_URL"),
+        },
+        "versions": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": config("REDIS_URL"),
+            "KEY_PREFIX": "versions",
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "django_cache",
+            "OPTIONS": {"MAX_ENTRIES": 10000},
+        },
+        "versions": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "django_cache_versions",
+            #one token per job plus the catalogue token; never culled in practice
+            "OPTIONS": {"MAX_ENTRIES": 10_000_000},
+        },
+    }
+JOBS_VERSION_CACHE = "versions"
+
+
 # Optional but recommended:
 TIME_ZONE = "Asia/Yangon"
 USE_TZ = True
@@ -223,6 +259,16 @@ REST_FRAMEWORK = {
     "DEFAULT_THROTTLE_RATES": {
         "otp": "5/minute",
     },
+    #orjson-backed JSON, same output as DRF's JSONRenderer
+    "DEFAULT_RENDERER_CLASSES": [
+        "JobSeeker.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "JobSeeker.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
 
 TOKEN_MODEL = None
@@ -270,4 +316,7 @@ FRONTEND_ERROR_URL = config(
     default="http://127.0.0.1:8000/sign-in"
 )
 
+#public site, used for job links in emails, sitemap and feeds
+SITE_URL = config("SITE_URL", default="https://job.arakkha.tech")
+
 
@@ -14,6 +14,7 @@ from Notification.admin_views import (
     admin_notification_detail
 )
 from UI import views
+from Jobs.views import sitemap_index, sitemap_jobs
 
 urlpatterns = [
     #app urls
@@ -34,6 +35,8 @@ urlpatterns = [
     path('application/',include('Application.urls')),
     path('accounts/',include('Accounts.urls')),
     path('legal/',include('legal.urls')),
+    path('sitemap.xml',sitemap_index,name="sitemap"),
+    path('sitemap-jobs-<int:section>.xml',sitemap_jobs,name="sitemap-jobs"),
     
     
 ]
@@ -8,5 +8,6 @@ admin.site.register(Skill)
 admin.site.register(Education)
 admin.site.register(Language)
 admin.site.register(Experience)
+admin.site.register(SavedSearch)
 
 
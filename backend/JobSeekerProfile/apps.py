@@ -3,3 +3,6 @@ from django.apps import AppConfig
 class JobseekerprofileConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'JobSeekerProfile'
+
+    def ready(self):
+        from . import signals
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from JobSeekerProfile.recommendations import rebuild_vectors
+
+
+class Command(BaseCommand):
+    help = "Recompute the job and profile vectors used by recommended jobs"
+
+    def handle(self, *args, **options):
+        count = rebuild_vectors()
+        self.stdout.write(f"Rebuilt {count} job and profile vectors.")
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_category_interest(apps, schema_editor):
+    Application = apps.get_model("Application", "Application")
+    SeekerCategoryInterest = apps.get_model("JobSeekerProfile", "SeekerCategoryInterest")
+    pairs = (
+        Application.objects.filter(job_seeker_profile__isnull=False, job__category__isnull=False)
+        .values_list("job__category_id", "job_seeker_profile_id")
+        .distinct()
+    )
+    SeekerCategoryInterest.objects.bulk_create(
+        [SeekerCategoryInterest(category_id=c, profile_id=p) for c, p in pairs],
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Application", "0002_savejob_created_at_and_more"),
+        ("JobSeekerProfile", "0001_initial"),
+        ("Jobs", "0005_jobs_application_count"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SeekerCategoryInterest",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, null=True)),
+                (
+                    "category",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="interested_seekers",
+                        to="Jobs.jobcategory",
+                    ),
+                ),
+                (
+                    "profile",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="category_interests",
+                        to="JobSeekerProfile.jobseekerprofile",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("category", "profile"),
+                        name="unique_category_interest_per_profile",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_category_interest, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,156 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:28
+
+import math
+import re
+import struct
+import unicodedata
+import zlib
+from collections import Counter
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils.html import strip_tags
+
+# Frozen copy of the JobSeekerProfile.recommendations encoding as of this
+# migration, so later changes to that module can't break it. Zawgyi text is
+# not converted here; `manage.py rebuild_recommendation_vectors` recomputes
+# every vector with the current code.
+DIMENSIONS = 1 << 20
+_SPLIT_RE = re.compile(r"[\s!-/:-@\[-`{-~]+")
+
+
+def _words(text):
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    return [w for w in _SPLIT_RE.split(text) if len(w) > 1]
+
+
+def _add_words(tokens, text, weight):
+    for word in _words(text):
+        tokens[f"w:{word}"] += weight
+
+
+def _add_text(tokens, text, weight):
+    for word, n in Counter(_words(strip_tags(text or ""))).items():
+        tokens[f"w:{word}"] += weight * (1 + math.log(n))
+
+
+def _encode(tokens):
+    #(indices, weights) as stored: little-endian int32 slots, float32 weights, L2-normalized
+    slots = Counter()
+    for token, weight in tokens.items():
+        slots[zlib.crc32(token.encode()) & (DIMENSIONS - 1)] += weight
+    order = sorted(slots)
+    norm = math.sqrt(sum(slots[i] ** 2 for i in order)) or 1.0
+    return (
+        struct.pack(f"<{len(order)}i", *order),
+        struct.pack(f"<{len(order)}f", *(slots[i] / norm for i in order)),
+    )
+
+
+def _job_tokens(title, description, category_id, category_name):
+    tokens = Counter()
+    _add_words(tokens, title, 3.0)
+    if category_id:
+        tokens[f"c:{category_id}"] += 4.0
+        _add_words(tokens, category_name, 1.0)
+    _add_text(tokens, description, 0.5)
+    return tokens
+
+
+def _profile_tokens(skills, experiences, category_interests):
+    tokens = Counter()
+    for name, level in skills:
+        _add_words(tokens, name, 1.5 + 0.5 * (level or 1))
+    for job_title, position, description in experiences:
+        _add_words(tokens, job_title, 2.0)
+        _add_words(tokens, position, 2.0)
+        _add_text(tokens, description, 0.3)
+    for category_id, category_name in category_interests:
+        tokens[f"c:{category_id}"] += 4.0
+        _add_words(tokens, category_name, 1.0)
+    return tokens
+
+
+def backfill_vectors(apps, schema_editor):
+    Jobs = apps.get_model("Jobs", "Jobs")
+    JobseekerProfile = apps.get_model("JobSeekerProfile", "JobseekerProfile")
+    JobVector = apps.get_model("JobSeekerProfile", "JobVector")
+    ProfileVector = apps.get_model("JobSeekerProfile", "ProfileVector")
+    vectors = []
+    for job in Jobs.objects.select_related("category").iterator():
+        indices, weights = _encode(_job_tokens(
+            job.title, job.description, job.category_id, job.category.name if job.category_id else ""
+        ))
+        vectors.append(JobVector(job_id=job.pk, indices=indices, weights=weights))
+    JobVector.objects.bulk_create(vectors, batch_size=500)
+    vectors = []
+    for profile in JobseekerProfile.objects.iterator():
+        indices, weights = _encode(_profile_tokens(
+            profile.skills.values_list("name", "proficiency_level"),
+            profile.experience_set.values_list("job_title", "position", "description"),
+            profile.category_interests.values_list("category_id", "category__name"),
+        ))
+        vectors.append(ProfileVector(profile_id=profile.pk, indices=indices, weights=weights))
+    ProfileVector.objects.bulk_create(vectors, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("JobSeekerProfile", "0002_seekercategoryinterest"),
+        ("Jobs", "0010_search_term_stats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobVector",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("indices", models.BinaryField()),
+                ("weights", models.BinaryField()),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "job",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="recommendation_vector",
+                        to="Jobs.jobs",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ProfileVector",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("indices", models.BinaryField()),
+                ("weights", models.BinaryField()),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "profile",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="recommendation_vector",
+                        to="JobSeekerProfile.jobseekerprofile",
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(backfill_vectors, migrations.RunPython.noop),
+    ]
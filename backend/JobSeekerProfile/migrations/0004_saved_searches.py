@@ -0,0 +1,108 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:33
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("JobSeekerProfile", "0003_recommendation_vectors"),
+        ("Jobs", "0010_search_term_stats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SavedSearch",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("name", models.CharField(blank=True, max_length=100)),
+                ("q", models.CharField(blank=True, max_length=200)),
+                ("loc", models.CharField(blank=True, max_length=100)),
+                (
+                    "job_type",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("FULL", "Full-time"),
+                            ("PART", "Part-time"),
+                            ("INTERN", "Internship"),
+                            ("REMOTE", "Remote"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("is_active", models.BooleanField(default=True)),
+                (
+                    "predicate_count",
+                    models.PositiveSmallIntegerField(default=0, editable=False),
+                ),
+                (
+                    "last_alerted_at",
+                    models.DateTimeField(blank=True, editable=False, null=True),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True, null=True)),
+                (
+                    "category",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="saved_searches",
+                        to="Jobs.jobcategory",
+                    ),
+                ),
+                (
+                    "profile",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="saved_searches",
+                        to="JobSeekerProfile.jobseekerprofile",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="SavedSearchPredicate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("group", models.PositiveSmallIntegerField()),
+                ("kind", models.CharField(max_length=10)),
+                ("value", models.CharField(max_length=64)),
+                (
+                    "saved_search",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="predicates",
+                        to="JobSeekerProfile.savedsearch",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["kind", "value", "saved_search"],
+                        name="saved_search_predicate_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations
+
+from Jobs.services.saved_search import search_predicates
+
+
+def reindex_predicates(apps, schema_editor):
+    #multi-word searches gain the joined-words alternative in every word group
+    SavedSearch = apps.get_model("JobSeekerProfile", "SavedSearch")
+    SavedSearchPredicate = apps.get_model("JobSeekerProfile", "SavedSearchPredicate")
+    for saved in SavedSearch.objects.exclude(q="").iterator():
+        rows, groups = search_predicates(saved)
+        SavedSearchPredicate.objects.filter(saved_search=saved).delete()
+        SavedSearchPredicate.objects.bulk_create(
+            SavedSearchPredicate(saved_search=saved, group=group, kind=kind, value=value)
+            for group, kind, value in rows
+        )
+        SavedSearch.objects.filter(pk=saved.pk).update(predicate_count=groups)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("JobSeekerProfile", "0004_saved_searches"),
+    ]
+
+    operations = [
+        migrations.RunPython(reindex_predicates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+from django.db import migrations
+
+#Jobs.services.saved_search.GRAM_LENGTH when this migration was written
+GRAM_LENGTH = 3
+
+
+def add_gram_predicates(apps, schema_editor):
+    #non-ASCII words are found through an n-gram row instead of a vocabulary scan
+    SavedSearchPredicate = apps.get_model("JobSeekerProfile", "SavedSearchPredicate")
+    rows = set()
+    for search_id, group, word in SavedSearchPredicate.objects.filter(kind="word").values_list(
+        "saved_search_id", "group", "value"
+    ).iterator():
+        for i, char in enumerate(word):
+            if not char.isascii():
+                rows.add((search_id, group, word[i:i + GRAM_LENGTH]))
+                break
+    SavedSearchPredicate.objects.bulk_create(
+        (
+            SavedSearchPredicate(saved_search_id=search_id, group=group, kind="gram", value=gram)
+            for search_id, group, gram in rows
+        ),
+        batch_size=1000,
+    )
+
+
+def remove_gram_predicates(apps, schema_editor):
+    SavedSearchPredicate = apps.get_model("JobSeekerProfile", "SavedSearchPredicate")
+    SavedSearchPredicate.objects.filter(kind="gram").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("JobSeekerProfile", "0005_saved_search_phrase_predicates"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_gram_predicates, remove_gram_predicates),
+    ]
@@ -1,6 +1,6 @@
 from django.db import models
 from Accounts.models import CustomUser
-from Jobs.models import Jobs
+from Jobs.models import Jobs, JobCategory
 import uuid
 
 class JobseekerProfile(models.Model):
@@ -31,6 +31,23 @@ class JobseekerProfile(models.Model):
     def __str__(self):
         return self.full_name
 
+#reverse index category -> seekers, filled when a seeker applies (Application.utils)
+class SeekerCategoryInterest(models.Model):
+    category = models.ForeignKey(JobCategory, on_delete=models.CASCADE, related_name="interested_seekers")
+    profile = models.ForeignKey(JobseekerProfile, on_delete=models.CASCADE, related_name="category_interests")
+    created_at = models.DateTimeField(auto_now_add=True,null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["category", "profile"],
+                name="unique_category_interest_per_profile"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.profile} -> {self.category}"
+
 # resumes/models.py
 class Resume(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -124,3 +141,62 @@ class Skill(models.Model):
     def __str__(self):
         return self.name
 
+
+
+#hashed term vectors for "recommended for you" (JobSeekerProfile.recommendations),
+#stored as little-endian int32 slot / float32 weight arrays, L2-normalized
+class JobVector(models.Model):
+    job = models.OneToOneField(Jobs, on_delete=models.CASCADE, related_name="recommendation_vector")
+    indices = models.BinaryField()
+    weights = models.BinaryField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"vector of {self.job_id}"
+
+
+class ProfileVector(models.Model):
+    profile = models.OneToOneField(JobseekerProfile, on_delete=models.CASCADE, related_name="recommendation_vector")
+    indices = models.BinaryField()
+    weights = models.BinaryField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"vector of {self.profile_id}"
+
+
+#a seeker's stored job search; new jobs are matched through SavedSearchPredicate
+class SavedSearch(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    profile = models.ForeignKey(JobseekerProfile, on_delete=models.CASCADE, related_name="saved_searches")
+    name = models.CharField(max_length=100, blank=True)
+    q = models.CharField(max_length=200, blank=True)
+    loc = models.CharField(max_length=100, blank=True)
+    category = models.ForeignKey(JobCategory, on_delete=models.CASCADE, null=True, blank=True, related_name="saved_searches")
+    job_type = models.CharField(max_length=10, choices=Jobs.JOB_TYPE_CHOICES, blank=True)
+    is_active = models.BooleanField(default=True)
+    #predicate groups a job has to satisfy, one per q word plus loc / category / job_type
+    predicate_count = models.PositiveSmallIntegerField(default=0, editable=False)
+    last_alerted_at = models.DateTimeField(null=True, blank=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
+
+    def __str__(self):
+        return self.name or f"{self.profile} search"
+
+
+#inverted predicate index: (kind, value) -> saved searches. Rows of one group are
+#alternatives (e.g. the townships a loc resolves to); a search matches when all its groups hit.
+class SavedSearchPredicate(models.Model):
+    saved_search = models.ForeignKey(SavedSearch, on_delete=models.CASCADE, related_name="predicates")
+    group = models.PositiveSmallIntegerField()
+    kind = models.CharField(max_length=10)
+    value = models.CharField(max_length=64)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["kind", "value", "saved_search"], name="saved_search_predicate_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}={self.value}"
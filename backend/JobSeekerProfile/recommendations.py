@@ -0,0 +1,291 @@
+import logging
+import math
+import threading
+import time
+import zlib
+from collections import Counter
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+from Application.models import Application
+from Jobs.models import Jobs
+from Jobs.services.result_cache import catalogue_version
+from Jobs.services.search_index import split_words
+from .models import Experience, JobseekerProfile, JobVector, ProfileVector, SeekerCategoryInterest, Skill
+
+logger = logging.getLogger(__name__)
+
+#hashed feature space; collisions at this size are rare for our vocabulary
+DIMENSIONS = 1 << 20
+CACHE_TIMEOUT = getattr(settings, "RECOMMENDATION_CACHE_TIMEOUT", 60 * 60)
+#scored candidates kept per profile; applied jobs are dropped from these
+CANDIDATES = 100
+#a changed catalogue is picked up at most this often, by a background rebuild
+MATRIX_REBUILD_SECONDS = getattr(settings, "RECOMMENDATION_MATRIX_REBUILD_SECONDS", 60)
+
+
+def _slot(token):
+    return zlib.crc32(token.encode()) & (DIMENSIONS - 1)
+
+
+def _add_words(tokens, text, weight):
+    for word in split_words(text):
+        if len(word) > 1:
+            tokens[f"w:{word}"] += weight
+
+
+def _add_text(tokens, text, weight):
+    #sublinear term frequency so long descriptions don't drown the title
+    for word, n in Counter(split_words(strip_tags(text or ""))).items():
+        if len(word) > 1:
+            tokens[f"w:{word}"] += weight * (1 + math.log(n))
+
+
+def encode(tokens):
+    """(int32 slots, float32 weights) for a {token: weight} Counter, L2-normalized."""
+    slots = Counter()
+    for token, weight in tokens.items():
+        slots[_slot(token)] += weight
+    order = sorted(slots)
+    indices = np.array(order, dtype="<i4")
+    weights = np.array([slots[i] for i in order], dtype="<f4")
+    norm = float(np.linalg.norm(weights))
+    if norm:
+        weights /= norm
+    return indices, weights
+
+
+def job_tokens(title, description, category_id, category_name):
+    tokens = Counter()
+    _add_words(tokens, title, 3.0)
+    if category_id:
+        tokens[f"c:{category_id}"] += 4.0
+        _add_words(tokens, category_name, 1.0)
+    _add_text(tokens, description, 0.5)
+    return tokens
+
+
+def profile_tokens(skills, experiences, category_interests):
+    # skills: [(name, level)], experiences: [(job_title, position, description)],
+    # category_interests: [(category_id, category_name)]
+    tokens = Counter()
+    for name, level in skills:
+        _add_words(tokens, name, 1.5 + 0.5 * (level or 1))
+    for job_title, position, description in experiences:
+        _add_words(tokens, job_title, 2.0)
+        _add_words(tokens, position, 2.0)
+        _add_text(tokens, description, 0.3)
+    for category_id, category_name in category_interests:
+        tokens[f"c:{category_id}"] += 4.0
+        _add_words(tokens, category_name, 1.0)
+    return tokens
+
+
+def applicant_tokens(skills, experiences, languages):
+    # skills: [(name, level)], experiences: [(job_title, position)], languages: [name]
+    tokens = Counter()
+    for name, level in skills:
+        _add_words(tokens, name, 1.5 + 0.5 * (level or 1))
+    for job_title, position in experiences:
+        _add_words(tokens, job_title, 2.0)
+        _add_words(tokens, position, 2.0)
+    for name in languages:
+        _add_words(tokens, name, 1.0)
+    return tokens
+
+
+def sparse_scores(query_indices, query_weights, rows, indices, weights, n):
+    """
+    Dot product of one encoded vector against ``n`` others given as flat
+    (row, slot, weight) arrays; returns a float array of length ``n``.
+    """
+    if not n or not len(query_indices):
+        return np.zeros(n)
+    #query slots are sorted: look each row slot up by binary search
+    pos = np.searchsorted(query_indices, indices)
+    pos[pos == len(query_indices)] = 0
+    contribution = np.where(query_indices[pos] == indices, weights * query_weights[pos], 0.0)
+    return np.bincount(rows, weights=contribution, minlength=n)
+
+
+def stack(vectors):
+    """Flat (rows, indices, weights) arrays for a list of encoded vectors, for sparse_scores()."""
+    if not vectors:
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype="<i4"), np.zeros(0, dtype="<f4")
+    rows = np.concatenate([np.full(len(indices), i, dtype=np.int32) for i, (indices, _) in enumerate(vectors)])
+    return rows, np.concatenate([v[0] for v in vectors]), np.concatenate([v[1] for v in vectors])
+
+
+def _store(model, owner_field, owner_id, indices, weights):
+    model.objects.update_or_create(
+        **{owner_field: owner_id},
+        defaults={"indices": indices.tobytes(), "weights": weights.tobytes()},
+    )
+
+
+def update_job_vector(job):
+    tokens = job_tokens(job.title, job.description, job.category_id, job.category.name if job.category_id else "")
+    _store(JobVector, "job_id", job.pk, *encode(tokens))
+
+
+def create_job_vectors(jobs):
+    # bulk counterpart of update_job_vector() for freshly inserted jobs
+    vectors = []
+    for job in jobs:
+        indices, weights = encode(job_tokens(
+            job.title, job.description, job.category_id, job.category.name if job.category_id else ""
+        ))
+        vectors.append(JobVector(job_id=job.pk, indices=indices.tobytes(), weights=weights.tobytes()))
+    JobVector.objects.bulk_create(vectors, ignore_conflicts=True)
+
+
+def update_profile_vector(profile_id):
+    tokens = profile_tokens(
+        Skill.objects.filter(profile_id=profile_id).values_list("name", "proficiency_level"),
+        Experience.objects.filter(profile_id=profile_id).values_list("job_title", "position", "description"),
+        SeekerCategoryInterest.objects.filter(profile_id=profile_id).values_list("category_id", "category__name"),
+    )
+    _store(ProfileVector, "profile_id", profile_id, *encode(tokens))
+
+
+def rebuild_vectors():
+    count = 0
+    for job in Jobs.objects.select_related("category").iterator(chunk_size=500):
+        update_job_vector(job)
+        count += 1
+    for profile_id in JobseekerProfile.objects.values_list("id", flat=True).iterator():
+        update_profile_vector(profile_id)
+        count += 1
+    return count
+
+
+class _Matrix:
+    """One built generation of the job matrix, tagged with the catalogue version it was read at."""
+
+    def __init__(self, version, job_ids, vectors):
+        self.version = version
+        self.job_ids = job_ids
+        self.rows, self.indices, self.weights = stack(vectors)
+
+    def scores(self, profile_indices, profile_weights):
+        if not self.job_ids or not len(profile_indices):
+            return []
+        totals = sparse_scores(profile_indices, profile_weights, self.rows, self.indices, self.weights, len(self.job_ids))
+        top = np.argsort(-totals)[:CANDIDATES]
+        return [(self.job_ids[i], round(float(totals[i]), 4)) for i in top if totals[i] > 0]
+
+
+class JobMatrix:
+    """
+    All live jobs' vectors concatenated into flat arrays (row, slot, weight),
+    so scoring a profile against every job is one vectorized sparse
+    matrix-vector product.
+
+    Only the first build happens on a request. After that a catalogue change
+    starts one background rebuild, at most every MATRIX_REBUILD_SECONDS, and
+    requests keep scoring against the current matrix until the new one is
+    swapped in.
+    """
+
+    def __init__(self, rebuild_seconds=MATRIX_REBUILD_SECONDS):
+        self.rebuild_seconds = rebuild_seconds
+        self._lock = threading.Lock()
+        self._matrix = None
+        self._built_at = None
+        self._rebuilding = False
+
+    def _build(self):
+        #the version is read first, so a change made during the read still triggers the next rebuild
+        version = catalogue_version()
+        today = timezone.localdate()
+        rows = (
+            JobVector.objects.filter(job__is_active=True)
+            .filter(Q(job__deadline__isnull=True) | Q(job__deadline__gte=today))
+            .values_list("job_id", "indices", "weights")
+        )
+        job_ids, vectors = [], []
+        for job_id, job_indices, job_weights in rows.iterator():
+            vectors.append((np.frombuffer(job_indices, dtype="<i4"), np.frombuffer(job_weights, dtype="<f4")))
+            job_ids.append(job_id)
+        return _Matrix(version, job_ids, vectors)
+
+    def _swap(self, matrix):
+        with self._lock:
+            self._matrix = matrix
+            self._built_at = time.monotonic()
+
+    def _rebuild(self):
+        try:
+            self._swap(self._build())
+        except Exception:
+            logger.exception("Rebuilding the recommendation job matrix failed")
+        finally:
+            with self._lock:
+                self._rebuilding = False
+
+    def _start_rebuild(self):
+        def run():
+            try:
+                self._rebuild()
+            finally:
+                #the thread's own database connection
+                connection.close()
+
+        threading.Thread(target=run, name="job-matrix-rebuild", daemon=True).start()
+
+    def current(self):
+        """The matrix to score against now; a stale one is returned while its replacement is built."""
+        with self._lock:
+            matrix = self._matrix
+        if matrix is None:
+            with self._lock:
+                if self._matrix is None:
+                    self._matrix = self._build()
+                    self._built_at = time.monotonic()
+                return self._matrix
+        if matrix.version == catalogue_version():
+            return matrix
+        with self._lock:
+            start = not self._rebuilding and time.monotonic() - self._built_at >= self.rebuild_seconds
+            if start:
+                self._rebuilding = True
+        if start:
+            self._start_rebuild()
+        return matrix
+
+    def scores(self, profile_indices, profile_weights):
+        """Cosine similarity of the profile against every live job, as [(job_id, score)] best first."""
+        return self.current().scores(profile_indices, profile_weights)
+
+
+job_matrix = JobMatrix()
+
+
+def recommend(profile, limit=20):
+    """
+    [(job_id, score), ...] for ``profile``, cached until the profile vector or
+    the job catalogue changes. Jobs the seeker already applied to are skipped.
+    """
+    vector = ProfileVector.objects.filter(profile=profile).only("indices", "weights", "updated_at").first()
+    if vector is None:
+        update_profile_vector(profile.pk)
+        vector = ProfileVector.objects.get(profile=profile)
+    matrix = job_matrix.current()
+    #keyed on the version the matrix was built at, so a lagging matrix never caches under a newer one
+    key = f"jobs:recommend:{profile.pk}:{vector.updated_at.timestamp()}:{matrix.version}"
+    ranked = cache.get(key)
+    if ranked is None:
+        ranked = matrix.scores(
+            np.frombuffer(vector.indices, dtype="<i4"),
+            np.frombuffer(vector.weights, dtype="<f4"),
+        )
+        cache.set(key, ranked, CACHE_TIMEOUT)
+    #applying doesn't always change the vector, so this filter stays outside the cache
+    applied = set(Application.objects.filter(job_seeker_profile=profile).values_list("job_id", flat=True))
+    return [(job_id, score) for job_id, score in ranked if job_id not in applied][:limit]
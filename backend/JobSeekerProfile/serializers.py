@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from Accounts.models import *
 from .models import *
+from Jobs.models import Jobs
 
 class JobSeekerSignInSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(required=True)
@@ -62,3 +63,22 @@ class SkillSerializar(serializers.ModelSerializer):
         fields = '__all__'
 
 
+
+
+class SavedSearchSerializer(serializers.ModelSerializer):
+    profile = serializers.PrimaryKeyRelatedField(read_only=True)
+    class Meta:
+        model = SavedSearch
+        fields = '__all__'
+
+    def validate_loc(self, value):
+        if value and not Jobs.locations.resolve(value):
+            raise serializers.ValidationError("Unknown location.")
+        return value
+
+    def validate(self, attrs):
+        merged = {field: getattr(self.instance, field, None) for field in ("q", "loc", "category", "job_type")}
+        merged.update({k: v for k, v in attrs.items() if k in merged})
+        if not any(merged.values()):
+            raise serializers.ValidationError("Give at least one of q, loc, category or job_type.")
+        return attrs
@@ -0,0 +1,35 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from Jobs.models import Jobs
+from Jobs.signals import jobs_bulk_created
+from Jobs.services.saved_search import index_saved_search
+from .models import Experience, SavedSearch, SeekerCategoryInterest, Skill
+from .recommendations import create_job_vectors, update_job_vector, update_profile_vector
+
+#job fields that feed the recommendation vector
+VECTOR_FIELDS = {"title", "description", "category"}
+
+
+@receiver(post_save, sender=Jobs)
+def update_recommendation_vector(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not VECTOR_FIELDS.intersection(update_fields):
+        return
+    update_job_vector(instance)
+
+
+@receiver(jobs_bulk_created, sender=Jobs)
+def create_recommendation_vectors(sender, jobs, **kwargs):
+    create_job_vectors(jobs)
+
+
+@receiver([post_save, post_delete], sender=Skill)
+@receiver([post_save, post_delete], sender=Experience)
+@receiver(post_save, sender=SeekerCategoryInterest)
+def update_profile_recommendation_vector(sender, instance, **kwargs):
+    update_profile_vector(instance.profile_id)
+
+
+@receiver(post_save, sender=SavedSearch)
+def update_saved_search_predicates(sender, instance, **kwargs):
+    index_saved_search(instance)
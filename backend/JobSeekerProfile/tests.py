@@ -1,3 +1,42 @@
+from unittest import mock
+
 from django.test import TestCase
 
-# Create your tests here.
+from Accounts.models import CustomUser
+from EmployerProfile.models import EmployerProfile
+from Jobs.models import Jobs
+from Jobs.services.result_cache import bump_catalogue_version
+from .recommendations import JobMatrix, encode, profile_tokens
+
+
+class JobMatrixTests(TestCase):
+    def setUp(self):
+        user = CustomUser.objects.create_user(email="employer@example.com", password="pw", role="employer")
+        self.employer = EmployerProfile.objects.create(
+            user=user, first_name="A", last_name="B", business_name="Arakkha Co", city="Sittwe"
+        )
+        self.python = Jobs.objects.create(employer=self.employer, title="Python Developer")
+        self.profile = encode(profile_tokens([("Python", 3)], [], []))
+
+    def ranked(self, matrix):
+        return [job_id for job_id, _ in matrix.scores(*self.profile)]
+
+    def test_catalogue_change_is_rebuilt_off_the_request(self):
+        matrix = JobMatrix(rebuild_seconds=0)
+        self.assertEqual(self.ranked(matrix), [self.python.pk])
+        other = Jobs.objects.create(employer=self.employer, title="Senior Python Engineer")
+        with mock.patch.object(matrix, "_start_rebuild") as start:
+            #still the old matrix, and only one rebuild is started for any number of requests
+            self.assertEqual(self.ranked(matrix), [self.python.pk])
+            self.assertEqual(self.ranked(matrix), [self.python.pk])
+        start.assert_called_once()
+        matrix._rebuild()
+        self.assertEqual(set(self.ranked(matrix)), {self.python.pk, other.pk})
+
+    def test_rebuilds_are_rate_limited(self):
+        matrix = JobMatrix(rebuild_seconds=3600)
+        matrix.current()
+        bump_catalogue_version()
+        with mock.patch.object(matrix, "_start_rebuild") as start:
+            matrix.current()
+        start.assert_not_called()
@@ -14,6 +14,7 @@ urlpatterns = [
     # start jobseekerprofile
     path('jobseekerprofile/', views.jobseekerprofile, name='jobseeker-profile'),
     path('jobseekerprofile/<uuid:jp_id>/', views.jobseekerprofile_update, name='jobseekerprofile-detail'),
+    path('jobseekerprofile/recommended/', views.recommended_jobs, name='jobseeker-recommended-jobs'),
     # end JobseekerProfile
     
     # start skills
@@ -35,6 +36,11 @@ urlpatterns = [
     path('language/', views.language_list, name='language-list'),
     path('language/<uuid:l_id>/', views.language_detail, name='language-detail'),
     # end Language
+
+    # start SavedSearch
+    path('saved-search/', views.saved_search_list, name='saved-search-list'),
+    path('saved-search/<uuid:ss_id>/', views.saved_search_detail, name='saved-search-detail'),
+    # end SavedSearch
     
     # start Resume
     path('resume/', views.resume_list, name='resume-list'),
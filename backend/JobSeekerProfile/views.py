@@ -9,6 +9,9 @@ from django.db import IntegrityError
 from django.utils.crypto import get_random_string
 from .serializers import *
 from .utils import send_verification_code
+from .recommendations import recommend
+from Jobs.models import Jobs
+from Jobs.serializers import JobsSerializer
 from django.contrib.auth import get_user_model,login,logout
 from Accounts.models import CustomUser
 from django.views.decorators.csrf import csrf_exempt
@@ -275,6 +278,30 @@ def jobseekerprofile_update(request, jp_id):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 #end jobseekerprofile
 
+
+#recommended for you: active jobs ranked against skills, experience and applied categories
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def recommended_jobs(request):
+    try:
+        profile = JobseekerProfile.objects.get(user=request.user)
+    except JobseekerProfile.DoesNotExist:
+        return Response({"error": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
+    try:
+        limit = max(1, min(int(request.GET.get("limit", 20)), 50))
+    except ValueError:
+        limit = 20
+    ranked = recommend(profile, limit)
+    fields = JobsSerializer.requested_fields(request)
+    jobs = JobsSerializer.optimize(Jobs.objects.all(), fields).in_bulk([job_id for job_id, _ in ranked])
+    data = []
+    for job_id, score in ranked:
+        if job_id in jobs:
+            item = JobsSerializer(jobs[job_id], fields=fields).data
+            item["match_score"] = score
+            data.append(item)
+    return Response({"jobs": data}, status=status.HTTP_200_OK)
+
    
 # Create + Read (skill-List)
 @api_view(['GET', 'POST'])
@@ -480,6 +507,53 @@ def language_detail(request, l_id):
 
 # end Language
 
+#start SavedSearch
+# Create + Read (List)
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated])
+def saved_search_list(request):
+    if request.method == 'GET':   # READ all
+        searches = SavedSearch.objects.filter(profile__user=request.user).select_related("category")
+        serializer = SavedSearchSerializer(searches, many=True)
+        return Response(serializer.data)
+    elif request.method == 'POST':   # CREATE
+        try:
+            profile = JobseekerProfile.objects.get(user=request.user)
+        except JobseekerProfile.DoesNotExist:
+            return Response({"error": "Profile not found"}, status=status.HTTP_400_BAD_REQUEST)
+        serializer = SavedSearchSerializer(data=request.data)
+        if serializer.is_valid():
+            serializer.save(profile=profile)
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+# Read (Single) + Update + Delete
+@api_view(['GET', 'PUT', 'PATCH', 'DELETE'])
+@permission_classes([IsAuthenticated])
+def saved_search_detail(request, ss_id):
+    try:
+        search = SavedSearch.objects.get(profile__user=request.user, pk=ss_id)
+    except SavedSearch.DoesNotExist:
+        return Response({"error": "Saved search not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    if request.method == 'GET':   # READ one
+        serializer = SavedSearchSerializer(search)
+        return Response(serializer.data)
+
+    elif request.method in ('PUT', 'PATCH'):   # UPDATE
+        serializer = SavedSearchSerializer(search, data=request.data, partial=request.method == 'PATCH')
+        if serializer.is_valid():
+            serializer.save()
+            return Response(serializer.data)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    elif request.method == 'DELETE':   # DELETE
+        search.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+# end SavedSearch
+
 #start Resume
 # Create + Read (List)
 @api_view(['GET', 'POST'])
@@ -8,3 +8,4 @@ class JobsConfig(AppConfig):
 
     def ready(self):
         from . import signals   # <-- safer than hard-coding 'jobs.signals'
+        from . import checks
@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, Warning, register
+
+from Jobs.services.result_cache import VERSION_CACHE
+
+#backends whose entries only the current process can see
+PROCESS_LOCAL_CACHES = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+#shared and in memory: version reads and detail lock polling cost no database query
+PRODUCTION_CACHES = (
+    "django.core.cache.backends.redis.RedisCache",
+    "django.core.cache.backends.memcached.PyMemcacheCache",
+    "django.core.cache.backends.memcached.PyLibMCCache",
+)
+
+
+def _cache_backends():
+    for alias in dict.fromkeys(("default", VERSION_CACHE)):
+        backend = settings.CACHES.get(alias, {}).get("BACKEND", "django.core.cache.backends.locmem.LocMemCache")
+        yield alias, backend
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    #catalogue / detail cache version tokens are bumped by other processes (expire_jobs, other workers)
+    level = Warning if settings.DEBUG else Error
+    return [
+        level(
+            f"The {alias!r} cache ({backend}) is local to one process.",
+            hint="Jobs result and detail cache invalidation must reach every worker and the "
+                 "expire_jobs command; configure a shared cache (Redis, Memcached).",
+            id="Jobs.E001" if level is Error else "Jobs.W001",
+        )
+        for alias, backend in _cache_backends()
+        if backend in PROCESS_LOCAL_CACHES
+    ]
+
+
+@register(Tags.caches, deploy=True)
+def check_production_cache(app_configs, **kwargs):
+    #the database cache is shared but puts a query on every search and detail request
+    return [
+        Error(
+            f"The {alias!r} cache ({backend}) is not Redis or Memcached.",
+            hint="Set REDIS_URL so the result / detail caches and their version tokens stay off the database.",
+            id="Jobs.E002",
+        )
+        for alias, backend in _cache_backends()
+        if backend not in PRODUCTION_CACHES
+    ]
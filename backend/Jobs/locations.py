@@ -0,0 +1,131 @@
+import bisect
+import math
+from array import array
+
+from JobSeeker.normalize import compact_text
+
+# extra spellings per location code, on top of the code and its label.
+# Myanmar names are matched after Zawgyi -> Unicode normalization.
+LOCATION_ALIASES = {
+    "MO": ["Mrauk U", "Mrauk Oo", "Mrauk-Oo", "Myohaung", "မြောက်ဦး"],
+    "MB": ["Minbya", "Minbyar", "Myebone", "Myaybon", "မင်းပြား", "မြေပုံ"],
+    "SIT": ["Sittway", "Sitway", "Akyab", "စစ်တွေ"],
+    "RD": ["Rathedaung", "Rathidaung", "Yathedaung", "ရသေ့တောင်"],
+    "MD": ["Maungtaw", "Maung Daw", "မောင်တော"],
+    "KP": ["Kyaukphyu", "Kyaukpyu", "Kyauk Phyu", "ကျောက်ဖြူ"],
+    "TD": ["Sandoway", "Thandway", "သံတွဲ"],
+    "TG": ["Taungup", "Taunggup", "Toungoop", "တောင်ကုတ်"],
+    "AN": ["အမ်း"],
+    "PNG": ["Ponnagyun", "Ponnakyun", "ပုဏ္ဏားကျွန်း"],
+    "KT": ["Kyauk Taw", "ကျောက်တော်"],
+    "RM": ["Ramri", "Yanbye", "ရမ်းဗြဲ"],
+    "MA": ["Cheduba", "Man Aung", "မာန်အောင်"],
+    "GW": ["ဂွ"],
+    "PT": ["Pauk Taw", "ပေါက်တော"],
+    "BTD": ["Buthedaung", "Bu Thi Daung", "ဘူးသီးတောင်"],
+}
+
+# approximate town-centre coordinates (lat, lon). MB is shared by MINBRAR
+# and MYEBON in LOCATION_CHOICES; it is placed at Minbya.
+TOWNSHIP_COORDINATES = {
+    "MO": (20.595, 93.191),
+    "MB": (20.370, 93.270),
+    "SIT": (20.146, 92.898),
+    "RD": (20.490, 92.770),
+    "MD": (20.820, 92.370),
+    "KP": (19.430, 93.550),
+    "TD": (18.460, 94.370),
+    "TG": (18.850, 94.240),
+    "AN": (19.780, 94.040),
+    "PNG": (20.330, 93.000),
+    "KT": (20.840, 92.980),
+    "RM": (19.090, 93.860),
+    "MA": (18.850, 93.740),
+    "GW": (17.590, 94.580),
+    "PT": (20.190, 93.080),
+    "BTD": (20.870, 92.530),
+}
+
+# shortest text matched as a prefix of a name ("sit" -> SITTWE)
+MIN_PREFIX_LENGTH = 3
+
+
+class LocationResolver:
+    """
+    Maps township codes, labels and common spellings to the codes stored in
+    Jobs.location. The lookup tables are built once; resolving is a dict hit
+    or a bisect over the sorted names, never a database scan.
+    """
+
+    def __init__(self, choices, aliases=None):
+        names = {}
+        for code, label in choices:
+            for name in (code, label, *(aliases or {}).get(code, ())):
+                key = compact_text(name).replace("-", "")
+                if key:
+                    names.setdefault(key, set()).add(code)
+        self._exact = {key: tuple(sorted(codes)) for key, codes in names.items()}
+        self._sorted = sorted(self._exact)
+
+    def resolve(self, text):
+        """Location codes for ``text`` (exact name first, then name prefix); () if unknown."""
+        key = compact_text(text).replace("-", "")
+        if not key:
+            return ()
+        if key in self._exact:
+            return self._exact[key]
+        if len(key) < MIN_PREFIX_LENGTH:
+            return ()
+        codes = set()
+        i = bisect.bisect_left(self._sorted, key)
+        while i < len(self._sorted) and self._sorted[i].startswith(key):
+            codes.update(self._exact[self._sorted[i]])
+            i += 1
+        return tuple(sorted(codes))
+
+
+def _haversine_km(a, b):
+    lat1, lon1, lat2, lon2 = map(math.radians, (*a, *b))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * 6371 * math.asin(math.sqrt(h))
+
+
+class TownshipDistances:
+    """
+    Township-to-township great-circle distances in whole km, computed once into
+    a flat n*n unsigned-short array. within() answers from per-township
+    neighbour lists sorted by distance, so a radius becomes a list of codes
+    for an indexed ``location IN (...)``.
+    """
+
+    def __init__(self, choices, coordinates):
+        self.codes = tuple(dict.fromkeys(code for code, _ in choices if code in coordinates))
+        self._index = {code: i for i, code in enumerate(self.codes)}
+        n = len(self.codes)
+        self._matrix = array("H", [0]) * (n * n)
+        for i, a in enumerate(self.codes):
+            for j, b in enumerate(self.codes):
+                self._matrix[i * n + j] = round(_haversine_km(coordinates[a], coordinates[b]))
+        self._neighbours = {}
+        for code in self.codes:
+            ordered = sorted((self.distance(code, other), other) for other in self.codes)
+            self._neighbours[code] = ([km for km, _ in ordered], [other for _, other in ordered])
+
+    def distance(self, a, b):
+        """Distance in km between two codes, or None if either is unknown."""
+        i, j = self._index.get(a), self._index.get(b)
+        if i is None or j is None:
+            return None
+        return self._matrix[i * len(self.codes) + j]
+
+    def within(self, origins, km):
+        """{code: km to the nearest origin} for every township within ``km`` of one of ``origins``."""
+        found = {}
+        for origin in origins:
+            if origin not in self._neighbours:
+                continue
+            distances, codes = self._neighbours[origin]
+            for code, dist in zip(codes[:bisect.bisect_right(distances, km)], distances):
+                if dist < found.get(code, dist + 1):
+                    found[code] = dist
+        return found
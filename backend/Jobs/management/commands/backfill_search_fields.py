@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from EmployerProfile.models import EmployerProfile
+from JobSeeker.normalize import compact_text
+from Jobs.models import Jobs, JobCategory
+from Jobs.services.search_index import rebuild_index
+
+#(model, source field, normalized field)
+SEARCH_FIELDS = [
+    (Jobs, "title", "title_search"),
+    (JobCategory, "name", "name_search"),
+    (EmployerProfile, "business_name", "business_name_search"),
+]
+
+
+class Command(BaseCommand):
+    help = "Recompute the normalized *_search columns and rebuild the job search index"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        for model, source, target in SEARCH_FIELDS:
+            changed, batch = 0, []
+            for obj in model.objects.only("pk", source, target).iterator(chunk_size=batch_size):
+                value = compact_text(getattr(obj, source))
+                if value != getattr(obj, target):
+                    setattr(obj, target, value)
+                    batch.append(obj)
+                if len(batch) >= batch_size:
+                    model.objects.bulk_update(batch, [target])
+                    changed += len(batch)
+                    batch = []
+            if batch:
+                model.objects.bulk_update(batch, [target])
+                changed += len(batch)
+            self.stdout.write(f"{model.__name__}.{target}: {changed} row(s) updated.")
+        self.stdout.write(f"Reindexed {rebuild_index()} jobs.")
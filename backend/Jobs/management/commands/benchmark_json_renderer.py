@@ -0,0 +1,74 @@
+import datetime
+import json
+import time
+import uuid
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from JobSeeker.renderers import FastJSONRenderer
+from Jobs.models import Jobs
+from Jobs.serializers import JobsSerializer
+
+
+def _sample_jobs(n):
+    # unsaved rows shaped like real ones, used when the database has too few jobs
+    now = timezone.now()
+    return [
+        Jobs(
+            id=uuid.uuid4(),
+            title=f"Sample job {i}",
+            description="Responsibilities and requirements. " * 40,
+            location="SIT",
+            job_type="FULL",
+            salary=Decimal("450000.00") + i,
+            max_applicants=50,
+            deadline=datetime.date.today() + datetime.timedelta(days=30),
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(n)
+    ]
+
+
+class Command(BaseCommand):
+    help = "Time DRF's JSONRenderer against FastJSONRenderer on jobs_list-sized payloads"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100, help="jobs per payload (a jobs_list page is 20, max 100)")
+        parser.add_argument("--iterations", type=int, default=200)
+
+    def _time(self, renderer, data, iterations):
+        renderer.render(data)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            body = renderer.render(data)
+        return (time.perf_counter() - start) / iterations * 1000, body
+
+    def handle(self, *args, rows, iterations, **options):
+        jobs = list(Jobs.objects.select_related("employer", "category").order_by("-created_at")[:rows])
+        stored = len(jobs)
+        jobs += _sample_jobs(rows - stored)
+        payloads = {
+            #what jobs_list returns: serializer output, mostly strings
+            "jobs_list page": {"jobs": JobsSerializer(jobs, many=True).data, "next": None, "page_size": rows},
+            #values() rows as search builds them: raw UUID, Decimal and datetime objects
+            "values() rows": {"results": [
+                {
+                    "id": job.id, "title": job.title, "salary": job.salary, "location": job.location,
+                    "deadline": job.deadline, "created_at": job.created_at,
+                }
+                for job in jobs
+            ]},
+        }
+        self.stdout.write(f"{rows} jobs ({stored} from the database), {iterations} iterations each")
+        for name, data in payloads.items():
+            stdlib_ms, stdlib_body = self._time(JSONRenderer(), data, iterations)
+            fast_ms, fast_body = self._time(FastJSONRenderer(), data, iterations)
+            same = json.loads(stdlib_body) == json.loads(fast_body)
+            self.stdout.write(
+                f"{name:>15}: JSONRenderer {stdlib_ms:.3f} ms, FastJSONRenderer {fast_ms:.3f} ms "
+                f"({stdlib_ms / fast_ms:.1f}x), {len(fast_body)} bytes, identical={same}"
+            )
@@ -0,0 +1,19 @@
+import time
+from django.core.management.base import BaseCommand
+from Jobs.services.expiry import expire_due_jobs
+
+
+class Command(BaseCommand):
+    help = "Close active jobs whose deadline has passed (run from cron, or with --loop as a worker)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--loop", action="store_true", help="Keep running, one sweep per interval")
+        parser.add_argument("--interval", type=int, default=3600, help="Seconds between sweeps with --loop")
+
+    def handle(self, *args, **options):
+        while True:
+            closed = expire_due_jobs()
+            self.stdout.write(f"Closed {closed} expired jobs.")
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from Jobs.services.category_tree import rebuild_closure
+
+
+class Command(BaseCommand):
+    help = "Rebuild the JobCategory closure table from the parent links"
+
+    def handle(self, *args, **options):
+        count = rebuild_closure()
+        self.stdout.write(f"Rebuilt closure rows for {count} categories.")
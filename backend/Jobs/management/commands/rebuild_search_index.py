@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from Jobs.services.search_index import rebuild_index
+from Jobs.services.trigram import rebuild_trigrams
+
+
+class Command(BaseCommand):
+    help = "Rebuild the job search index (posting list) and the trigram table"
+
+    def handle(self, *args, **options):
+        count = rebuild_index()
+        self.stdout.write(f"Indexed {count} jobs.")
+        count = rebuild_trigrams()
+        self.stdout.write(f"Indexed trigrams for {count} titles, categories and companies.")
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from Application.models import Application
+from Jobs.models import Jobs
+from Jobs.services.detail_cache import invalidate_job_details
+
+
+def actual_counts():
+    return Coalesce(
+        Subquery(
+            Application.objects.filter(job=OuterRef("pk"))
+            .order_by()
+            .values("job")
+            .annotate(n=Count("id"))
+            .values("n")
+        ),
+        0,
+    )
+
+
+class Command(BaseCommand):
+    help = "Recompute Jobs.application_count from the Application table"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only report jobs whose counter drifted")
+
+    def handle(self, *args, **options):
+        drifted = (
+            Jobs.objects.annotate(actual=actual_counts())
+            .exclude(application_count=F("actual"))
+            .values_list("id", "application_count", "actual")
+        )
+        rows = list(drifted)
+        for job_id, stored, actual in rows:
+            self.stdout.write(f"{job_id}: stored {stored}, actual {actual}")
+        if rows and not options["dry_run"]:
+            job_ids = [r[0] for r in rows]
+            with transaction.atomic():
+                Jobs.objects.filter(id__in=job_ids).update(application_count=actual_counts())
+                #cached detail payloads still carry the drifted count
+                transaction.on_commit(lambda: invalidate_job_details(job_ids))
+        self.stdout.write(f"{len(rows)} job(s) out of sync.")
@@ -0,0 +1,82 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from Jobs.services.search_index import document_terms
+
+
+def build_search_index(apps, schema_editor):
+    Jobs = apps.get_model("Jobs", "Jobs")
+    JobSearchTerm = apps.get_model("Jobs", "JobSearchTerm")
+    labels = dict(Jobs._meta.get_field("location").flatchoices)
+    for job in Jobs.objects.select_related("category").iterator():
+        terms = document_terms(
+            job.title,
+            job.location,
+            labels.get(job.location, ""),
+            job.category.name if job.category_id else "",
+            job.description,
+        )
+        JobSearchTerm.objects.bulk_create(
+            [JobSearchTerm(job=job, field=field, term=term) for field, term in terms]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Jobs", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobSearchTerm",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "field",
+                    models.CharField(
+                        choices=[
+                            ("title", "Title"),
+                            ("location", "Location"),
+                            ("category", "Category"),
+                            ("description", "Description"),
+                        ],
+                        max_length=12,
+                    ),
+                ),
+                ("term", models.CharField(max_length=64)),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_terms",
+                        to="Jobs.jobs",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["term", "job"], name="jobs_search_term_job_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("job", "field", "term"),
+                        name="unique_search_term_per_job_field",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(build_search_index, migrations.RunPython.noop),
+    ]
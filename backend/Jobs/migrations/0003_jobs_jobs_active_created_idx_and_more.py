@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("EmployerProfile", "0003_employeremailverification"),
+        ("Jobs", "0002_jobsearchterm"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobs",
+            index=models.Index(
+                fields=["is_active", "created_at", "id"], name="jobs_active_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobs",
+            index=models.Index(
+                fields=["employer", "created_at", "id"],
+                name="jobs_employer_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("EmployerProfile", "0003_employeremailverification"),
+        ("Jobs", "0003_jobs_jobs_active_created_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobs",
+            index=models.Index(
+                fields=["is_active", "deadline"], name="jobs_active_deadline_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:12
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_application_count(apps, schema_editor):
+    Jobs = apps.get_model("Jobs", "Jobs")
+    Application = apps.get_model("Application", "Application")
+    counts = (
+        Application.objects.filter(job=OuterRef("pk"))
+        .order_by()
+        .values("job")
+        .annotate(n=Count("id"))
+        .values("n")
+    )
+    Jobs.objects.update(application_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Jobs", "0004_jobs_jobs_active_deadline_idx"),
+        ("Application", "0002_savejob_created_at_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobs",
+            name="application_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_application_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:16
+
+from django.db import migrations, models
+
+from JobSeeker.normalize import compact_text
+
+
+def backfill_search_fields(apps, schema_editor):
+    for model_name, source, target in (
+        ("JobCategory", "name", "name_search"),
+        ("Jobs", "title", "title_search"),
+    ):
+        model = apps.get_model("Jobs", model_name)
+        rows = list(model.objects.only("pk", source))
+        for row in rows:
+            setattr(row, target, compact_text(getattr(row, source)))
+        model.objects.bulk_update(rows, [target], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Jobs", "0005_jobs_application_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobcategory",
+            name="name_search",
+            field=models.CharField(
+                blank=True, db_index=True, default="", editable=False, max_length=255
+            ),
+        ),
+        migrations.AddField(
+            model_name="jobs",
+            name="title_search",
+            field=models.CharField(
+                blank=True, db_index=True, default="", editable=False, max_length=255
+            ),
+        ),
+        migrations.RunPython(backfill_search_fields, migrations.RunPython.noop),
+    ]
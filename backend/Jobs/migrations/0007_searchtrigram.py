@@ -0,0 +1,73 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:19
+
+from django.db import migrations, models
+
+from Jobs.services.trigram import trigrams
+
+
+def backfill_trigrams(apps, schema_editor):
+    SearchTrigram = apps.get_model("Jobs", "SearchTrigram")
+    for kind, app_label, model_name, field in (
+        ("job", "Jobs", "Jobs", "title"),
+        ("category", "Jobs", "JobCategory", "name"),
+        ("company", "EmployerProfile", "EmployerProfile", "business_name"),
+    ):
+        model = apps.get_model(app_label, model_name)
+        rows = []
+        for object_id, text in model.objects.values_list("id", field).iterator():
+            grams = trigrams(text)
+            rows.extend(
+                SearchTrigram(kind=kind, object_id=object_id, gram=gram, gram_count=len(grams))
+                for gram in grams
+            )
+        SearchTrigram.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Jobs", "0006_jobcategory_name_search_jobs_title_search"),
+        ("EmployerProfile", "0004_employerprofile_business_name_search"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchTrigram",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("job", "Job title"),
+                            ("category", "Category name"),
+                            ("company", "Company name"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("object_id", models.UUIDField()),
+                ("gram", models.CharField(max_length=3)),
+                ("gram_count", models.PositiveSmallIntegerField()),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["kind", "gram"], name="search_trigram_gram_idx"
+                    ),
+                    models.Index(
+                        fields=["kind", "object_id"], name="search_trigram_object_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_trigrams, migrations.RunPython.noop),
+    ]
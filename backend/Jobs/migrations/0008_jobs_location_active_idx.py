@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("EmployerProfile", "0004_employerprofile_business_name_search"),
+        ("Jobs", "0007_searchtrigram"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobs",
+            index=models.Index(
+                fields=["location", "is_active", "created_at"],
+                name="jobs_location_active_idx",
+            ),
+        ),
+    ]
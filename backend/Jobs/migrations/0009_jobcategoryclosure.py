@@ -0,0 +1,71 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from Jobs.services.category_tree import closure_rows
+
+
+def backfill_closure(apps, schema_editor):
+    JobCategory = apps.get_model("Jobs", "JobCategory")
+    JobCategoryClosure = apps.get_model("Jobs", "JobCategoryClosure")
+    parents = dict(JobCategory.objects.values_list("id", "parent_id"))
+    JobCategoryClosure.objects.bulk_create(
+        [JobCategoryClosure(ancestor_id=a, descendant_id=d, depth=depth) for a, d, depth in closure_rows(parents)],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Jobs", "0008_jobs_location_active_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobCategoryClosure",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("depth", models.PositiveSmallIntegerField()),
+                (
+                    "ancestor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="descendant_links",
+                        to="Jobs.jobcategory",
+                    ),
+                ),
+                (
+                    "descendant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ancestor_links",
+                        to="Jobs.jobcategory",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["descendant", "depth"], name="category_closure_desc_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("ancestor", "descendant"),
+                        name="unique_category_closure_pair",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_closure, migrations.RunPython.noop),
+    ]
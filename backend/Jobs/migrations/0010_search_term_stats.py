@@ -0,0 +1,127 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:23
+
+from django.db import migrations, models
+
+from Jobs.services.search_index import document_term_counts
+
+
+def backfill_term_counts(apps, schema_editor):
+    Jobs = apps.get_model("Jobs", "Jobs")
+    JobSearchTerm = apps.get_model("Jobs", "JobSearchTerm")
+    SearchTermStat = apps.get_model("Jobs", "SearchTermStat")
+    SearchFieldStat = apps.get_model("Jobs", "SearchFieldStat")
+    labels = dict(Jobs._meta.get_field("location").flatchoices)
+    doc_freqs, totals = {}, {}
+    JobSearchTerm.objects.all().delete()
+    for job in Jobs.objects.select_related("category").iterator():
+        terms = document_term_counts(
+            job.title,
+            job.location,
+            labels.get(job.location, ""),
+            job.category.name if job.category_id else "",
+            job.description,
+        )
+        JobSearchTerm.objects.bulk_create([
+            JobSearchTerm(job=job, field=field, term=term, frequency=frequency, field_length=field_length)
+            for (field, term), (frequency, field_length) in terms.items()
+        ])
+        lengths = {}
+        for (field, term), (_, field_length) in terms.items():
+            doc_freqs[field, term] = doc_freqs.get((field, term), 0) + 1
+            lengths[field] = field_length
+        for field, field_length in lengths.items():
+            docs, total = totals.get(field, (0, 0))
+            totals[field] = (docs + 1, total + field_length)
+    SearchTermStat.objects.bulk_create(
+        [SearchTermStat(field=field, term=term, doc_count=n) for (field, term), n in doc_freqs.items()],
+        batch_size=1000,
+    )
+    SearchFieldStat.objects.bulk_create([
+        SearchFieldStat(field=field, doc_count=docs, total_length=total)
+        for field, (docs, total) in totals.items()
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Jobs", "0009_jobcategoryclosure"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchFieldStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "field",
+                    models.CharField(
+                        choices=[
+                            ("title", "Title"),
+                            ("location", "Location"),
+                            ("category", "Category"),
+                            ("description", "Description"),
+                        ],
+                        max_length=12,
+                        unique=True,
+                    ),
+                ),
+                ("doc_count", models.PositiveIntegerField(default=0)),
+                ("total_length", models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="jobsearchterm",
+            name="field_length",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="jobsearchterm",
+            name="frequency",
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.CreateModel(
+            name="SearchTermStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "field",
+                    models.CharField(
+                        choices=[
+                            ("title", "Title"),
+                            ("location", "Location"),
+                            ("category", "Category"),
+                            ("description", "Description"),
+                        ],
+                        max_length=12,
+                    ),
+                ),
+                ("term", models.CharField(max_length=64)),
+                ("doc_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("field", "term"), name="unique_search_term_stat"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_term_counts, migrations.RunPython.noop),
+    ]
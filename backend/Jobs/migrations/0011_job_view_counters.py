@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("EmployerProfile", "0004_employerprofile_business_name_search"),
+        ("Jobs", "0010_search_term_stats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobs",
+            name="impression_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="jobs",
+            name="view_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="jobs",
+            index=models.Index(
+                fields=["is_active", "view_count"], name="jobs_active_views_idx"
+            ),
+        ),
+    ]
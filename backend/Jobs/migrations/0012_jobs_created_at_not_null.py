@@ -0,0 +1,23 @@
+from django.db import migrations, models
+from django.db.models.functions import Coalesce, Now
+
+
+def backfill_created_at(apps, schema_editor):
+    Jobs = apps.get_model("Jobs", "Jobs")
+    Jobs.objects.filter(created_at__isnull=True).update(created_at=Coalesce("updated_at", Now()))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Jobs", "0011_job_view_counters"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_created_at, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="jobs",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, blank=True),
+        ),
+    ]
@@ -1,9 +1,32 @@
 from django.db import models
 from django.db import models
+from django.db.models import F
 from EmployerProfile.models import EmployerProfile
 from Accounts.models import CustomUser
+from JobSeeker.normalize import compact_text
+from .locations import LOCATION_ALIASES, TOWNSHIP_COORDINATES, LocationResolver, TownshipDistances
 import uuid
 
+#manager category
+class JobCategoryManager(models.Manager):
+
+    def subtree(self, category_id, include_self=True):
+        #the category and everything nested under it, one join on the closure table
+        min_depth=0 if include_self else 1
+        return self.get_queryset().filter(
+            ancestor_links__ancestor_id=category_id,
+            ancestor_links__depth__gte=min_depth,
+        )
+
+    def ancestors(self, category_id, include_self=False):
+        #root first
+        min_depth=0 if include_self else 1
+        return self.get_queryset().filter(
+            descendant_links__descendant_id=category_id,
+            descendant_links__depth__gte=min_depth,
+        ).order_by("-descendant_links__depth")
+
+
 class JobCategory(models.Model):
     id = models.UUIDField(
         primary_key=True,      # ဒီ field ကို primary key လုပ်မယ်
@@ -11,6 +34,8 @@ class JobCategory(models.Model):
         editable=False         # User လက်နဲ့ မပြင်နိုင်အောင် lock
     )
     name = models.CharField(max_length=100)
+    #normalized copy of name (Zawgyi -> Unicode, case folded, no spaces)
+    name_search = models.CharField(max_length=255, blank=True, default="", editable=False, db_index=True)
     parent = models.ForeignKey(
         "self",
         null=True,
@@ -22,6 +47,8 @@ class JobCategory(models.Model):
     updated_at = models.DateTimeField(auto_now=True,blank=True,null=True)
     user=models.ForeignKey(CustomUser,on_delete=models.CASCADE,blank=True,null=True)
 
+    objects = JobCategoryManager()
+
     class Meta:
         constraints = [
             models.UniqueConstraint(
@@ -30,24 +57,75 @@ class JobCategory(models.Model):
             )
         ]
 
+    def save(self, *args, **kwargs):
+        self.name_search = compact_text(self.name)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "name" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "name_search"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.name
 
+#closure table of the category tree: one row per (ancestor, descendant) pair,
+#including (category, category, 0); maintained by Jobs.services.category_tree
+class JobCategoryClosure(models.Model):
+    ancestor = models.ForeignKey(JobCategory, on_delete=models.CASCADE, related_name="descendant_links")
+    descendant = models.ForeignKey(JobCategory, on_delete=models.CASCADE, related_name="ancestor_links")
+    depth = models.PositiveSmallIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["ancestor", "descendant"],
+                name="unique_category_closure_pair"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["descendant", "depth"], name="category_closure_desc_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.ancestor_id} > {self.descendant_id} ({self.depth})"
+
+
 #manager job
 class JobsManager(models.Manager):  
      
     def quick_search_by_city(self, city_name):
         qs=self.get_queryset()
         if city_name:
-            qs=qs.filter(location__icontains=city_name)
-        return qs 
+            #resolved to codes up front so this is an indexed IN, not a LIKE scan
+            codes=self.model.locations.resolve(city_name)
+            qs=qs.filter(location__in=codes, is_active=True)
+        return qs
     
-    def quick_search_by_category(self, category_name):
+    def quick_search_by_category(self, category_name, include_descendants=False):
         qs=self.get_queryset()
         if category_name:
-            qs=qs.filter(category__name__icontains=category_name)
+            key=compact_text(category_name)
+            lookup="name_search__startswith"
+            #an inner word ("developer" in "Software Developer") needs a LIKE '%q%' scan, so only when the prefix misses
+            if key and not JobCategory.objects.filter(name_search__startswith=key).exists():
+                lookup="name_search__contains"
+            if include_descendants:
+                subtree=JobCategoryClosure.objects.filter(**{f"ancestor__{lookup}": key}).values("descendant_id")
+                qs=qs.filter(category_id__in=subtree)
+            else:
+                qs=qs.filter(**{f"category__{lookup}": key})
         return qs
 
+    def in_category_tree(self, category_id):
+        #jobs filed under the category or any of its descendants
+        return self.get_queryset().filter(category__ancestor_links__ancestor_id=category_id)
+
+    def adjust_application_count(self, job_id, delta):
+        #single UPDATE ... SET application_count = application_count + delta, never below zero
+        qs=self.get_queryset().filter(id=job_id)
+        if delta < 0:
+            qs=qs.filter(application_count__gte=-delta)
+        return qs.update(application_count=F("application_count") + delta)
+
 
 
 class Jobs(models.Model):
@@ -85,6 +163,8 @@ class Jobs(models.Model):
         ('BTD', 'BUTHIDAUNG'),
         ('MB', 'MYEBON'),
     ]
+    locations = LocationResolver(LOCATION_CHOICES, LOCATION_ALIASES)
+    distances = TownshipDistances(LOCATION_CHOICES, TOWNSHIP_COORDINATES)
 
     id = models.UUIDField(
         primary_key=True,      # ဒီ field ကို primary key လုပ်မယ်
@@ -94,6 +174,8 @@ class Jobs(models.Model):
     
     employer=models.ForeignKey(EmployerProfile, on_delete=models.CASCADE,blank=True,null=True,related_name="jobs")
     title = models.CharField(max_length=150,blank=True,null=True)
+    #normalized copy of title (Zawgyi -> Unicode, case folded, no spaces)
+    title_search = models.CharField(max_length=255, blank=True, default="", editable=False, db_index=True)
     description = models.TextField(blank=True,null=True)
     location = models.CharField(choices=LOCATION_CHOICES,default='MO',null=True,max_length=50)
     job_type = models.CharField(choices=JOB_TYPE_CHOICES,default='FULL',null=True,max_length=10)
@@ -102,7 +184,13 @@ class Jobs(models.Model):
     is_active = models.BooleanField(default=True)
     max_applicants = models.PositiveIntegerField(default=0, help_text="Maximum number of allowed applicants")
     deadline = models.DateField(blank=True, null=True)
-    created_at = models.DateTimeField(auto_now_add=True,null=True, blank=True)
+    #maintained by Application views, see JobsManager.adjust_application_count
+    application_count = models.PositiveIntegerField(default=0, editable=False)
+    #flushed in batches by Jobs.services.counters
+    view_count = models.PositiveIntegerField(default=0, editable=False)
+    impression_count = models.PositiveIntegerField(default=0, editable=False)
+    #NOT NULL so the keyset pagination seek is a plain (created_at, id) range
+    created_at = models.DateTimeField(auto_now_add=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True,null=True, blank=True)
 
     #New field
@@ -113,7 +201,117 @@ class Jobs(models.Model):
         help_text="Use FEATURED for top placement or URGENT for visible badge."
     )
 
+    #columns written only through single-column UPDATEs, never by a full save()
+    COUNTER_FIELDS = ("application_count", "view_count", "impression_count")
+
     objects = JobsManager()
 
+    class Meta:
+        indexes = [
+            #keyset pagination paths (see Jobs.pagination)
+            models.Index(fields=["is_active", "created_at", "id"], name="jobs_active_created_idx"),
+            models.Index(fields=["employer", "created_at", "id"], name="jobs_employer_created_idx"),
+            #deadline sweeper (Jobs.services.expiry)
+            models.Index(fields=["is_active", "deadline"], name="jobs_active_deadline_idx"),
+            models.Index(fields=["location", "is_active", "created_at"], name="jobs_location_active_idx"),
+            #popular jobs
+            models.Index(fields=["is_active", "view_count"], name="jobs_active_views_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.title_search = compact_text(self.title)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "title" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "title_search"}
+        #don't let a stale instance overwrite counters bumped concurrently
+        if not self._state.adding and kwargs.get("update_fields") is None and not kwargs.get("force_insert"):
+            kwargs["update_fields"] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return self.title
+
+#search index (posting list) for Jobs.views.search
+class JobSearchTerm(models.Model):
+    FIELD_CHOICES = [
+        ("title", "Title"),
+        ("location", "Location"),
+        ("category", "Category"),
+        ("description", "Description"),
+    ]
+
+    job = models.ForeignKey(Jobs, on_delete=models.CASCADE, related_name="search_terms")
+    field = models.CharField(max_length=12, choices=FIELD_CHOICES)
+    term = models.CharField(max_length=64)
+    #BM25 inputs: occurrences of the term in the field, and the field's length in words
+    frequency = models.PositiveIntegerField(default=1)
+    field_length = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["term", "job"], name="jobs_search_term_job_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["job", "field", "term"],
+                name="unique_search_term_per_job_field"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.term} ({self.field})"
+
+
+#document frequency of each (field, term), kept in step with JobSearchTerm
+class SearchTermStat(models.Model):
+    field = models.CharField(max_length=12, choices=JobSearchTerm.FIELD_CHOICES)
+    term = models.CharField(max_length=64)
+    doc_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["field", "term"],
+                name="unique_search_term_stat"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.term} ({self.field}): {self.doc_count}"
+
+
+#per-field corpus totals (indexed jobs, summed field length) for BM25
+class SearchFieldStat(models.Model):
+    field = models.CharField(max_length=12, choices=JobSearchTerm.FIELD_CHOICES, unique=True)
+    doc_count = models.PositiveIntegerField(default=0)
+    total_length = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.field}: {self.doc_count} docs"
+
+
+#trigram side table for typo-tolerant matching (Jobs.services.trigram)
+class SearchTrigram(models.Model):
+    KIND_CHOICES = [
+        ("job", "Job title"),
+        ("category", "Category name"),
+        ("company", "Company name"),
+    ]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.UUIDField()
+    gram = models.CharField(max_length=3)
+    #number of distinct trigrams of the whole value, for the similarity denominator
+    gram_count = models.PositiveSmallIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["kind", "gram"], name="search_trigram_gram_idx"),
+            models.Index(fields=["kind", "object_id"], name="search_trigram_object_idx"),
+        ]
+
     def __str__(self):
-        return self.title
\ No newline at end of file
+        return f"{self.kind}:{self.gram}"
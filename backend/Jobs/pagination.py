@@ -0,0 +1,127 @@
+import base64
+import json
+import uuid
+from django.db.models import F, Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination on (<ordering_field>, id), newest (or highest) first.
+    The cursor is an opaque base64 token holding the last row's key, so every
+    page is an indexed range read no matter how deep the client scrolls.
+    Ordering fields are expected to be NOT NULL; a nullable one (match_score)
+    is sorted NULLS LAST and its seek is no longer a single range.
+    """
+    page_size = 20
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self, ordering_field="created_at"):
+        self.ordering_field = ordering_field
+        self.next_position = None
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def encode_cursor(self, value, pk):
+        if hasattr(value, "isoformat"):
+            value = value.isoformat()
+        payload = json.dumps([value, str(pk)])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            value, pk = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            #datetimes travel as ISO strings, numeric keys (scores) as JSON numbers
+            if isinstance(value, str):
+                value = parse_datetime(value)
+                if value is None:
+                    raise ValueError
+            elif value is not None and not isinstance(value, (int, float)):
+                raise ValueError
+            #every paginated model has a UUID pk; a bad one would fail in the query instead
+            if not isinstance(pk, str):
+                raise ValueError
+            return value, uuid.UUID(pk)
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        field = self.ordering_field
+
+        position = self.decode_cursor(request)
+        if queryset.model._meta.get_field(field).null:
+            queryset = self._nullable_seek(queryset, field, position)
+        else:
+            queryset = queryset.order_by(f"-{field}", "-id")
+            if position is not None:
+                value, pk = position
+                if value is None:
+                    raise NotFound(self.invalid_cursor_message)
+                #(field, id) < (value, pk), written so the leading field <= value bounds the index range
+                queryset = queryset.filter(
+                    Q(**{f"{field}__lte": value}),
+                    Q(**{f"{field}__lt": value}) | Q(id__lt=pk),
+                )
+
+        page = list(queryset[: self.page_size + 1])
+        if len(page) > self.page_size:
+            page = page[: self.page_size]
+            last = page[-1]
+            self.next_position = (getattr(last, field), last.pk)
+        return page
+
+    def _nullable_seek(self, queryset, field, position):
+        #scores not computed yet (NULL) come last; only match_score still needs this
+        queryset = queryset.order_by(F(field).desc(nulls_last=True), "-id")
+        if position is None:
+            return queryset
+        value, pk = position
+        if value is None:
+            return queryset.filter(**{f"{field}__isnull": True, "id__lt": pk})
+        return queryset.filter(
+            Q(**{f"{field}__lt": value})
+            | Q(**{field: value, "id__lt": pk})
+            | Q(**{f"{field}__isnull": True})
+        )
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(*self.next_position))
+
+    def get_paginated_response(self, data, key="results", **extra):
+        return Response({
+            key: data,
+            "next": self.get_next_link(),
+            "page_size": self.page_size,
+            **extra,
+        })
+
+
+def paginated_response(request, queryset, serializer_class, key, ordering_field="created_at", fields=None, **extra):
+    #shared by every list endpoint in Jobs / Application; fields is passed on to serializers that take it
+    paginator = KeysetPagination(ordering_field=ordering_field)
+    page = paginator.paginate_queryset(queryset, request)
+    if fields is not None:
+        data = serializer_class(page, many=True, fields=fields).data
+    else:
+        data = serializer_class(page, many=True).data
+    return paginator.get_paginated_response(data, key=key, **extra)
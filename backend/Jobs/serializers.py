@@ -1,18 +1,38 @@
 
 from rest_framework import serializers
+from django.utils import timezone
 from .models import JobCategory, Jobs
 from Accounts.models import CustomUser
 from EmployerProfile.models import EmployerProfile
+from JobSeeker.normalize import compact_text
 
 class JobCategorySerializer(serializers.ModelSerializer):
+    parent = serializers.PrimaryKeyRelatedField(
+        queryset=JobCategory.objects.all(),
+        required=False,
+        allow_null=True
+    )
+
     class Meta:
         model = JobCategory
-        fields = ['id', 'name','created_at', 'updated_at']
+        fields = ['id', 'name', 'parent', 'created_at', 'updated_at']
+
+    def validate_parent(self, parent):
+        if parent is not None and self.instance is not None:
+            if JobCategory.objects.subtree(self.instance.pk).filter(pk=parent.pk).exists():
+                raise serializers.ValidationError("A category cannot be nested under itself or one of its descendants.")
+        return parent
     
 
     
 class JobsSerializer(serializers.ModelSerializer):
-    application_count = serializers.SerializerMethodField()
+    #what a list card shows, for ?view=compact
+    COMPACT_FIELDS = (
+        "id", "title", "employer_business_name", "category_name",
+        "location", "job_type", "salary", "priority", "deadline", "created_at",
+    )
+
+    application_count = serializers.IntegerField(read_only=True)
     employer_business_name = serializers.CharField(
         source="employer.business_name",
         read_only=True
@@ -29,9 +49,6 @@ class JobsSerializer(serializers.ModelSerializer):
     job_type_display = serializers.CharField(source='get_job_type_display', read_only=True)
     priority_display = serializers.CharField(source='get_priority_display', read_only=True)
 
-    def get_application_count(self, job):
-        return job.applications.count()
-    
     class Meta:
         model = Jobs
         fields = [
@@ -61,15 +78,94 @@ class JobsSerializer(serializers.ModelSerializer):
 
         read_only_fields = ["employer"]
 
-
-
-    
-    
-
-
-
-
-
-
-    
+    def __init__(self, *args, fields=None, **kwargs):
+        #fields: names to keep (see requested_fields), None for all of them
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def requested_fields(cls, request):
+        """Field names asked for with ?view=compact or ?fields=a,b (id always included), or None."""
+        if request.GET.get("view", "").lower() == "compact":
+            return cls.COMPACT_FIELDS
+        raw = request.GET.get("fields")
+        if not raw:
+            return None
+        names = [name.strip() for name in raw.split(",") if name.strip()]
+        unknown = [name for name in names if name not in cls.Meta.fields]
+        if unknown:
+            raise serializers.ValidationError({"fields": [f"Unknown field(s): {', '.join(unknown)}"]})
+        return ("id", *dict.fromkeys(name for name in names if name != "id"))
+
+    @classmethod
+    def optimize(cls, queryset, fields, *columns):
+        """
+        ``queryset`` with the joins and .only() columns that ``fields`` need, so
+        unrequested columns (description, logo, ...) are never read. ``columns``
+        are loaded as well, e.g. the pagination key.
+        """
+        if fields is None:
+            return queryset.select_related("employer", "category")
+        declared = cls().fields
+        needed, related = {"id", *columns}, set()
+        for name in fields:
+            source = declared[name].source
+            #get_location_display -> location
+            if source.startswith("get_") and source.endswith("_display"):
+                source = source[len("get_"):-len("_display")]
+            path = source.split(".")
+            if len(path) > 1:
+                related.add(path[0])
+            needed.add("__".join(path))
+        return queryset.select_related(*related).only(*needed)
+
+
+class BatchCategoryField(serializers.RelatedField):
+    """
+    Category given by id or name, looked up in ``context["categories"]``
+    (preloaded once per import batch) instead of one query per row.
+    """
+    default_error_messages = {
+        "does_not_exist": 'Invalid category "{value}" - object does not exist.',
+    }
+
+    def to_internal_value(self, data):
+        category = self.context["categories"].get(category_lookup_key(data))
+        if category is None:
+            self.fail("does_not_exist", value=data)
+        return category
+
+    def to_representation(self, value):
+        return str(value.pk)
+
+
+def category_lookup_key(value):
+    return compact_text(str(value))
+
+
+class JobImportSerializer(JobsSerializer):
+    category = BatchCategoryField(queryset=JobCategory.objects.all())
+
+
+class JobBulkActionSerializer(serializers.Serializer):
+    action = serializers.ChoiceField(choices=["close", "reopen", "extend", "priority"])
+    ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=500)
+    deadline = serializers.DateField(required=False)
+    days = serializers.IntegerField(required=False, min_value=1, max_value=365)
+    priority = serializers.ChoiceField(choices=Jobs.PRIORITY_CHOICES, required=False)
+
+    def validate_deadline(self, value):
+        if value < timezone.localdate():
+            raise serializers.ValidationError("Deadline cannot be in the past.")
+        return value
+
+    def validate(self, attrs):
+        action = attrs["action"]
+        if action == "extend" and ("deadline" in attrs) == ("days" in attrs):
+            raise serializers.ValidationError({"deadline": "Give either a new deadline or a number of days."})
+        if action == "priority" and "priority" not in attrs:
+            raise serializers.ValidationError({"priority": "This field is required for the priority action."})
+        return attrs
 
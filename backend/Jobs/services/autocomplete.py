@@ -0,0 +1,293 @@
+import heapq
+import threading
+import time
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from EmployerProfile.models import EmployerProfile
+from Jobs.models import Jobs, JobCategory
+from Jobs.services.search_index import split_words
+
+#longest suggestion list a node keeps (the view caps ?limit at 25)
+TOP_K = getattr(settings, "JOBS_AUTOCOMPLETE_TOP_K", 25)
+
+
+def _keys(label):
+    # every word start is a key, so "dev" finds "Web Developer" too
+    words = split_words(label)
+    return {" ".join(words[i:]) for i in range(len(words))}
+
+
+class _Node:
+    __slots__ = ("children", "entries", "top")
+
+    def __init__(self):
+        self.children = {}
+        #entries whose key ends here
+        self.entries = set()
+        #best TOP_K entries of the whole subtree, heaviest first
+        self.top = []
+
+
+class _Trie:
+    """
+    One built generation of the index. Every node keeps its subtree's TOP_K
+    entries, so a query reads one list instead of walking the subtree.
+    """
+
+    def __init__(self):
+        self.root = _Node()
+        self.weights = {}
+        self.values = {}
+        self.job_entries = {}
+
+    def _rank(self, entry):
+        return self.weights.get(entry, 0), entry[1]
+
+    def _path(self, key, create):
+        #nodes from the first character down to the end of key
+        node, path = self.root, []
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                if not create:
+                    return None
+                child = node.children[char] = _Node()
+            node = child
+            path.append(node)
+        return path
+
+    def _place(self, node, entry):
+        top = node.top
+        if entry in top:
+            top.remove(entry)
+        if entry not in self.weights:
+            return
+        rank = self._rank(entry)
+        if len(top) >= TOP_K and rank <= self._rank(top[-1]):
+            return
+        i = 0
+        while i < len(top) and self._rank(top[i]) >= rank:
+            i += 1
+        top.insert(i, entry)
+        del top[TOP_K:]
+
+    def bump(self, entry, delta, value=None, incremental=True):
+        """
+        Move an entry's weight. With ``incremental`` the top lists along its
+        keys are adjusted in place; an entry that drops out of a full list is
+        not replaced by one below it until the next rebuild.
+        """
+        weight = self.weights.get(entry, 0) + delta
+        if weight <= 0:
+            if self.weights.pop(entry, None) is None:
+                return
+            self.values.pop(entry, None)
+            for key in _keys(entry[1]):
+                path = self._path(key, create=False) or []
+                if path:
+                    path[-1].entries.discard(entry)
+                for node in path:
+                    if entry in node.top:
+                        node.top.remove(entry)
+            return
+        self.weights[entry] = weight
+        if value is not None:
+            self.values[entry] = value
+        for key in _keys(entry[1]):
+            path = self._path(key, create=True)
+            path[-1].entries.add(entry)
+            if incremental:
+                for node in path:
+                    self._place(node, entry)
+
+    def add_job(self, job_id, entries, incremental=True):
+        self.remove_job(job_id, incremental)
+        for entry, value in entries:
+            self.bump(entry, 1, value, incremental)
+        self.job_entries[job_id] = entries
+
+    def remove_job(self, job_id, incremental=True):
+        for entry, _ in self.job_entries.pop(job_id, ()):
+            self.bump(entry, -1, incremental=incremental)
+
+    def fill_tops(self):
+        #post-order: a node's top is the best of its own entries and its children's tops
+        stack = [(self.root, False)]
+        while stack:
+            node, done = stack.pop()
+            if not done:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children.values())
+                continue
+            candidates = set(node.entries)
+            for child in node.children.values():
+                candidates.update(child.top)
+            node.top = heapq.nlargest(TOP_K, candidates, key=self._rank)
+
+    def top(self, key, limit):
+        path = self._path(key, create=False)
+        return path[-1].top[:limit] if path else []
+
+
+class AutocompleteIndex:
+    """
+    In-memory prefix trie over job titles, category names, company names and
+    township labels. Entries carry a popularity weight (number of live jobs
+    behind them) and a query returns the top-k entries under the prefix.
+
+    Job saves/deletes in this process are applied incrementally from signals;
+    category/company renames and writes made by other workers are picked up by
+    a full rebuild at most every ``rebuild_seconds``. Rebuilds read the
+    database outside the lock and swap the new trie in, so queries keep being
+    answered from the old one meanwhile.
+    """
+
+    def __init__(self, rebuild_seconds=300):
+        self.rebuild_seconds = rebuild_seconds
+        self._lock = threading.Lock()
+        #held for the whole of a rebuild so only one runs at a time
+        self._rebuild_lock = threading.Lock()
+        self._trie = None
+        self._built_at = None
+        #job updates that arrive while a rebuild is reading the database
+        self._replay = None
+
+    # --- building --------------------------------------------------------
+
+    @staticmethod
+    def _job_entries_for(title, location, location_label, category_name, business_name):
+        entries = []
+        if title:
+            entries.append((("title", title.strip()), None))
+        if category_name:
+            entries.append((("category", category_name), None))
+        if business_name:
+            entries.append((("company", business_name), None))
+        if location:
+            entries.append((("location", location_label), location))
+        return entries
+
+    def _build(self):
+        today = timezone.localdate()
+        labels = dict(Jobs.LOCATION_CHOICES)
+        trie = _Trie()
+        #base weight of 1 so every township / category / company is suggestable
+        for code, label in Jobs.LOCATION_CHOICES:
+            trie.bump(("location", label), 1, code, incremental=False)
+        for name in JobCategory.objects.values_list("name", flat=True):
+            trie.bump(("category", name), 1, incremental=False)
+        for name in EmployerProfile.objects.values_list("business_name", flat=True):
+            if name:
+                trie.bump(("company", name), 1, incremental=False)
+        live = (
+            Jobs.objects.filter(is_active=True)
+            .filter(Q(deadline__isnull=True) | Q(deadline__gte=today))
+            .values_list("id", "title", "location", "category__name", "employer__business_name")
+        )
+        for job_id, title, location, category_name, business_name in live.iterator():
+            trie.add_job(job_id, self._job_entries_for(
+                title, location, labels.get(location, location), category_name, business_name
+            ), incremental=False)
+        trie.fill_tops()
+        return trie
+
+    def rebuild(self):
+        with self._rebuild_lock:
+            self._rebuild()
+
+    def _rebuild(self):
+        #caller holds _rebuild_lock; only the swap at the end takes _lock
+        with self._lock:
+            self._replay = []
+        try:
+            trie = self._build()
+        except Exception:
+            with self._lock:
+                self._replay = None
+            raise
+        with self._lock:
+            for change in self._replay:
+                change(trie)
+            self._replay = None
+            self._trie = trie
+            self._built_at = time.monotonic()
+
+    def _stale(self):
+        return self._built_at is None or time.monotonic() - self._built_at > self.rebuild_seconds
+
+    def _ensure_fresh(self):
+        with self._lock:
+            built = self._trie is not None
+            stale = self._stale()
+        if not stale:
+            return
+        if not built:
+            #nothing to serve yet: wait for (or run) the first build
+            with self._rebuild_lock:
+                if self._trie is None:
+                    self._rebuild()
+        elif self._rebuild_lock.acquire(blocking=False):
+            #one request refreshes while the rest keep reading the current trie
+            try:
+                if self._stale():
+                    self._rebuild()
+            finally:
+                self._rebuild_lock.release()
+
+    # --- signal hooks ----------------------------------------------------
+
+    def _apply(self, change):
+        with self._lock:
+            if self._trie is not None:
+                change(self._trie)
+            if self._replay is not None:
+                self._replay.append(change)
+
+    def update_job(self, job):
+        today = timezone.localdate()
+        live = job.is_active and (job.deadline is None or job.deadline >= today)
+        job_id = job.pk
+        if not live:
+            self._apply(lambda trie: trie.remove_job(job_id))
+            return
+        entries = self._job_entries_for(
+            job.title,
+            job.location,
+            job.get_location_display() if job.location else "",
+            job.category.name if job.category_id else None,
+            job.employer.business_name if job.employer_id else None,
+        )
+        self._apply(lambda trie: trie.add_job(job_id, entries))
+
+    def remove_job(self, job_id):
+        self._apply(lambda trie: trie.remove_job(job_id))
+
+    def invalidate(self):
+        #rebuilt on the next query; the current trie keeps answering until then
+        with self._lock:
+            self._built_at = None
+
+    # --- querying --------------------------------------------------------
+
+    def suggest(self, prefix, limit=10):
+        key = " ".join(split_words(prefix))
+        if not key:
+            return []
+        self._ensure_fresh()
+        with self._lock:
+            trie = self._trie
+            top = trie.top(key, limit)
+            return [
+                {
+                    "type": kind,
+                    "label": label,
+                    "value": trie.values.get((kind, label), label),
+                    "weight": trie.weights[(kind, label)],
+                }
+                for kind, label in top
+            ]
+
+
+autocomplete_index = AutocompleteIndex(getattr(settings, "JOBS_AUTOCOMPLETE_REBUILD_SECONDS", 300))
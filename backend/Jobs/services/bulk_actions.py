@@ -0,0 +1,94 @@
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import Count, DateField, ExpressionWrapper, F, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from Application.models import Application
+from Jobs.models import Jobs
+from Jobs.services.autocomplete import autocomplete_index
+from Jobs.services.detail_cache import invalidate_job_details
+from Jobs.services.result_cache import bump_catalogue_version
+
+ACTIONS = ("close", "reopen", "extend", "priority")
+
+
+def scoped_jobs(user):
+    if user.is_staff:
+        return Jobs.objects.all()
+    return Jobs.objects.filter(employer__user=user)
+
+
+def jobs_with_room(job_ids):
+    """
+    Split ``job_ids`` by the jobs_update reactivation rule (no limit, or fewer
+    applications than max_applicants), counting applications with one
+    grouped query rather than per job.
+    """
+    counts = dict(
+        Application.objects.filter(job_id__in=job_ids)
+        .values("job_id")
+        .annotate(n=Count("id"))
+        .values_list("job_id", "n")
+    )
+    room, full = [], []
+    for job_id, max_applicants in Jobs.objects.filter(id__in=job_ids).values_list("id", "max_applicants"):
+        if not max_applicants or counts.get(job_id, 0) < max_applicants:
+            room.append(job_id)
+        else:
+            full.append(job_id)
+    return room, full
+
+
+def apply_bulk_action(user, job_ids, action, deadline=None, days=None, priority=None):
+    """
+    Apply ``action`` to the caller's jobs among ``job_ids`` with set-based
+    UPDATEs. Returns {"updated": n, "skipped": [...], "not_found": [...]}.
+
+    close    is_active = False
+    reopen   is_active = True, only for jobs with applicant room
+    extend   deadline = ``deadline`` or old deadline (today if none) + ``days``,
+             then reactivates the extended jobs that have room
+    priority priority = ``priority``
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        owned = list(scoped_jobs(user).filter(id__in=job_ids).values_list("id", flat=True))
+        found = set(owned)
+        result = {
+            "updated": 0,
+            "skipped": [],
+            "not_found": [str(job_id) for job_id in job_ids if job_id not in found],
+        }
+        if not owned:
+            return result
+        jobs = Jobs.objects.filter(id__in=owned)
+
+        if action == "close":
+            result["updated"] = jobs.update(is_active=False, updated_at=now)
+        elif action == "priority":
+            result["updated"] = jobs.update(priority=priority, updated_at=now)
+        elif action == "reopen":
+            room, full = jobs_with_room(owned)
+            result["updated"] = Jobs.objects.filter(id__in=room).update(is_active=True, updated_at=now)
+            result["skipped"] = [{"id": str(job_id), "reason": "max_applicants reached"} for job_id in full]
+        elif action == "extend":
+            if deadline is not None:
+                new_deadline = Value(deadline)
+            else:
+                new_deadline = ExpressionWrapper(
+                    Coalesce(F("deadline"), Value(timezone.localdate())) + timedelta(days=days),
+                    output_field=DateField(),
+                )
+            result["updated"] = jobs.update(deadline=new_deadline, updated_at=now)
+            #same rule as jobs_update: an extended job with applicant room goes live again
+            room, _ = jobs_with_room(owned)
+            Jobs.objects.filter(id__in=room, is_active=False).update(is_active=True, updated_at=now)
+        else:
+            raise ValueError(f"Unknown action {action!r}")
+
+        #.update() sends no post_save, so invalidate what those receivers would have
+        transaction.on_commit(bump_catalogue_version)
+        transaction.on_commit(autocomplete_index.invalidate)
+        transaction.on_commit(lambda: invalidate_job_details(owned))
+    return result
@@ -0,0 +1,158 @@
+import codecs
+import csv
+import io
+import json
+from itertools import islice
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Q
+
+from JobSeeker.normalize import compact_text
+from Jobs.models import Jobs, JobCategory
+from Jobs.serializers import JobImportSerializer, category_lookup_key
+from Jobs.signals import jobs_bulk_created
+
+BATCH_SIZE = getattr(settings, "JOBS_IMPORT_BATCH_SIZE", 200)
+MAX_ROWS = getattr(settings, "JOBS_IMPORT_MAX_ROWS", 5000)
+
+FORMATS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+
+class JobImportError(ValueError):
+    pass
+
+
+def detect_format(upload):
+    name = (upload.name or "").lower()
+    for suffix, fmt in FORMATS.items():
+        if name.endswith(suffix):
+            return fmt
+    raise JobImportError("Upload a .csv or .jsonl file.")
+
+
+def check_encoding(upload):
+    """
+    Raise JobImportError unless the whole upload is UTF-8. Runs chunk by chunk
+    before any row is imported, so a bad file inserts nothing.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        for chunk in upload.chunks():
+            decoder.decode(chunk)
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError as exc:
+        raise JobImportError(f"The file must be UTF-8 encoded (byte {exc.start} of a chunk is not).")
+    finally:
+        upload.seek(0)
+
+
+def iter_rows(upload, fmt):
+    """
+    Yield (row_number, data, error) one row at a time from the upload; the
+    file is read as a stream and never loaded whole. A CSV the csv module
+    cannot parse (NUL byte, over-long field) ends with an error for the row
+    it stopped at.
+    """
+    text = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+    if fmt == "csv":
+        number = 0
+        try:
+            for number, row in enumerate(csv.DictReader(text), start=1):
+                #empty cells mean "not given", so model defaults apply
+                yield number, {k.strip(): v for k, v in row.items() if k and v not in ("", None)}, None
+        except csv.Error as exc:
+            yield number + 1, None, {"non_field_errors": [f"Unreadable CSV, import stopped here: {exc}"]}
+        return
+    number = 0
+    for line in text:
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            data = json.loads(line)
+        except ValueError as exc:
+            yield number, None, {"non_field_errors": [f"Invalid JSON: {exc}"]}
+            continue
+        if not isinstance(data, dict):
+            yield number, None, {"non_field_errors": ["Each line must be a JSON object."]}
+            continue
+        yield number, data, None
+
+
+def _batches(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _categories_for(rows, user):
+    """{lookup key: JobCategory} for every id / name referenced by the batch, in one query."""
+    values = {str(data["category"]) for _, data, _ in rows if data and data.get("category") not in (None, "")}
+    if not values:
+        return {}
+    names = {category_lookup_key(value) for value in values}
+    condition = Q(name_search__in=names) & (Q(user=user) | Q(user__isnull=True))
+    ids = set()
+    for value in values:
+        try:
+            ids.add(JobCategory._meta.pk.to_python(value))
+        except ValidationError:
+            continue
+    if ids:
+        condition |= Q(id__in=ids)
+    found = {}
+    #the caller's own category wins when a name exists more than once
+    for category in sorted(JobCategory.objects.filter(condition), key=lambda c: c.user_id != user.pk):
+        found.setdefault(category_lookup_key(category.pk), category)
+        found.setdefault(category.name_search, category)
+    return found
+
+
+def import_jobs(upload, employer, user):
+    """
+    Validate and insert the jobs in ``upload`` for ``employer``.
+
+    Rows are validated with JobsSerializer rules in batches of BATCH_SIZE
+    (categories preloaded per batch) and every batch's valid rows go in with
+    one bulk_create. Returns {"created": n, "failed": n, "errors": [...]}
+    where each error carries its 1-based row number.
+    """
+    fmt = detect_format(upload)
+    check_encoding(upload)
+    rows = iter_rows(upload, fmt)
+    created, errors = 0, []
+    for batch in _batches(islice(rows, MAX_ROWS), BATCH_SIZE):
+        context = {"categories": _categories_for(batch, user)}
+        jobs = []
+        for number, data, error in batch:
+            if error is None:
+                serializer = JobImportSerializer(data=data, context=context)
+                if serializer.is_valid():
+                    job = Jobs(**serializer.validated_data, employer=employer)
+                    job.title_search = compact_text(job.title)
+                    jobs.append(job)
+                    continue
+                error = serializer.errors
+            errors.append({"row": number, "errors": error})
+        if jobs:
+            with transaction.atomic():
+                Jobs.objects.bulk_create(jobs)
+                #post_save does not fire for bulk_create: one signal per batch instead
+                jobs_bulk_created.send(sender=Jobs, jobs=jobs, employer=employer)
+            created += len(jobs)
+    if next(rows, None) is not None:
+        errors.append({
+            "row": MAX_ROWS + 1,
+            "errors": {"non_field_errors": [f"Only the first {MAX_ROWS} rows of a file are imported."]},
+        })
+    return {"created": created, "failed": len(errors), "errors": errors}
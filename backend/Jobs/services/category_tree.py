@@ -0,0 +1,64 @@
+from django.db import transaction
+
+from Jobs.models import JobCategory, JobCategoryClosure
+
+
+def place_category(category):
+    """
+    Bring the closure rows of ``category`` and its subtree in line with its
+    current parent. New categories get their self row; a category moved to a
+    new parent has its whole subtree re-linked in two statements.
+    """
+    with transaction.atomic():
+        links = JobCategoryClosure.objects.filter(descendant=category, depth__lte=1)
+        current = {depth: ancestor_id for ancestor_id, depth in links.values_list("ancestor_id", "depth")}
+        if 0 in current and current.get(1) == category.parent_id:
+            return
+        if 0 not in current:
+            JobCategoryClosure.objects.create(ancestor=category, descendant=category, depth=0)
+
+        subtree = list(JobCategoryClosure.objects.filter(ancestor=category).values_list("descendant_id", "depth"))
+        subtree_ids = [descendant_id for descendant_id, _ in subtree]
+        if category.parent_id in subtree_ids:
+            raise ValueError("A category cannot be nested under itself or one of its descendants.")
+
+        JobCategoryClosure.objects.filter(descendant_id__in=subtree_ids).exclude(ancestor_id__in=subtree_ids).delete()
+        if category.parent_id is None:
+            return
+        ancestors = JobCategoryClosure.objects.filter(descendant_id=category.parent_id).values_list("ancestor_id", "depth")
+        JobCategoryClosure.objects.bulk_create([
+            JobCategoryClosure(ancestor_id=ancestor_id, descendant_id=descendant_id, depth=up + down + 1)
+            for ancestor_id, up in ancestors
+            for descendant_id, down in subtree
+        ])
+
+
+def detach_category(category):
+    # parent is SET_NULL, so the children become roots: drop every path that
+    # runs through the deleted category; its own rows go with the FK cascade
+    subtree = JobCategoryClosure.objects.filter(ancestor=category, depth__gt=0).values("descendant_id")
+    above = JobCategoryClosure.objects.filter(descendant=category, depth__gt=0).values("ancestor_id")
+    JobCategoryClosure.objects.filter(descendant_id__in=subtree, ancestor_id__in=above).delete()
+
+
+def closure_rows(parents):
+    """All (ancestor, descendant, depth) triples for a {category_id: parent_id} map."""
+    rows = []
+    for category_id in parents:
+        node, depth, seen = category_id, 0, set()
+        while node is not None and node not in seen:
+            rows.append((node, category_id, depth))
+            seen.add(node)
+            node, depth = parents.get(node), depth + 1
+    return rows
+
+
+def rebuild_closure():
+    parents = dict(JobCategory.objects.values_list("id", "parent_id"))
+    with transaction.atomic():
+        JobCategoryClosure.objects.all().delete()
+        JobCategoryClosure.objects.bulk_create(
+            [JobCategoryClosure(ancestor_id=a, descendant_id=d, depth=depth) for a, d, depth in closure_rows(parents)],
+            batch_size=1000,
+        )
+    return len(parents)
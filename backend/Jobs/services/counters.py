@@ -0,0 +1,95 @@
+import atexit
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from django.conf import settings
+from django.db import DatabaseError
+from django.db.models import F
+
+from Jobs.models import Jobs
+
+logger = logging.getLogger(__name__)
+
+#seconds between flushes; 0 writes every increment straight through
+FLUSH_INTERVAL = getattr(settings, "JOBS_COUNTER_FLUSH_INTERVAL", 30)
+#loss tolerance: most increments a crashed process may take with it before a flush is forced
+MAX_PENDING = getattr(settings, "JOBS_COUNTER_MAX_PENDING", 1000)
+
+FIELDS = ("view_count", "impression_count")
+
+
+class CounterBuffer:
+    """
+    Write-behind buffer for Jobs view / impression counters.
+
+    Increments add up in process memory and are written every FLUSH_INTERVAL
+    seconds, or once MAX_PENDING are waiting, as one
+    ``UPDATE ... SET field = field + n WHERE id IN (...)`` per (field, n).
+    Whatever is still buffered when the process dies is lost, which is the
+    trade for not writing on every page view.
+    """
+
+    def __init__(self, flush_interval=FLUSH_INTERVAL, max_pending=MAX_PENDING):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._pending = Counter()
+        self._total = 0
+        self._last_flush = time.monotonic()
+
+    def add(self, field, job_ids):
+        if field not in FIELDS:
+            raise ValueError(f"Unknown counter {field!r}")
+        with self._lock:
+            for job_id in job_ids:
+                #serialized rows carry str ids, querysets UUIDs
+                self._pending[field, str(job_id)] += 1
+                self._total += 1
+            due = (
+                self._total >= self.max_pending
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        if due:
+            self.flush()
+
+    def pending(self):
+        with self._lock:
+            return self._total
+
+    def flush(self):
+        """Write everything buffered; returns the number of UPDATE statements."""
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+            self._total = 0
+            self._last_flush = time.monotonic()
+        if not pending:
+            return 0
+        #jobs with the same increment share one statement
+        groups = defaultdict(list)
+        for (field, job_id), n in pending.items():
+            groups[field, n].append(job_id)
+        statements = 0
+        for (field, n), job_ids in groups.items():
+            try:
+                Jobs.objects.filter(id__in=job_ids).update(**{field: F(field) + n})
+                statements += 1
+            except DatabaseError:
+                logger.exception("Flushing %s failed, keeping it for the next flush", field)
+                with self._lock:
+                    for job_id in job_ids:
+                        self._pending[field, job_id] += n
+                    self._total += n * len(job_ids)
+        return statements
+
+
+job_counters = CounterBuffer()
+atexit.register(job_counters.flush)
+
+
+def record_views(job_ids):
+    job_counters.add("view_count", job_ids)
+
+
+def record_impressions(job_ids):
+    job_counters.add("impression_count", job_ids)
@@ -0,0 +1,108 @@
+import threading
+import time
+import uuid
+from django.conf import settings
+from django.core.cache import cache
+
+from Jobs.services.result_cache import version_cache
+
+CACHE_TIMEOUT = getattr(settings, "JOBS_DETAIL_CACHE_TIMEOUT", 10 * 60)
+#longest a request waits for another worker's rebuild before doing its own
+LOCK_TIMEOUT = getattr(settings, "JOBS_DETAIL_LOCK_TIMEOUT", 5)
+POLL_INTERVAL = 0.05
+
+
+def _version_key(job_id):
+    return f"jobs:detail:version:{job_id}"
+
+
+def job_version(job_id):
+    versions = version_cache()
+    version = versions.get(_version_key(job_id))
+    if version is None:
+        versions.add(_version_key(job_id), uuid.uuid4().hex, timeout=None)
+        version = versions.get(_version_key(job_id))
+    return version
+
+
+def invalidate_job_details(job_ids):
+    #a fresh token per job: a rebuild that raced the change writes under the old key, which is never read again
+    version_cache().set_many({_version_key(job_id): uuid.uuid4().hex for job_id in job_ids}, timeout=None)
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        #set when the leader's build raised; waiters raise it too instead of returning None
+        self.error = None
+
+
+class DetailCache:
+    """
+    Serialized job payloads keyed on a per-job version token, with
+    single-flight rebuilds: concurrent misses for one job inside a process
+    wait on the first request's build, and across processes a cache.add()
+    lock lets one worker rebuild while the others poll for its result.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.builds = 0
+
+    def get(self, job_id, build):
+        """
+        Cached payload for ``job_id``, or ``build()`` run once for all waiting
+        requests (None is not cached). If that build raises, every request
+        waiting on it raises the same exception.
+        """
+        key = f"jobs:detail:{job_id}:{job_version(job_id)}"
+        payload = cache.get(key)
+        if payload is not None:
+            return payload
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            if flight.done.wait(LOCK_TIMEOUT):
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result
+            return build()
+        try:
+            flight.result = self._build(key, build)
+            return flight.result
+        except Exception as exc:
+            flight.error = exc
+            raise
+        finally:
+            flight.done.set()
+            with self._lock:
+                self._flights.pop(key, None)
+
+    def _build(self, key, build):
+        lock_key = f"{key}:lock"
+        locked = cache.add(lock_key, 1, LOCK_TIMEOUT)
+        if not locked:
+            deadline = time.monotonic() + LOCK_TIMEOUT
+            while time.monotonic() < deadline:
+                time.sleep(POLL_INTERVAL)
+                payload = cache.get(key)
+                if payload is not None:
+                    return payload
+            #the other worker died or is slow: build anyway rather than fail
+        try:
+            self.builds += 1
+            payload = build()
+            if payload is not None:
+                cache.set(key, payload, CACHE_TIMEOUT)
+            return payload
+        finally:
+            if locked:
+                cache.delete(lock_key)
+
+
+job_details = DetailCache()
@@ -0,0 +1,55 @@
+from collections import defaultdict
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.utils import timezone
+
+from Jobs.models import Jobs
+from Notification.models import Notification
+from Jobs.services.detail_cache import invalidate_job_details
+from Jobs.services.result_cache import bump_catalogue_version
+
+#how many titles to list in the per-employer notification
+TITLES_IN_MESSAGE = 5
+
+
+def expire_due_jobs(today=None):
+    """
+    Deactivate every active job whose deadline has passed, in one UPDATE,
+    and send each affected employer a single notification for the batch.
+    Returns the number of jobs closed.
+    """
+    today = today or timezone.localdate()
+    due = Jobs.objects.filter(is_active=True, deadline__lt=today)
+    rows = list(due.values_list("id", "title", "employer__user_id"))
+    if not rows:
+        return 0
+
+    job_ids = [job_id for job_id, _, _ in rows]
+    with transaction.atomic():
+        closed = Jobs.objects.filter(id__in=job_ids, is_active=True).update(
+            is_active=False, updated_at=timezone.now()
+        )
+        #.update() sends no post_save, so the cached detail payloads are dropped here
+        transaction.on_commit(lambda: invalidate_job_details(job_ids))
+
+        by_employer = defaultdict(list)
+        for _, title, user_id in rows:
+            if user_id:
+                by_employer[user_id].append(title or "Untitled job")
+
+        content_type = ContentType.objects.get_for_model(Jobs)
+        notifications = []
+        for user_id, titles in by_employer.items():
+            listed = ", ".join(f"'{t}'" for t in titles[:TITLES_IN_MESSAGE])
+            more = len(titles) - TITLES_IN_MESSAGE
+            if more > 0:
+                listed += f" and {more} more"
+            notifications.append(Notification(
+                user_id=user_id,
+                message=f"{len(titles)} job(s) passed their deadline and were closed: {listed}.",
+                type="job_expired",
+                content_type=content_type,
+            ))
+        Notification.objects.bulk_create(notifications)
+    bump_catalogue_version()
+    return closed
@@ -0,0 +1,118 @@
+import json
+import math
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.db.models import Count, Max, Q
+from django.utils.feedgenerator import rfc2822_date
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+from Jobs.models import Jobs
+from Jobs.services.job_alerts import job_url
+
+#sitemap protocol limit per file
+SITEMAP_MAX_URLS = 50000
+CHUNK_SIZE = getattr(settings, "JOBS_FEED_CHUNK_SIZE", 2000)
+FEED_TITLE = "Arakkha Job Connect"
+SUMMARY_WORDS = 60
+
+FEED_FIELDS = (
+    "id", "title", "description", "location", "job_type", "created_at", "updated_at",
+    "category__name", "employer__business_name",
+)
+
+
+def live_jobs(today):
+    return Jobs.objects.filter(is_active=True).filter(Q(deadline__isnull=True) | Q(deadline__gte=today))
+
+
+def feed_state(today):
+    """(latest updated_at, count) of the live catalogue, the validators for sitemap and feeds."""
+    state = live_jobs(today).aggregate(n=Count("id"), last=Max("updated_at"))
+    return state["last"], state["n"]
+
+
+def sitemap_sections(count):
+    return max(1, math.ceil(count / SITEMAP_MAX_URLS))
+
+
+def _site():
+    return settings.SITE_URL.rstrip("/")
+
+
+def sitemap_index(section_url, sections, last_modified):
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    lastmod = f"<lastmod>{last_modified.date().isoformat()}</lastmod>" if last_modified else ""
+    for section in range(1, sections + 1):
+        yield f"<sitemap><loc>{escape(section_url(section))}</loc>{lastmod}</sitemap>\n"
+    yield "</sitemapindex>\n"
+
+
+def sitemap_section(today, section):
+    """URLs of one sitemap file: SITEMAP_MAX_URLS live jobs, oldest first so files stay stable."""
+    start = (section - 1) * SITEMAP_MAX_URLS
+    rows = (
+        live_jobs(today).order_by("created_at", "id")
+        .values_list("id", "updated_at")[start:start + SITEMAP_MAX_URLS]
+    )
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    if section == 1:
+        yield f"<url><loc>{escape(_site())}/</loc><changefreq>hourly</changefreq></url>\n"
+    for job_id, updated_at in rows.iterator(chunk_size=CHUNK_SIZE):
+        lastmod = f"<lastmod>{updated_at.date().isoformat()}</lastmod>" if updated_at else ""
+        yield f"<url><loc>{escape(job_url(job_id))}</loc>{lastmod}</url>\n"
+    yield "</urlset>\n"
+
+
+def _feed_rows(today):
+    rows = live_jobs(today).order_by("-created_at", "-id").values(*FEED_FIELDS)
+    for row in rows.iterator(chunk_size=CHUNK_SIZE):
+        row["summary"] = Truncator(strip_tags(row["description"] or "")).words(SUMMARY_WORDS)
+        yield row
+
+
+def rss_feed(today, self_url):
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom"><channel>\n'
+    yield f"<title>{escape(FEED_TITLE)}</title><link>{escape(_site())}/</link>"
+    yield f'<description>Latest jobs</description><atom:link href="{escape(self_url)}" rel="self" type="application/rss+xml"/>\n'
+    for row in _feed_rows(today):
+        url = escape(job_url(row["id"]))
+        yield "<item>"
+        yield f"<title>{escape(row['title'] or '')}</title><link>{url}</link><guid>{url}</guid>"
+        yield f"<description>{escape(row['summary'])}</description>"
+        if row["created_at"]:
+            yield f"<pubDate>{rfc2822_date(row['created_at'])}</pubDate>"
+        if row["category__name"]:
+            yield f"<category>{escape(row['category__name'])}</category>"
+        yield "</item>\n"
+    yield "</channel></rss>\n"
+
+
+def json_feed(today, self_url):
+    """JSON Feed 1.1, written item by item so the document is never built whole."""
+    header = {
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": FEED_TITLE,
+        "home_page_url": f"{_site()}/",
+        "feed_url": self_url,
+    }
+    yield json.dumps(header)[:-1] + ', "items": ['
+    separator = ""
+    for row in _feed_rows(today):
+        item = {
+            "id": str(row["id"]),
+            "url": job_url(row["id"]),
+            "title": row["title"] or "",
+            "summary": row["summary"],
+            "date_published": row["created_at"].isoformat() if row["created_at"] else None,
+            "date_modified": row["updated_at"].isoformat() if row["updated_at"] else None,
+            "tags": [tag for tag in (row["category__name"], row["location"], row["job_type"]) if tag],
+            "authors": [{"name": row["employer__business_name"]}] if row["employer__business_name"] else [],
+        }
+        yield separator + json.dumps(item, ensure_ascii=False)
+        separator = ","
+    yield "]}\n"
@@ -0,0 +1,93 @@
+from django.conf import settings
+from django.utils import timezone
+
+from JobSeekerProfile.models import SavedSearch, SeekerCategoryInterest
+from Jobs.services.saved_search import matching_saved_searches
+from Notification.outbox import queue_emails
+
+NEW_JOB_SUBJECT = "New job you may be interested in"
+NEW_JOB_TEMPLATE = "emails/new_job_notification.html"
+SAVED_SEARCH_SUBJECT = "New jobs matching your saved search"
+SAVED_SEARCH_TEMPLATE = "emails/saved_search_alert.html"
+
+
+def job_url(job_id):
+    return f"{settings.SITE_URL.rstrip('/')}/jobs/{job_id}/"
+
+
+def queue_new_job_emails(jobs):
+    """
+    Queue "new job" emails for seekers who applied in the same category.
+    One indexed lookup on the category interest table for the whole batch
+    and one bulk INSERT into the outbox.
+    """
+    jobs = [job for job in jobs if job.category_id]
+    if not jobs:
+        return []
+    seekers = (
+        SeekerCategoryInterest.objects
+        .filter(category_id__in={job.category_id for job in jobs})
+        .values_list("category_id", "profile__full_name", "profile__user__email")
+    )
+    by_category = {}
+    for category_id, full_name, email in seekers:
+        by_category.setdefault(category_id, []).append((full_name, email))
+
+    year = timezone.now().year
+    emails = []
+    for job in jobs:
+        for full_name, email in by_category.get(job.category_id, []):
+            emails.append({
+                "to_email": email,
+                "subject": NEW_JOB_SUBJECT,
+                "template": NEW_JOB_TEMPLATE,
+                "context": {
+                    "full_name": full_name,
+                    "job_title": job.title,
+                    "category_name": job.category.name,
+                    "job_url": job_url(job.id),
+                    "year": year,
+                },
+            })
+    return queue_emails(emails)
+
+
+def queue_saved_search_alerts(jobs):
+    """
+    Queue saved-search alerts for new ``jobs``: one email per seeker listing
+    every job of the batch that matched any of their saved searches, and one
+    bulk INSERT into the outbox.
+    """
+    matches = matching_saved_searches(jobs)
+    if not matches:
+        return []
+    searches = {
+        search_id: (name, full_name, email)
+        for search_id, name, full_name, email in SavedSearch.objects.filter(
+            id__in={search_id for found in matches.values() for search_id in found}
+        ).values_list("id", "name", "profile__full_name", "profile__user__email")
+    }
+    by_seeker = {}
+    for job, found in matches.items():
+        for search_id in found:
+            name, full_name, email = searches[search_id]
+            seeker = by_seeker.setdefault(email, {"full_name": full_name, "jobs": {}, "searches": set()})
+            seeker["jobs"].setdefault(job.id, {"job_title": job.title, "job_url": job_url(job.id)})
+            seeker["searches"].add(name or "Saved search")
+    SavedSearch.objects.filter(id__in=searches).update(last_alerted_at=timezone.now())
+
+    year = timezone.now().year
+    return queue_emails(
+        {
+            "to_email": email,
+            "subject": SAVED_SEARCH_SUBJECT,
+            "template": SAVED_SEARCH_TEMPLATE,
+            "context": {
+                "full_name": seeker["full_name"],
+                "search_names": sorted(seeker["searches"]),
+                "jobs": list(seeker["jobs"].values()),
+                "year": year,
+            },
+        }
+        for email, seeker in by_seeker.items()
+    )
@@ -0,0 +1,93 @@
+import math
+from django.conf import settings
+from django.db.models import Q
+
+from Jobs.models import JobSearchTerm, SearchFieldStat, SearchTermStat
+from Jobs.services.search_index import TERM_MAX_LENGTH, split_words
+
+K1 = 1.2
+B = 0.75
+
+#field boosts; location terms filter but do not score
+FIELD_BOOSTS = getattr(settings, "JOBS_RELEVANCE_FIELD_BOOSTS", {
+    "title": 3.0,
+    "category": 2.0,
+    "description": 1.0,
+})
+
+#paid placement still counts, as a multiplier on the text score
+PRIORITY_BOOSTS = getattr(settings, "JOBS_RELEVANCE_PRIORITY_BOOSTS", {
+    "FEATURED": 1.3,
+    "URGENT": 1.15,
+    "NORMAL": 1.0,
+})
+
+
+def query_words(q):
+    words = [w[:TERM_MAX_LENGTH] for w in split_words(q)]
+    if len(words) > 1:
+        words.append("".join(words)[:TERM_MAX_LENGTH])
+    return words
+
+
+def _term_weight(frequency, field_length, doc_freq, field_docs, avg_length):
+    idf = math.log(1 + (max(field_docs - doc_freq, 0) + 0.5) / (doc_freq + 0.5))
+    norm = K1 * (1 - B + B * field_length / avg_length)
+    return idf * frequency * (K1 + 1) / (frequency + norm)
+
+
+def rank_jobs(q, job_ids, limit=30):
+    """
+    [(job_id, score), ...] best first for the jobs in ``job_ids`` (a values("id")
+    queryset), scored by BM25 over title, category and description with
+    FIELD_BOOSTS, then multiplied by the job's PRIORITY_BOOSTS entry.
+
+    Reads only the matching postings of the candidates plus the maintained
+    SearchTermStat / SearchFieldStat rows for those terms.
+    """
+    words = query_words(q)
+    if not words:
+        return []
+    match = Q()
+    for word in words:
+        match |= Q(term__startswith=word)
+    postings = list(
+        JobSearchTerm.objects.filter(match, job_id__in=job_ids, field__in=FIELD_BOOSTS).values_list(
+            "job_id", "field", "term", "frequency", "field_length", "job__priority", "job__created_at"
+        )
+    )
+    if not postings:
+        return []
+    doc_freqs = {
+        (field, term): doc_count
+        for field, term, doc_count in SearchTermStat.objects.filter(
+            field__in=FIELD_BOOSTS, term__in={posting[2] for posting in postings}
+        ).values_list("field", "term", "doc_count")
+    }
+    corpus = {
+        field: (max(docs, 1), total / docs if docs and total else 1.0)
+        for field, docs, total in SearchFieldStat.objects.values_list("field", "doc_count", "total_length")
+    }
+
+    #each query word counts once per field: its best-scoring matching term
+    best = {}
+    jobs = {}
+    for job_id, field, term, frequency, field_length, priority, created_at in postings:
+        field_docs, avg_length = corpus.get(field, (1, 1.0))
+        weight = _term_weight(frequency, field_length, doc_freqs.get((field, term), 1), field_docs, avg_length)
+        jobs[job_id] = (priority, created_at.timestamp() if created_at else 0)
+        for word in words:
+            if term.startswith(word) and weight > best.get((job_id, word, field), 0):
+                best[job_id, word, field] = weight
+
+    scores = dict.fromkeys(jobs, 0.0)
+    for (job_id, _, field), weight in best.items():
+        scores[job_id] += FIELD_BOOSTS[field] * weight
+    ranked = sorted(
+        (
+            (job_id, round(score * PRIORITY_BOOSTS.get(jobs[job_id][0], 1.0), 4))
+            for job_id, score in scores.items()
+        ),
+        key=lambda item: (-item[1], -jobs[item[0]][1]),
+    )
+    return ranked[:limit]
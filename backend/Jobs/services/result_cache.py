@@ -0,0 +1,105 @@
+import threading
+import uuid
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import caches
+
+CATALOGUE_VERSION_KEY = "jobs:catalogue-version"
+#alias holding version tokens, kept apart from payloads so culling can't evict them
+VERSION_CACHE = getattr(settings, "JOBS_VERSION_CACHE", "default")
+
+
+def version_cache():
+    return caches[VERSION_CACHE]
+
+
+def catalogue_version():
+    """
+    Token that changes whenever jobs, categories or employers change.
+    Cached results are keyed on it, so invalidation is one cache write and
+    stale entries simply stop being looked up and age out of the LRU.
+    """
+    cache = version_cache()
+    version = cache.get(CATALOGUE_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOGUE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(CATALOGUE_VERSION_KEY)
+    return version
+
+
+def bump_catalogue_version():
+    #a fresh token (not a counter) so an evicted key can never resurrect old entries
+    version_cache().set(CATALOGUE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+class LRUCache:
+    """Small thread-safe in-process LRU with hit/miss/eviction counters."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+search_results = LRUCache(getattr(settings, "JOBS_RESULT_CACHE_SIZE", 512))
+
+
+def request_role(user):
+    if user.is_staff:
+        return "staff"
+    if hasattr(user, "employerprofile"):
+        return "employer"
+    if user.is_authenticated:
+        return "seeker"
+    return "anonymous"
+
+
+def cached_result(key, build):
+    """
+    Return the cached payload for ``key`` under the current catalogue
+    version, calling ``build()`` (which returns the payload) on a miss.
+    """
+    key = (catalogue_version(),) + tuple(key)
+    data = search_results.get(key)
+    if data is None:
+        data = build()
+        search_results.set(key, data)
+    return data
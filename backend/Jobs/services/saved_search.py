@@ -0,0 +1,186 @@
+from collections import defaultdict
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from JobSeeker.normalize import compact_text
+from Jobs.models import Jobs, JobCategoryClosure
+from Jobs.services.search_index import TERM_MAX_LENGTH, job_term_counts, search_filter, split_words
+from JobSeekerProfile.models import SavedSearch, SavedSearchPredicate
+
+
+def search_predicates(saved):
+    """
+    [(group, kind, value)] for a saved search: every q word is its own group,
+    loc codes share one. A multi-word q also puts the words joined without
+    spaces in every word group, the alternative search_filter accepts, and a
+    non-ASCII word adds a "gram" row (not counted as a group) for the
+    substring match.
+    """
+    rows = []
+    words = list(dict.fromkeys(w[:TERM_MAX_LENGTH] for w in split_words(saved.q)))
+    phrase = "".join(words)[:TERM_MAX_LENGTH] if len(words) > 1 else None
+    for group, word in enumerate(words):
+        rows.append((group, "word", word))
+        if phrase and phrase != word:
+            rows.append((group, "word", phrase))
+        gram = word_gram(word)
+        if gram:
+            rows.append((group, "gram", gram))
+    group = len(words)
+    if saved.loc:
+        codes = Jobs.locations.resolve(saved.loc)
+        rows.extend((group, "location", code) for code in codes)
+        group += 1
+    if saved.category_id:
+        rows.append((group, "category", str(saved.category_id)))
+        group += 1
+    if saved.job_type:
+        rows.append((group, "job_type", saved.job_type))
+        group += 1
+    return rows, group
+
+
+def index_saved_search(saved):
+    rows, groups = search_predicates(saved)
+    with transaction.atomic():
+        SavedSearchPredicate.objects.filter(saved_search=saved).delete()
+        SavedSearchPredicate.objects.bulk_create(
+            SavedSearchPredicate(saved_search=saved, group=group, kind=kind, value=value)
+            for group, kind, value in rows
+        )
+        SavedSearch.objects.filter(pk=saved.pk).update(predicate_count=groups)
+    saved.predicate_count = groups
+
+
+def _category_ancestors(category_ids):
+    # {category_id: [ancestor ids, self included]} from the closure table, one query
+    ancestors = defaultdict(list)
+    for descendant_id, ancestor_id in JobCategoryClosure.objects.filter(
+        descendant_id__in=category_ids
+    ).values_list("descendant_id", "ancestor_id"):
+        ancestors[descendant_id].append(str(ancestor_id))
+    return ancestors
+
+
+#longest n-gram kept for a non-ASCII saved word; see word_gram()
+GRAM_LENGTH = 3
+#values per IN (...) when looking up a job's prefixes
+LOOKUP_BATCH = 500
+
+
+def word_gram(word):
+    """
+    The n-gram a non-ASCII saved word is indexed under: up to GRAM_LENGTH
+    characters from its first non-ASCII one. Any text the word occurs in
+    contains it, so the substring check only runs for words whose gram the
+    job has.
+    """
+    for i, char in enumerate(word):
+        if not char.isascii():
+            return word[i:i + GRAM_LENGTH]
+    return None
+
+
+def _text_grams(text):
+    #every gram word_gram() can produce for a word inside text
+    grams = set()
+    for i, char in enumerate(text):
+        if not char.isascii():
+            grams.update(text[i:i + n] for n in range(1, GRAM_LENGTH + 1))
+    return grams
+
+
+def _lookup(kind, values, fields):
+    values = list(values)
+    for i in range(0, len(values), LOOKUP_BATCH):
+        yield from SavedSearchPredicate.objects.filter(
+            kind=kind, value__in=values[i:i + LOOKUP_BATCH], saved_search__is_active=True
+        ).values_list(*fields)
+
+
+def _matched_words(job):
+    """
+    Saved words search_filter would match for this job: prefixes of any of
+    its terms (every field, location included), and for non-ASCII words a
+    substring of title, category name or description. Both lookups start from
+    the job's own text, so they read only the predicate rows it can hit.
+    """
+    prefixes = set()
+    for _, term in job_term_counts(job):
+        prefixes.update(term[:i] for i in range(1, len(term) + 1))
+    words = {value for value, in _lookup("word", prefixes, ["value"])}
+
+    texts = (
+        compact_text(job.title),
+        compact_text(job.category.name) if job.category_id else "",
+        job.description or "",
+    )
+    grams = set().union(*(_text_grams(text) for text in texts))
+    groups = set(_lookup("gram", grams, ["saved_search_id", "group"]))
+    if groups:
+        candidates = SavedSearchPredicate.objects.filter(
+            kind="word", saved_search_id__in={search_id for search_id, _ in groups}
+        ).values_list("saved_search_id", "group", "value")
+        words.update(
+            word for search_id, group, word in candidates
+            if (search_id, group) in groups and any(word in text for text in texts)
+        )
+    return words
+
+
+def job_condition(job, category_ancestors):
+    condition = Q(kind="word", value__in=_matched_words(job))
+    if job.location:
+        condition |= Q(kind="location", value=job.location)
+    if job.category_id:
+        #a search on a parent category also covers its sub-categories
+        condition |= Q(kind="category", value__in=category_ancestors.get(job.category_id, []))
+    if job.job_type:
+        condition |= Q(kind="job_type", value=job.job_type)
+    return condition
+
+
+def matching_saved_searches(jobs):
+    """
+    {job: [saved_search_id, ...]} for active saved searches that /job/search/
+    with the saved q and loc (plus category / job_type) would return the job
+    for. Each job is a few indexed lookups on (kind, value) keyed by its own
+    terms, prefixes and n-grams, which only read the predicate rows the job
+    hits, so the cost follows the number of matching searches, not how many
+    exist. Candidates whose q has several words are
+    confirmed with search_filter itself, once per distinct q.
+    """
+    today = timezone.localdate()
+    jobs = [job for job in jobs if job.is_active and (job.deadline is None or job.deadline >= today)]
+    if not jobs:
+        return {}
+    ancestors = _category_ancestors({job.category_id for job in jobs if job.category_id})
+    matches = {}
+    for job in jobs:
+        hits = defaultdict(set)
+        required = {}
+        rows = SavedSearchPredicate.objects.filter(
+            job_condition(job, ancestors), saved_search__is_active=True
+        ).values_list("saved_search_id", "group", "saved_search__predicate_count", "saved_search__q")
+        queries = {}
+        for search_id, group, count, q in rows:
+            hits[search_id].add(group)
+            required[search_id] = count
+            queries[search_id] = q
+        candidates = [search_id for search_id, groups in hits.items() if len(groups) == required[search_id]]
+        confirmed = {}
+        found = []
+        for search_id in candidates:
+            q = queries[search_id]
+            if len(split_words(q)) > 1:
+                #the joined-words alternative can make every group hit without the query matching
+                key = " ".join(split_words(q))
+                if key not in confirmed:
+                    confirmed[key] = Jobs.objects.filter(pk=job.pk).filter(search_filter(q)).exists()
+                if not confirmed[key]:
+                    continue
+            found.append(search_id)
+        if found:
+            matches[job] = found
+    return matches
@@ -0,0 +1,261 @@
+import re
+from collections import Counter
+from django.db import transaction
+from django.db.models import Count, F, Max, Q
+
+from JobSeeker.normalize import normalize_text
+from Jobs.models import Jobs, JobSearchTerm, SearchFieldStat, SearchTermStat
+
+TERM_MAX_LENGTH = 64
+
+# split on whitespace and ASCII punctuation only, so Myanmar syllables
+# (combining vowel signs / medials) stay inside one token
+_SPLIT_RE = re.compile(r"[\s!-/:-@\[-`{-~]+")
+
+
+def split_words(text):
+    return [w for w in _SPLIT_RE.split(normalize_text(text)) if w]
+
+
+def field_term_counts(text, whole=True):
+    """
+    Terms for one field with their occurrence counts: every word, every
+    adjacent word pair joined without a space and (for short fields) the whole
+    value without spaces. This is the write-time version of the old
+    REPLACE(field, ' ', '') comparison. Returns (Counter, length in words).
+    """
+    words = split_words(text)
+    terms = Counter(words)
+    terms.update(a + b for a, b in zip(words, words[1:]))
+    if whole and len(words) > 2:
+        terms["".join(words)] += 1
+    counts = Counter()
+    for term, n in terms.items():
+        counts[term[:TERM_MAX_LENGTH]] += n
+    return counts, len(words)
+
+
+def field_terms(text, whole=True):
+    return set(field_term_counts(text, whole=whole)[0])
+
+
+def document_term_counts(title, location, location_label, category_name, description):
+    # returns {(field, term): (frequency, field_length), ...}
+    terms = {}
+    for field, text, whole in (
+        ("title", title, True),
+        ("location", f"{location or ''} {location_label or ''}", False),
+        ("category", category_name, True),
+        ("description", description, False),
+    ):
+        counts, length = field_term_counts(text, whole=whole)
+        terms.update(((field, term), (n, length)) for term, n in counts.items())
+    return terms
+
+
+def document_terms(title, location, location_label, category_name, description):
+    # returns {(field, term), ...}
+    return set(document_term_counts(title, location, location_label, category_name, description))
+
+
+def job_term_counts(job):
+    return document_term_counts(
+        job.title,
+        job.location,
+        job.get_location_display() if job.location else "",
+        job.category.name if job.category_id else "",
+        job.description,
+    )
+
+
+def job_terms(job):
+    return set(job_term_counts(job))
+
+
+def _field_lengths(postings):
+    # {field: length} from {(field, term): (..., field_length)}
+    return {field: values[-1] for (field, _), values in postings.items()}
+
+
+def _adjust_term_stats(keys, delta):
+    by_field = {}
+    for field, term in keys:
+        by_field.setdefault(field, []).append(term)
+    for field, terms in by_field.items():
+        if delta > 0:
+            SearchTermStat.objects.bulk_create(
+                [SearchTermStat(field=field, term=term) for term in terms],
+                ignore_conflicts=True,
+            )
+            rows = SearchTermStat.objects.filter(field=field, term__in=terms)
+        else:
+            rows = SearchTermStat.objects.filter(field=field, term__in=terms, doc_count__gte=-delta)
+        rows.update(doc_count=F("doc_count") + delta)
+
+
+def _bump_field_stat(field, docs, length):
+    if docs or length:
+        SearchFieldStat.objects.get_or_create(field=field)
+        SearchFieldStat.objects.filter(field=field).update(
+            doc_count=F("doc_count") + docs,
+            total_length=F("total_length") + length,
+        )
+
+
+def _adjust_field_stats(old_lengths, new_lengths):
+    for field in old_lengths.keys() | new_lengths.keys():
+        docs = (field in new_lengths) - (field in old_lengths)
+        _bump_field_stat(field, docs, new_lengths.get(field, 0) - old_lengths.get(field, 0))
+
+
+def index_job(job):
+    """
+    Diff the job's postings against its current text and write only the
+    changes, moving the document-frequency and field-length totals by the
+    same difference so BM25 never needs a corpus pass.
+    """
+    wanted = job_term_counts(job)
+    with transaction.atomic():
+        existing = {
+            (field, term): (pk, frequency, field_length)
+            for pk, field, term, frequency, field_length in JobSearchTerm.objects.filter(job=job).values_list(
+                "id", "field", "term", "frequency", "field_length"
+            )
+        }
+        stale = [key for key in existing if key not in wanted]
+        added = [key for key in wanted if key not in existing]
+        changed = [
+            JobSearchTerm(id=existing[key][0], frequency=frequency, field_length=field_length)
+            for key, (frequency, field_length) in wanted.items()
+            if key in existing and existing[key][1:] != (frequency, field_length)
+        ]
+        if stale:
+            JobSearchTerm.objects.filter(id__in=[existing[key][0] for key in stale]).delete()
+        JobSearchTerm.objects.bulk_create(
+            [
+                JobSearchTerm(job=job, field=field, term=term, frequency=wanted[field, term][0],
+                              field_length=wanted[field, term][1])
+                for field, term in added
+            ],
+            ignore_conflicts=True,
+        )
+        if changed:
+            JobSearchTerm.objects.bulk_update(changed, ["frequency", "field_length"])
+        _adjust_term_stats(added, 1)
+        _adjust_term_stats(stale, -1)
+        _adjust_field_stats(_field_lengths(existing), _field_lengths(wanted))
+
+
+def index_new_jobs(jobs):
+    """
+    index_job() for a batch of freshly inserted jobs: there is nothing to
+    diff, so all postings go in with one bulk insert and the statistics move
+    once for the whole batch.
+    """
+    postings, doc_freqs, totals = [], Counter(), {}
+    for job in jobs:
+        terms = job_term_counts(job)
+        postings.extend(
+            JobSearchTerm(job=job, field=field, term=term, frequency=frequency, field_length=field_length)
+            for (field, term), (frequency, field_length) in terms.items()
+        )
+        doc_freqs.update(terms.keys())
+        for field, length in _field_lengths(terms).items():
+            docs, total = totals.get(field, (0, 0))
+            totals[field] = (docs + 1, total + length)
+    by_count = {}
+    for key, n in doc_freqs.items():
+        by_count.setdefault(n, []).append(key)
+    with transaction.atomic():
+        JobSearchTerm.objects.bulk_create(postings, batch_size=1000, ignore_conflicts=True)
+        for n, keys in by_count.items():
+            _adjust_term_stats(keys, n)
+        for field, (docs, total) in totals.items():
+            _bump_field_stat(field, docs, total)
+
+
+def unindex_job(job_id):
+    # called before the postings cascade away with the job
+    with transaction.atomic():
+        existing = {
+            (field, term): field_length
+            for field, term, field_length in JobSearchTerm.objects.filter(job_id=job_id).values_list(
+                "field", "term", "field_length"
+            )
+        }
+        _adjust_term_stats(existing, -1)
+        _adjust_field_stats({field: length for (field, _), length in existing.items()}, {})
+
+
+def rebuild_term_stats():
+    """Recompute document frequencies and field totals from the postings."""
+    with transaction.atomic():
+        SearchTermStat.objects.all().delete()
+        SearchTermStat.objects.bulk_create(
+            (
+                SearchTermStat(field=row["field"], term=row["term"], doc_count=row["n"])
+                for row in JobSearchTerm.objects.values("field", "term").annotate(n=Count("id")).iterator()
+            ),
+            batch_size=1000,
+        )
+        totals = {}
+        lengths = JobSearchTerm.objects.values("field", "job_id").annotate(length=Max("field_length"))
+        for row in lengths.iterator():
+            docs, total = totals.get(row["field"], (0, 0))
+            totals[row["field"]] = (docs + 1, total + row["length"])
+        SearchFieldStat.objects.all().delete()
+        SearchFieldStat.objects.bulk_create([
+            SearchFieldStat(field=field, doc_count=docs, total_length=total)
+            for field, (docs, total) in totals.items()
+        ])
+
+
+def reindex_category(category_id):
+    """index_job() for every job filed under a category, after a rename."""
+    jobs = Jobs.objects.filter(category_id=category_id).select_related("category")
+    for job in jobs.iterator(chunk_size=500):
+        index_job(job)
+
+
+def rebuild_index(batch_size=500):
+    count = 0
+    jobs = Jobs.objects.select_related("category").iterator(chunk_size=batch_size)
+    for job in jobs:
+        index_job(job)
+        count += 1
+    rebuild_term_stats()
+    return count
+
+
+def _postings(term):
+    return JobSearchTerm.objects.filter(term__startswith=term).values("job_id")
+
+
+def _word_filter(word):
+    condition = Q(id__in=_postings(word[:TERM_MAX_LENGTH]))
+    #unspaced scripts (Myanmar) index a whole phrase as one term, so an inner
+    #word is no term's prefix: fall back to the old substring match for those
+    if not word.isascii():
+        condition |= (
+            Q(title_search__contains=word)
+            | Q(category__name_search__contains=word)
+            | Q(description__contains=word)
+        )
+    return condition
+
+
+def search_filter(q):
+    """
+    Q() restricting Jobs to documents matching every word of ``q`` as a term
+    prefix, or matching the whole query written without spaces. Non-ASCII
+    words also match as substrings of title, category name and description.
+    """
+    words = split_words(q)
+    if not words:
+        return Q()
+    condition = Q()
+    for word in words:
+        condition &= _word_filter(word)
+    if len(words) > 1:
+        condition |= Q(id__in=_postings("".join(words)[:TERM_MAX_LENGTH]))
+    return condition
@@ -0,0 +1,84 @@
+import math
+from django.db import transaction
+from django.db.models import Count, Max
+
+from EmployerProfile.models import EmployerProfile
+from Jobs.models import Jobs, JobCategory, SearchTrigram
+from Jobs.services.search_index import split_words
+
+DEFAULT_THRESHOLD = 0.3
+
+
+def trigrams(text):
+    # pg_trgm style: each word padded with two leading and one trailing space
+    grams = set()
+    for word in split_words(text):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def index_object(kind, object_id, text):
+    grams = trigrams(text)
+    with transaction.atomic():
+        SearchTrigram.objects.filter(kind=kind, object_id=object_id).delete()
+        SearchTrigram.objects.bulk_create([
+            SearchTrigram(kind=kind, object_id=object_id, gram=gram, gram_count=len(grams))
+            for gram in grams
+        ])
+
+
+def index_new_objects(kind, items):
+    # items: [(object_id, text), ...] with no rows yet, one bulk insert
+    rows = []
+    for object_id, text in items:
+        grams = trigrams(text)
+        rows.extend(
+            SearchTrigram(kind=kind, object_id=object_id, gram=gram, gram_count=len(grams))
+            for gram in grams
+        )
+    SearchTrigram.objects.bulk_create(rows, batch_size=1000)
+
+
+def remove_object(kind, object_id):
+    SearchTrigram.objects.filter(kind=kind, object_id=object_id).delete()
+
+
+def similar(kind, text, threshold=DEFAULT_THRESHOLD, limit=50):
+    """
+    [(object_id, similarity), ...] best first, where similarity is the Jaccard
+    index of the trigram sets. Candidates come from the (kind, gram) index and
+    anything that cannot reach ``threshold`` is cut in the HAVING clause.
+    """
+    grams = trigrams(text)
+    if not grams:
+        return []
+    # shared / (q + n - shared) >= t  implies  shared >= t * q / (1 + t)
+    min_shared = max(1, math.ceil(threshold * len(grams) / (1 + threshold)))
+    rows = (
+        SearchTrigram.objects.filter(kind=kind, gram__in=grams)
+        .values("object_id")
+        .annotate(shared=Count("id"), total=Max("gram_count"))
+        .filter(shared__gte=min_shared)
+    )
+    scored = []
+    for row in rows:
+        score = row["shared"] / (len(grams) + row["total"] - row["shared"])
+        if score >= threshold:
+            scored.append((row["object_id"], round(score, 4)))
+    scored.sort(key=lambda item: -item[1])
+    return scored[:limit]
+
+
+def rebuild_trigrams():
+    SearchTrigram.objects.all().delete()
+    count = 0
+    for kind, queryset, field in (
+        ("job", Jobs.objects.all(), "title"),
+        ("category", JobCategory.objects.all(), "name"),
+        ("company", EmployerProfile.objects.all(), "business_name"),
+    ):
+        for object_id, text in queryset.values_list("id", field).iterator():
+            index_object(kind, object_id, text)
+            count += 1
+    return count
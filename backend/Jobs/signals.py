@@ -1,15 +1,148 @@
-from django.db.models.signals import post_save
-from django.dispatch import receiver
+from django.db.models.signals import post_save, post_delete, pre_delete, pre_save
+from django.dispatch import receiver, Signal
 from django.db import transaction
 from django.contrib.contenttypes.models import ContentType
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
-from django.conf import settings
 
-from .models import Jobs
+from .models import Jobs, JobCategory
+from .services.search_index import index_job, index_new_jobs, reindex_category, unindex_job
+from .services.job_alerts import queue_new_job_emails, queue_saved_search_alerts
+from .services.result_cache import bump_catalogue_version
+from .services.autocomplete import autocomplete_index
+from .services import trigram
+from .services.category_tree import place_category, detach_category
+from .services.detail_cache import invalidate_job_details
+from Application.models import Application
 from Notification.models import Notification
-from JobSeekerProfile.models import JobseekerProfile
+from EmployerProfile.models import EmployerProfile
+
+#sent once per bulk_create batch (Jobs.services.bulk_import) with jobs=[...] and employer
+jobs_bulk_created = Signal()
+
+#fields that feed the search index
+SEARCH_INDEX_FIELDS = {"title", "description", "location", "category"}
+
+
+@receiver(post_save, sender=Jobs)
+def update_search_index(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not SEARCH_INDEX_FIELDS.intersection(update_fields):
+        return
+    index_job(instance)
+
+
+@receiver(pre_delete, sender=Jobs)
+def remove_from_search_index(sender, instance, **kwargs):
+    #keeps the BM25 document frequencies in step; the postings cascade
+    unindex_job(instance.pk)
+
+
+#category name about to change -> remember it so post_save reindexes only on a rename
+@receiver(pre_save, sender=JobCategory)
+def detect_category_rename(sender, instance, update_fields=None, **kwargs):
+    instance._renamed = False
+    if instance._state.adding:
+        return
+    if update_fields is not None and "name" not in update_fields:
+        return
+    previous = JobCategory.objects.filter(pk=instance.pk).values_list("name", flat=True).first()
+    instance._renamed = previous != instance.name
+
+
+@receiver(post_save, sender=JobCategory)
+def reindex_category_jobs(sender, instance, created, **kwargs):
+    if created or not getattr(instance, "_renamed", False):
+        return
+    category_id = instance.pk
+    transaction.on_commit(lambda: reindex_category(category_id))
+
+
+#closure table for category subtree queries
+@receiver(post_save, sender=JobCategory)
+def update_category_tree(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and "parent" not in update_fields:
+        return
+    place_category(instance)
+
+
+@receiver(pre_delete, sender=JobCategory)
+def detach_category_tree(sender, instance, **kwargs):
+    detach_category(instance)
+
+
+#trigram side table for fuzzy matching
+@receiver(post_save, sender=Jobs)
+def update_job_trigrams(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or "title" in update_fields:
+        trigram.index_object("job", instance.pk, instance.title)
+
+
+@receiver(post_save, sender=JobCategory)
+def update_category_trigrams(sender, instance, **kwargs):
+    trigram.index_object("category", instance.pk, instance.name)
+
+
+@receiver(post_save, sender=EmployerProfile)
+def update_company_trigrams(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or "business_name" in update_fields:
+        trigram.index_object("company", instance.pk, instance.business_name)
+
+
+@receiver(post_delete, sender=Jobs)
+@receiver(post_delete, sender=JobCategory)
+@receiver(post_delete, sender=EmployerProfile)
+def remove_trigrams(sender, instance, **kwargs):
+    kind = {Jobs: "job", JobCategory: "category", EmployerProfile: "company"}[sender]
+    trigram.remove_object(kind, instance.pk)
+
+
+#any catalogue change invalidates cached search results
+@receiver([post_save, post_delete], sender=Jobs)
+@receiver([post_save, post_delete], sender=JobCategory)
+@receiver([post_save, post_delete], sender=EmployerProfile)
+def invalidate_search_results(sender, **kwargs):
+    bump_catalogue_version()
+
+
+#cached job detail payloads; on commit so a concurrent rebuild can't cache pre-commit data
+@receiver([post_save, post_delete], sender=Jobs)
+def invalidate_job_detail(sender, instance, **kwargs):
+    transaction.on_commit(lambda: invalidate_job_details([instance.pk]))
+
+
+@receiver([post_save, post_delete], sender=Application)
+def invalidate_applied_job_detail(sender, instance, **kwargs):
+    #application_count is bumped with an UPDATE that sends no signal of its own
+    transaction.on_commit(lambda: invalidate_job_details([instance.job_id]))
+
+
+@receiver(post_save, sender=JobCategory)
+def invalidate_category_job_details(sender, instance, created, **kwargs):
+    if not created:
+        job_ids = list(Jobs.objects.filter(category=instance).values_list("id", flat=True))
+        transaction.on_commit(lambda: invalidate_job_details(job_ids))
+
+
+@receiver(post_save, sender=EmployerProfile)
+def invalidate_employer_job_details(sender, instance, created, **kwargs):
+    if not created:
+        job_ids = list(Jobs.objects.filter(employer=instance).values_list("id", flat=True))
+        transaction.on_commit(lambda: invalidate_job_details(job_ids))
+
+
+#typeahead trie: jobs are applied incrementally, renames trigger a rebuild
+@receiver(post_save, sender=Jobs)
+def update_autocomplete(sender, instance, **kwargs):
+    autocomplete_index.update_job(instance)
+
+
+@receiver(post_delete, sender=Jobs)
+def remove_from_autocomplete(sender, instance, **kwargs):
+    autocomplete_index.remove_job(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=JobCategory)
+@receiver([post_save, post_delete], sender=EmployerProfile)
+def invalidate_autocomplete(sender, **kwargs):
+    autocomplete_index.invalidate()
 
 
 @receiver(post_save, sender=Jobs)
@@ -27,32 +160,31 @@ def notify_on_job_created(sender, instance, created, **kwargs):
             object_id=instance.id,
         ))
 
-    #Jobseeker notifications (exact category match)
-    jobseekers = [
-        js for js in JobseekerProfile.objects.all()
-        if instance.category.id in js.applied_categories
-    ]
-
-    for js in jobseekers:
-        context = {
-            "full_name": js.full_name,
-            "job_title": instance.title,
-            "category_name": instance.category.name,
-            "job_url": f"https://job.arakkha.tech/jobs/{instance.id}/",
-            "year": 2025,
-        }
-
-        html_content = render_to_string(
-            "emails/new_job_notification.html",
-            context
-        )
-        text_content = strip_tags(html_content)
-
-        email = EmailMultiAlternatives(
-            subject="New job you may be interested in",
-            body=text_content,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[js.user.email],
-        )
-        email.attach_alternative(html_content, "text/html")
-        email.send()
+    #Jobseeker notifications (exact category match), queued for the send_outbox worker
+    if instance.category_id:
+        transaction.on_commit(lambda: queue_new_job_emails([instance]))
+    transaction.on_commit(lambda: queue_saved_search_alerts([instance]))
+
+
+@receiver(jobs_bulk_created, sender=Jobs)
+def handle_jobs_bulk_created(sender, jobs, employer, **kwargs):
+    #the per-row post_save work above, done for the whole batch
+    index_new_jobs(jobs)
+    trigram.index_new_objects("job", [(job.pk, job.title) for job in jobs])
+    for job in jobs:
+        autocomplete_index.update_job(job)
+    bump_catalogue_version()
+
+    if employer and employer.user:
+        transaction.on_commit(lambda: Notification.objects.create(
+            user=employer.user,
+            message=f"{len(jobs)} job(s) were imported.",
+            type="job",
+            content_type=ContentType.objects.get_for_model(Jobs),
+            object_id=jobs[0].id,
+        ))
+
+    with_category = [job for job in jobs if job.category_id]
+    if with_category:
+        transaction.on_commit(lambda: queue_new_job_emails(with_category))
+    transaction.on_commit(lambda: queue_saved_search_alerts(jobs))
@@ -1,3 +1,650 @@
-from django.test import TestCase
+import base64
+import csv
+import io
+import json
+import threading
+import uuid
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from Accounts.models import CustomUser
+from JobSeeker.renderers import FastJSONParser, FastJSONRenderer
+from EmployerProfile.models import EmployerProfile
+from Application.models import Application
+from .models import JobCategory, Jobs, JobSearchTerm
+from .checks import check_production_cache, check_shared_cache
+from .pagination import KeysetPagination
+from .serializers import JobsSerializer
+from .services.autocomplete import AutocompleteIndex
+from .services.counters import job_counters
+from .services.detail_cache import DetailCache
+from .services.expiry import expire_due_jobs
+from .services.result_cache import cached_result, catalogue_version
+from .services.saved_search import matching_saved_searches
+from JobSeekerProfile.models import JobseekerProfile, SavedSearch
+from Notification.models import OutboxEmail
+from .services.search_index import search_filter
+
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "versions": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "versions"},
+}
+
+
+def make_employer(email="employer@example.com", business_name="Arakkha Co"):
+    user = CustomUser.objects.create_user(email=email, password="pw", role="employer")
+    employer = EmployerProfile.objects.create(
+        user=user, first_name="A", last_name="B", business_name=business_name, city="Sittwe"
+    )
+    return user, employer
+
+
+class SearchIndexTests(TestCase):
+    def setUp(self):
+        self.user, self.employer = make_employer()
+        self.category = JobCategory.objects.create(name="Engineering", user=self.user)
+
+    def matching(self, q):
+        return set(Jobs.objects.filter(search_filter(q)).values_list("title", flat=True))
+
+    def test_word_prefix_match(self):
+        Jobs.objects.create(employer=self.employer, title="Senior Developer", description="Django and python")
+        Jobs.objects.create(employer=self.employer, title="Accountant", description="Ledgers")
+        self.assertEqual(self.matching("dev"), {"Senior Developer"})
+        self.assertEqual(self.matching("pyth"), {"Senior Developer"})
+        self.assertEqual(self.matching("dev ledg"), set())
+
+    def test_inner_myanmar_word_matches_as_substring(self):
+        #unspaced Myanmar text is one term; the inner word is not its prefix
+        Jobs.objects.create(employer=self.employer, title="ကွန်ပျူတာအင်ဂျင်နီယာ", description="")
+        self.assertEqual(self.matching("အင်ဂျင်နီယာ"), {"ကွန်ပျူတာအင်ဂျင်နီယာ"})
+
+    def test_category_rename_reindexes_jobs_on_commit(self):
+        job = Jobs.objects.create(employer=self.employer, title="Clerk", category=self.category)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.name = "Logistics"
+            self.category.save()
+        terms = set(JobSearchTerm.objects.filter(job=job, field="category").values_list("term", flat=True))
+        self.assertIn("logistics", terms)
+        self.assertNotIn("engineering", terms)
+
+    def test_category_save_without_rename_skips_reindex(self):
+        Jobs.objects.create(employer=self.employer, title="Clerk", category=self.category)
+        with mock.patch("Jobs.signals.reindex_category") as reindex:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.category.save()
+        reindex.assert_not_called()
+
+
+def cursor(value, pk):
+    return base64.urlsafe_b64encode(json.dumps([value, pk]).encode()).decode()
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        #list views buffer impressions; write them while the test database still exists
+        self.addCleanup(job_counters.flush)
+
+    def decode(self, token):
+        request = Request(APIRequestFactory().get("/", {"cursor": token}))
+        return KeysetPagination().decode_cursor(request)
+
+    def test_round_trip(self):
+        paginator = KeysetPagination()
+        job = Jobs(title="x")
+        now = timezone.now()
+        self.assertEqual(self.decode(paginator.encode_cursor(now, job.pk)), (now, job.pk))
+
+    def test_numeric_key(self):
+        job = Jobs(title="x")
+        self.assertEqual(self.decode(cursor(0.75, str(job.pk))), (0.75, job.pk))
+
+    def test_bad_cursors_are_not_found(self):
+        job = Jobs(title="x")
+        for token in (
+            "!!!",
+            base64.urlsafe_b64encode(b"not json").decode(),
+            cursor("not a date", str(job.pk)),
+            cursor({"a": 1}, str(job.pk)),
+            cursor("2024-01-01T00:00:00+00:00", "notauuid"),
+            cursor("2024-01-01T00:00:00+00:00", 5),
+            base64.urlsafe_b64encode(b"[1, 2, 3]").decode(),
+        ):
+            with self.subTest(token=token), self.assertRaises(NotFound):
+                self.decode(token)
+
+    def test_pages_follow_the_cursor(self):
+        _, employer = make_employer()
+        for i in range(5):
+            Jobs.objects.create(employer=employer, title=f"Job {i}")
+        client = APIClient()
+        seen = []
+        url = reverse("jobs-list") + "?page_size=2"
+        while url:
+            response = client.get(url)
+            self.assertEqual(response.status_code, 200)
+            seen += [job["id"] for job in response.data["jobs"]]
+            url = response.data["next"]
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(len(set(seen)), 5)
+
+    def test_seek_is_a_plain_range_with_ties_broken_by_id(self):
+        _, employer = make_employer()
+        for i in range(5):
+            Jobs.objects.create(employer=employer, title=f"Job {i}")
+        #same timestamp for every row: the id half of the key does all the work
+        Jobs.objects.update(created_at=timezone.now())
+        paginator = KeysetPagination()
+        seen, token = [], None
+        while True:
+            params = {"page_size": 2, **({"cursor": token} if token else {})}
+            request = Request(APIRequestFactory().get("/", params))
+            with self.assertNumQueries(1) as queries:
+                page = paginator.paginate_queryset(Jobs.objects.all(), request)
+            sql = queries.captured_queries[0]["sql"]
+            self.assertNotIn("IS NULL", sql)
+            seen += [job.pk for job in page]
+            if paginator.next_position is None:
+                break
+            token = paginator.encode_cursor(*paginator.next_position)
+            paginator.next_position = None
+        self.assertEqual(seen, sorted(seen, reverse=True))
+        self.assertEqual(len(set(seen)), 5)
+
+    def test_bad_uuid_cursor_is_404_not_500(self):
+        response = APIClient().get(reverse("jobs-list"), {"cursor": cursor("2024-01-01T00:00:00+00:00", "notauuid")})
+        self.assertEqual(response.status_code, 404)
+
+
+class SharedCacheTests(TestCase):
+    @override_settings(DEBUG=False, CACHES=LOCMEM_CACHES)
+    def test_process_local_cache_is_an_error(self):
+        self.assertEqual([error.id for error in check_shared_cache(None)], ["Jobs.E001", "Jobs.E001"])
+
+    def test_configured_cache_passes(self):
+        self.assertEqual(check_shared_cache(None), [])
+
+    def test_deploy_check_requires_an_in_memory_cache(self):
+        #the development fallback is the database cache
+        self.assertEqual([error.id for error in check_production_cache(None)], ["Jobs.E002", "Jobs.E002"])
+        redis = {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": "redis://localhost:6379"}
+        with override_settings(CACHES={"default": redis, "versions": redis}):
+            self.assertEqual(check_production_cache(None), [])
+
+    def test_culling_payloads_keeps_version_tokens(self):
+        version = catalogue_version()
+        cache.clear()
+        self.assertEqual(catalogue_version(), version)
+
+    def test_expiry_invalidates_cached_results(self):
+        _, employer = make_employer()
+        Jobs.objects.create(employer=employer, title="Old", deadline=timezone.localdate() - timedelta(days=1))
+        build = lambda: list(Jobs.objects.filter(is_active=True).values_list("title", flat=True))
+        self.assertEqual(cached_result(("expiry-test",), build), ["Old"])
+        self.assertEqual(expire_due_jobs(), 1)
+        self.assertEqual(cached_result(("expiry-test",), build), [])
+
+
+class DetailCacheTests(TestCase):
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_waiters_raise_the_leaders_error(self):
+        details = DetailCache()
+        started, release = threading.Event(), threading.Event()
+
+        def failing_build():
+            started.set()
+            release.wait(5)
+            raise RuntimeError("database went away")
+
+        leader = threading.Thread(target=lambda: self.assertRaises(
+            RuntimeError, details.get, "job-1", failing_build
+        ))
+        leader.start()
+        started.wait(5)
+        threading.Timer(0.1, release.set).start()
+        #a waiter must not turn the leader's failure into a None (a 404 in jobs_detail)
+        with self.assertRaisesMessage(RuntimeError, "database went away"):
+            details.get("job-1", lambda: {"data": {}})
+        leader.join()
+        self.assertEqual(details.builds, 1)
+
+
+class AutocompleteTests(TestCase):
+    def setUp(self):
+        _, self.employer = make_employer(business_name="Rakhine Tech")
+
+    def labels(self, index, prefix, limit=10):
+        return [(s["type"], s["label"], s["weight"]) for s in index.suggest(prefix, limit)]
+
+    def test_heaviest_entries_first(self):
+        for _ in range(3):
+            Jobs.objects.create(employer=self.employer, title="Web Developer", location="SIT")
+        Jobs.objects.create(employer=self.employer, title="Delivery Driver", location="SIT")
+        index = AutocompleteIndex()
+        self.assertEqual(
+            self.labels(index, "de"),
+            [("title", "Web Developer", 3), ("title", "Delivery Driver", 1)],
+        )
+        self.assertEqual(self.labels(index, "de", limit=1), [("title", "Web Developer", 3)])
+
+    def test_incremental_updates_move_the_top_lists(self):
+        index = AutocompleteIndex()
+        index.suggest("x")
+        job = Jobs.objects.create(employer=self.employer, title="Data Analyst", location="SIT")
+        index.update_job(job)
+        self.assertEqual(self.labels(index, "ana"), [("title", "Data Analyst", 1)])
+        index.remove_job(job.pk)
+        self.assertEqual(self.labels(index, "ana"), [])
+
+    def test_rebuild_reads_the_database_without_the_query_lock(self):
+        index = AutocompleteIndex()
+        build = index._build
+
+        def checked_build():
+            self.assertFalse(index._lock.locked())
+            return build()
+
+        with mock.patch.object(index, "_build", checked_build):
+            index.rebuild()
+        self.assertTrue(self.labels(index, "rakh"))
+
+
+class SearchViewTests(TestCase):
+    def setUp(self):
+        self.addCleanup(job_counters.flush)
+        self.employer_user, employer = make_employer()
+        self.python = Jobs.objects.create(employer=employer, title="Backend Engineer", description="Python and Django")
+        self.typo = Jobs.objects.create(employer=employer, title="Pythn", description="Teaching")
+        Jobs.objects.create(employer=employer, title="Accountant", description="Ledgers")
+        seeker = CustomUser.objects.create_user(email="seeker@example.com", password="pw")
+        self.client = APIClient()
+        self.client.force_authenticate(seeker)
+
+    def search(self, **params):
+        response = self.client.get(reverse("search-list"), params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_exact_matches(self):
+        data = self.search(q="python")
+        self.assertEqual([row["title"] for row in data["results"]], ["Backend Engineer"])
+        self.assertNotIn("fuzzy", data)
+
+    def test_fuzzy_adds_typo_matches_after_exact_ones(self):
+        data = self.search(q="python", fuzzy="1")
+        titles = [row["title"] for row in data["results"]]
+        self.assertTrue(data["fuzzy"])
+        self.assertEqual(titles[0], "Backend Engineer")
+        self.assertIn("Pythn", titles)
+        self.assertNotIn("Accountant", titles)
+
+    def test_trigram_fallback_when_nothing_matches_exactly(self):
+        data = self.search(q="pythin")
+        self.assertTrue(data["fuzzy"])
+        self.assertEqual([row["title"] for row in data["results"]], ["Pythn"])
+
+    def test_relevance_sort_keeps_the_same_matches(self):
+        _, employer = make_employer(email="other@example.com", business_name="Other Co")
+        Jobs.objects.create(employer=employer, title="Accountant", location="SIT")
+        Jobs.objects.create(employer=employer, title="ကွန်ပျူတာအင်ဂျင်နီယာ", description="")
+        for q in ("sittwe", "အင်ဂျင်နီယာ", "python"):
+            default = self.search(q=q)
+            ranked = self.search(q=q, sort="relevance")
+            self.assertEqual(ranked["count"], default["count"], q)
+            self.assertEqual({row["id"] for row in ranked["results"]}, {row["id"] for row in default["results"]})
+        self.assertEqual(self.search(q="sittwe", sort="relevance")["results"][0]["score"], 0.0)
+
+    def test_only_seeker_searches_count_as_impressions(self):
+        job_counters.flush()
+        self.search(q="python")
+        self.assertEqual(job_counters.pending(), 1)
+        job_counters.flush()
+        self.client.force_authenticate(self.employer_user)
+        self.search(q="python")
+        self.assertEqual(job_counters.pending(), 0)
+
+
+class SavedSearchAlertTests(TestCase):
+    def setUp(self):
+        self.addCleanup(job_counters.flush)
+        _, self.employer = make_employer()
+        self.seeker = CustomUser.objects.create_user(email="seeker@example.com", password="pw")
+        self.profile = JobseekerProfile.objects.create(user=self.seeker, full_name="Seeker")
+
+    def saved(self, q="", loc=""):
+        return SavedSearch.objects.create(profile=self.profile, name=f"{q}@{loc}" if loc else q, q=q, loc=loc)
+
+    def matched(self, job, searches):
+        found = set(matching_saved_searches([job]).get(job, []))
+        return {search.name for search in searches if search.pk in found}
+
+    def searched(self, job, search):
+        #the exact (non-fuzzy) result set of /job/search/?q=...&loc=...
+        jobs = Jobs.objects.filter(search_filter(search.q))
+        if search.loc:
+            jobs = jobs.filter(location__in=Jobs.locations.resolve(search.loc))
+        return jobs.filter(pk=job.pk).exists()
+
+    def test_alerts_match_what_search_returns(self):
+        searches = [
+            self.saved("dev", "Sittwe"),
+            self.saved("senior dev"),
+            self.saved("seniordev"),
+            self.saved("sittwe"),
+            self.saved("python"),
+            self.saved("dev", "Mrauk-U"),
+            self.saved("developers"),
+        ]
+        job = Jobs.objects.create(
+            employer=self.employer, title="Senior Developer", description="Django work", location="SIT"
+        )
+        matched = self.matched(job, searches)
+        self.assertEqual(matched, {"dev@Sittwe", "senior dev", "seniordev", "sittwe"})
+        self.assertTrue(self.searched(job, searches[0]))
+        for search in searches:
+            with self.subTest(q=search.q, loc=search.loc):
+                self.assertEqual(search.name in matched, self.searched(job, search))
+
+    def test_joined_words_alone_are_confirmed_against_search(self):
+        #"web" and "dev" only hit through the joined "webdev" alternative
+        search = self.saved("web dev")
+        job = Jobs.objects.create(employer=self.employer, title="Webdeveloper", location="SIT")
+        self.assertEqual(self.matched(job, [search]), {"web dev"})
+        other = Jobs.objects.create(employer=self.employer, title="Website designer", location="SIT")
+        self.assertEqual(self.matched(other, [search]), set())
+
+    def test_unspaced_words_match_inside_the_text(self):
+        inner = self.saved("အင်ဂျင်နီယာ")
+        missing = self.saved("ဆရာဝန်")
+        job = Jobs.objects.create(employer=self.employer, title="ကွန်ပျူတာအင်ဂျင်နီယာ")
+        self.assertEqual(self.matched(job, [inner, missing]), {"အင်ဂျင်နီယာ"})
+        for search in (inner, missing):
+            self.assertEqual(search.name in self.matched(job, [search]), self.searched(job, search))
+
+    def test_cost_does_not_grow_with_unrelated_searches(self):
+        self.saved("dev")
+        job = Jobs.objects.create(employer=self.employer, title="Senior Developer ကွန်ပျူတာ", location="SIT")
+        with self.assertNumQueries(3) as before:
+            matching_saved_searches([job])
+        for i in range(30):
+            self.saved(f"accountant{i}")
+            self.saved(f"ဆရာဝန်{i}")
+        with self.assertNumQueries(len(before.captured_queries)):
+            matching_saved_searches([job])
+
+    def test_new_job_queues_one_alert(self):
+        self.saved("dev", "Sittwe")
+        with self.captureOnCommitCallbacks(execute=True):
+            Jobs.objects.create(employer=self.employer, title="Senior Developer", location="SIT")
+        self.assertEqual(OutboxEmail.objects.filter(to_email="seeker@example.com").count(), 1)
+
+
+class QuickSearchTests(TestCase):
+    def setUp(self):
+        self.addCleanup(job_counters.flush)
+        user, employer = make_employer()
+        software = JobCategory.objects.create(name="Software Developer", user=user)
+        Jobs.objects.create(employer=employer, title="Backend Engineer", category=software)
+        self.client = APIClient()
+        self.client.force_authenticate(CustomUser.objects.create_user(email="seeker@example.com", password="pw"))
+
+    def titles(self, category, **params):
+        response = self.client.get(reverse("quick-search-category"), {"category": category, **params})
+        self.assertEqual(response.status_code, 200)
+        return [job["title"] for job in response.data["jobs"]]
+
+    def test_prefix_match(self):
+        self.assertEqual(self.titles("software"), ["Backend Engineer"])
+
+    def test_inner_word_falls_back_to_contains(self):
+        self.assertEqual(self.titles("developer"), ["Backend Engineer"])
+        self.assertEqual(self.titles("developer", include_descendants="1"), ["Backend Engineer"])
+        self.assertEqual(self.titles("designer"), [])
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        self.addCleanup(job_counters.flush)
+        _, employer = make_employer()
+        self.job = Jobs.objects.create(employer=employer, title="Backend Engineer")
+        self.other = Jobs.objects.create(employer=employer, title="Accountant")
+        self.client = APIClient()
+        self.url = reverse("jobs-list")
+
+    def revalidate(self, etag):
+        return self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_unchanged_list_is_304(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, 200)
+        self.assertNotIn("Last-Modified", first.headers)
+        second = self.revalidate(first["ETag"])
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.content, b"")
+
+    def test_counter_and_delete_change_the_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        Jobs.objects.adjust_application_count(self.job.pk, 1)
+        response = self.revalidate(etag)
+        self.assertEqual(response.status_code, 200)
+        self.other.delete()
+        self.assertEqual(self.revalidate(response["ETag"]).status_code, 200)
+
+    def test_if_modified_since_alone_never_304s(self):
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT")
+        self.assertEqual(response.status_code, 200)
+
+    def test_detail_revalidates_on_application_count(self):
+        user = CustomUser.objects.create_user(email="seeker@example.com", password="pw")
+        self.client.force_authenticate(user)
+        url = reverse("job-detail", args=[self.job.pk])
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        Jobs.objects.adjust_application_count(self.job.pk, 1)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def detail(self):
+        response = self.client.get(reverse("job-detail", args=[self.job.pk]))
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_expiry_drops_the_cached_detail(self):
+        self.client.force_authenticate(CustomUser.objects.create_user(email="seeker@example.com", password="pw"))
+        Jobs.objects.filter(pk=self.job.pk).update(deadline=timezone.localdate() - timedelta(days=1))
+        self.assertTrue(self.detail()["is_active"])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(expire_due_jobs(), 1)
+        self.assertFalse(self.detail()["is_active"])
+
+    def test_reconcile_drops_the_cached_detail(self):
+        self.client.force_authenticate(CustomUser.objects.create_user(email="seeker@example.com", password="pw"))
+        self.assertEqual(self.detail()["application_count"], 0)
+        #bulk_create: no signals, so the stored counter drifts from the table
+        Application.objects.bulk_create([Application(job=self.job)])
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("reconcile_application_counts", stdout=io.StringIO())
+        self.assertEqual(self.detail()["application_count"], 1)
+
+
+class JobImportTests(TestCase):
+    def setUp(self):
+        self.user, self.employer = make_employer()
+        JobCategory.objects.create(name="Engineering", user=self.user)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def upload(self, name, content):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                reverse("job-import"), {"file": SimpleUploadedFile(name, content)}, format="multipart"
+            )
+
+    def test_csv_rows_are_created_and_bad_rows_reported(self):
+        response = self.upload("jobs.csv", b"title,description,location,category\nBackend Engineer,Django,SIT,Engineering\nCashier,Bad township,ATLANTIS,Engineering\n")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.data["created"], response.data["failed"]), (1, 1))
+        self.assertEqual(response.data["errors"][0]["row"], 2)
+        self.assertTrue(Jobs.objects.filter(employer=self.employer, title="Backend Engineer").exists())
+
+    def test_jsonl_rows_are_created(self):
+        response = self.upload("jobs.jsonl", b'{"title": "Accountant", "description": "Ledgers", "category": "Engineering"}\nnot json\n')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.data["created"], response.data["failed"]), (1, 1))
+
+    def test_non_utf8_file_is_rejected_before_anything_is_written(self):
+        rows = b"title,description,category\n" + b"Engineer,Django,Engineering\n" * 300 + "Caf\xe9,Latin-1\n".encode("latin-1")
+        response = self.upload("jobs.csv", rows)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("UTF-8", response.data["error"])
+        self.assertFalse(Jobs.objects.exists())
+
+    def test_unparsable_csv_is_a_row_error(self):
+        too_long = b"x" * (csv.field_size_limit() + 1)
+        response = self.upload("jobs.csv", b"title,description,category\nEngineer,Django,Engineering\nBroken,Django," + too_long + b"\n")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(response.data["errors"][0]["row"], 2)
+
+
+class BulkActionTests(TestCase):
+    def setUp(self):
+        self.user, employer = make_employer()
+        _, other = make_employer(email="other@example.com", business_name="Other Co")
+        self.own = Jobs.objects.create(employer=employer, title="Backend Engineer")
+        self.foreign = Jobs.objects.create(employer=other, title="Accountant")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def act(self, action, ids, **extra):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                reverse("job-bulk-action"), {"action": action, "ids": [str(i) for i in ids], **extra}, format="json"
+            )
+
+    def test_close_touches_only_the_callers_jobs(self):
+        response = self.act("close", [self.own.pk, self.foreign.pk])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["updated"], 1)
+        self.assertEqual(response.data["not_found"], [str(self.foreign.pk)])
+        self.own.refresh_from_db()
+        self.foreign.refresh_from_db()
+        self.assertFalse(self.own.is_active)
+        self.assertTrue(self.foreign.is_active)
+
+    def test_reopen_skips_full_jobs(self):
+        Jobs.objects.filter(pk=self.own.pk).update(is_active=False, max_applicants=1)
+        Application.objects.create(job=self.own)
+        response = self.act("reopen", [self.own.pk])
+        self.assertEqual(response.data["updated"], 0)
+        self.assertEqual(response.data["skipped"][0]["id"], str(self.own.pk))
+
+    def test_extend_by_days_reactivates(self):
+        Jobs.objects.filter(pk=self.own.pk).update(is_active=False, deadline=timezone.localdate())
+        self.assertEqual(self.act("extend", [self.own.pk], days=7).status_code, 200)
+        self.own.refresh_from_db()
+        self.assertEqual(self.own.deadline, timezone.localdate() + timedelta(days=7))
+        self.assertTrue(self.own.is_active)
+
+    def test_extend_needs_deadline_or_days(self):
+        self.assertEqual(self.act("extend", [self.own.pk]).status_code, 400)
+
+
+class FeedTests(TestCase):
+    def setUp(self):
+        _, employer = make_employer()
+        self.live = Jobs.objects.create(employer=employer, title="Backend Engineer", description="<p>Django</p>")
+        self.closed = Jobs.objects.create(employer=employer, title="Closed", is_active=False)
+
+    def body(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return b"".join(response.streaming_content).decode()
+
+    def test_sitemap_lists_live_jobs(self):
+        self.assertIn(reverse("sitemap-jobs", args=[1]), self.body(reverse("sitemap")))
+        section = self.body(reverse("sitemap-jobs", args=[1]))
+        self.assertIn(str(self.live.pk), section)
+        self.assertNotIn(str(self.closed.pk), section)
+        self.assertEqual(self.client.get(reverse("sitemap-jobs", args=[2])).status_code, 404)
+
+    def test_rss_and_json_feeds(self):
+        rss = self.body(reverse("jobs-rss"))
+        self.assertIn("<title>Backend Engineer</title>", rss)
+        self.assertNotIn("Closed", rss)
+        feed = json.loads(self.body(reverse("jobs-json-feed")))
+        self.assertEqual([item["title"] for item in feed["items"]], ["Backend Engineer"])
+
+    def test_unchanged_feed_is_304(self):
+        etag = self.client.get(reverse("jobs-rss"))["ETag"]
+        self.assertEqual(self.client.get(reverse("jobs-rss"), HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+
+class SparseFieldsTests(TestCase):
+    def setUp(self):
+        self.addCleanup(job_counters.flush)
+        user, employer = make_employer()
+        category = JobCategory.objects.create(name="Engineering", user=user)
+        Jobs.objects.create(employer=employer, title="Backend Engineer", description="Django", category=category)
+
+    def jobs(self, **params):
+        response = APIClient().get(reverse("jobs-list"), params)
+        return response, response.data.get("jobs")
+
+    def test_fields_trims_the_payload(self):
+        _, jobs = self.jobs(fields="title,salary")
+        self.assertEqual(set(jobs[0]), {"id", "title", "salary"})
+
+    def test_compact_view(self):
+        _, jobs = self.jobs(view="compact")
+        self.assertEqual(set(jobs[0]), set(JobsSerializer.COMPACT_FIELDS))
+        self.assertEqual(jobs[0]["employer_business_name"], "Arakkha Co")
+
+    def test_unknown_field_is_400(self):
+        response, _ = self.jobs(fields="title,password")
+        self.assertEqual(response.status_code, 400)
+
+
+class RendererParityTests(TestCase):
+    payload = {
+        "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "deadline": date(2024, 1, 2),
+        "created_at": datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=dt_timezone.utc),
+        "salary": Decimal("1500.50"),
+        "title": "ကွန်ပျူတာ engineer",
+        "tags": [1, 2.5, None, True],
+        "counts": {1: "a"},
+    }
+
+    def test_same_bytes_as_drf(self):
+        self.assertEqual(FastJSONRenderer().render(self.payload), JSONRenderer().render(self.payload))
+
+    def test_indent_width_matches_drf(self):
+        for media_type in ("application/json; indent=4", "application/json; indent=2"):
+            self.assertEqual(
+                FastJSONRenderer().render(self.payload, media_type),
+                JSONRenderer().render(self.payload, media_type),
+            )
+
+    def test_parser_reads_what_the_renderer_writes(self):
+        body = FastJSONRenderer().render(self.payload)
+        self.assertEqual(FastJSONParser().parse(io.BytesIO(body)), json.loads(body))
+
+    def test_api_response_matches_drf(self):
+        self.addCleanup(job_counters.flush)
+        _, employer = make_employer()
+        Jobs.objects.create(employer=employer, title="Backend Engineer", description="Django")
+        response = APIClient().get(reverse("jobs-list"))
+        self.assertEqual(response.content, JSONRenderer().render(response.data))
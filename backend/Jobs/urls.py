@@ -13,12 +13,22 @@ urlpatterns = [
     #jobs urls
     path('jobs/', views.jobs_list, name='jobs-list'),
     path('jobs/create/', views.jobs_create, name='job-create'),
+    path('jobs/import/', views.jobs_import, name='job-import'),
+    path('jobs/bulk/', views.jobs_bulk_action, name='job-bulk-action'),
     path('jobs/detail/<uuid:pk>/', views.jobs_detail, name='job-detail'),
     path('jobs/update/<uuid:pk>/', views.jobs_update, name='job-update'),
     path('jobs/delete/<uuid:pk>/', views.jobs_delete, name='job-delete'),
+    path('jobs/popular/', views.popular_jobs, name='job-popular'),
+    path('jobs/stats/', views.jobs_stats, name='job-stats'),
 
     #search
     path('search/',views.search,name="search-list"),
+    path('search/cache-stats/',views.search_cache_stats,name="search-cache-stats"),
+    path('autocomplete/',views.autocomplete,name="autocomplete"),
+
+    #feeds
+    path('feed/rss/',views.jobs_rss,name="jobs-rss"),
+    path('feed/json/',views.jobs_json_feed,name="jobs-json-feed"),
 
     #quick search
     path('quick-search-city/',views.quick_search_by_location,name="quick-search"),
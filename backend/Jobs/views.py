@@ -1,22 +1,39 @@
 
 from django.shortcuts import render
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import BasePermission,IsAuthenticated,AllowAny
+from rest_framework.decorators import api_view, permission_classes, parser_classes
+from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.permissions import BasePermission,IsAuthenticated,AllowAny,IsAdminUser
 from rest_framework.response import Response
 from django.utils import timezone
 from django.db.models import Q,F, Case, When, Value, IntegerField
-from django.db.models import Count
+from django.db.models import Count, Max, Sum
 from datetime import date
+import uuid
 from django.db import IntegrityError
 from django.db.models import (
-    Q, F, Value, Func, Case, When, IntegerField, CharField
+    Q, F, Value, Func, Case, When, IntegerField, CharField, FloatField
 )
 
 # import Application
 from Application.models import Application
 from .models import JobCategory, Jobs
-from .serializers import JobCategorySerializer, JobsSerializer
+from .serializers import JobCategorySerializer, JobsSerializer, JobBulkActionSerializer
+from .services.search_index import search_filter, split_words
+from .services.result_cache import cached_result, request_role, search_results
+from .services.autocomplete import autocomplete_index
+from .services import trigram
+from .services.relevance import rank_jobs
+from .services.bulk_import import JobImportError, import_jobs
+from .services.bulk_actions import apply_bulk_action
+from .services.counters import job_counters, record_impressions, record_views
+from .services.detail_cache import job_details
+from .services import feeds
+from django.http import Http404, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from django.urls import reverse
+from .pagination import paginated_response
+from JobSeeker.conditional import conditional
 from EmployerProfile.models import EmployerProfile
 from django.shortcuts import get_object_or_404
 
@@ -34,6 +51,14 @@ def job_category_list(request):
             {"error": "You do not have permission to view categories."},
             status=status.HTTP_403_FORBIDDEN,
         )
+    # ?under=<uuid> limits the list to that category's subtree (closure join)
+    under = request.GET.get("under")
+    if under:
+        try:
+            under = uuid.UUID(under)
+        except ValueError:
+            return Response({"error": "Invalid category id."}, status=status.HTTP_400_BAD_REQUEST)
+        categories = categories.filter(ancestor_links__ancestor_id=under)
     serializer = JobCategorySerializer(categories, many=True)
     return Response(serializer.data)
 
@@ -106,25 +131,50 @@ def job_category_delete(request, pk):
         category.delete()
     return Response({'message': 'Category deleted'}, status=status.HTTP_204_NO_CONTENT)
 
+def _visible_jobs(user, today):
+    if user.is_staff:  
+        # Admin → All jobs
+        return Jobs.objects.all()
+    elif hasattr(user, "employerprofile"):
+        # Employer → Only their own jobs
+        return Jobs.objects.filter(employer__user=user)
+    not_expired = Q(deadline__isnull=True) | Q(deadline__gte=today)
+    return Jobs.objects.filter(is_active=True).filter(not_expired)
+
+
+def _jobs_state(jobs):
+    #everything JobsSerializer shows, as aggregates; application_count is bumped without touching updated_at
+    state = jobs.aggregate(
+        n=Count("id"),
+        applications=Sum("application_count"),
+        jobs=Max("updated_at"),
+        employers=Max("employer__updated_at"),
+        categories=Max("category__updated_at"),
+    )
+    return sorted(state.items())
+
+
+def jobs_list_state(request):
+    today = date.today()
+    user = request.user
+    return ["jobs", request_role(user), user.pk, today, *_jobs_state(_visible_jobs(user, today))]
+
+
 # jobs list
 @api_view(['GET'])
 @permission_classes([AllowAny])
+@conditional(jobs_list_state, private=True)
 def jobs_list(request):
+    #expired jobs are closed by the expire_jobs command, this view stays read-only
     today = date.today()
-    user = request.user
-    Jobs.objects.filter(is_active=True, deadline__lt=today).update(is_active=False)
-    if user.is_staff:  
-        # Admin → All jobs
-        jobs = Jobs.objects.all().order_by('-created_at')
-    elif hasattr(user, "employerprofile"):
-        # Employer → Only their own jobs
-        jobs = Jobs.objects.filter(employer__user=user).order_by('-created_at')
-    else:  
-        jobs = Jobs.objects.filter(is_active=True).order_by('-created_at')
-    serializer = JobsSerializer(jobs, many=True)
-    return Response({
-        "jobs":serializer.data,
-    }, status=status.HTTP_200_OK)
+    #?view=compact / ?fields=title,salary also trim the SELECT
+    fields = JobsSerializer.requested_fields(request)
+    jobs = JobsSerializer.optimize(_visible_jobs(request.user, today), fields, "created_at")
+    response = paginated_response(request, jobs, JobsSerializer, "jobs", fields=fields)
+    #staff and employers browsing their own jobs are not impressions
+    if request_role(request.user) in ("seeker", "anonymous"):
+        record_impressions([job["id"] for job in response.data["jobs"]])
+    return response
 
 # jobs create
 @api_view(['POST'])
@@ -143,24 +193,78 @@ def jobs_create(request):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+# bulk import (CSV / JSON Lines file upload)
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, IsAdminOrEmployer])
+@parser_classes([MultiPartParser, FormParser])
+def jobs_import(request):
+    try:
+        employer_profile = EmployerProfile.objects.get(user=request.user)
+    except EmployerProfile.DoesNotExist:
+        return Response({'error': 'Employer profile not found'}, status=status.HTTP_404_NOT_FOUND)
+    upload = request.FILES.get("file")
+    if upload is None:
+        return Response({'error': 'Attach the file as "file".'}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        report = import_jobs(upload, employer_profile, request.user)
+    except JobImportError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    code = status.HTTP_201_CREATED if report["created"] else status.HTTP_400_BAD_REQUEST
+    return Response(report, status=code)
+
+# bulk close / reopen / extend deadline / change priority
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, IsAdminOrEmployer])
+def jobs_bulk_action(request):
+    serializer = JobBulkActionSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    data = serializer.validated_data
+    result = apply_bulk_action(
+        request.user,
+        data["ids"],
+        data["action"],
+        deadline=data.get("deadline"),
+        days=data.get("days"),
+        priority=data.get("priority"),
+    )
+    return Response({"action": data["action"], **result}, status=status.HTTP_200_OK)
+
+def jobs_detail_state(request, pk):
+    row = Jobs.objects.filter(pk=pk).values_list(
+        "updated_at", "application_count", "employer__updated_at", "category__updated_at"
+    ).first()
+    if row is None:
+        return None
+    return ["job", pk, *row]
+
+
+def _job_detail_entry(pk):
+    job = Jobs.objects.select_related("employer", "category").filter(pk=pk).first()
+    if job is None:
+        return None
+    return {
+        "data": dict(JobsSerializer(job).data),
+        "employer_user_id": job.employer.user_id if job.employer_id else None,
+    }
+
+
 # Job Detail (GET)
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@conditional(jobs_detail_state, private=True)
 def jobs_detail(request, pk):
-    try:
-        job = Jobs.objects.get(pk=pk)
-    except Jobs.DoesNotExist:
+    #shared payload from the detail cache; per-user fields are added below, never cached
+    entry = job_details.get(pk, lambda: _job_detail_entry(pk))
+    if entry is None:
         return Response({"error": "Job not found"},status=status.HTTP_404_NOT_FOUND)
     user = request.user
-    if user.is_staff:  
-        serializer = JobsSerializer(job)
-        return Response(serializer.data)   
-    elif hasattr(user, "employerprofile") and job.employer.user == user:
-        serializer = JobsSerializer(job)
-        return Response(serializer.data)
-    else:
-        serializer = JobsSerializer(job)
-        return Response(serializer.data)
+    data = dict(entry["data"])
+    data["can_edit"] = user.is_staff or entry["employer_user_id"] == user.pk
+    if not data["can_edit"]:
+        record_views([pk])
+    if request_role(user) == "seeker":
+        data["is_applied"] = Application.objects.filter(job_id=pk, job_seeker_profile__user=user).exists()
+    return Response(data)
     
 
 # Job Update (PUT/PATCH)
@@ -178,7 +282,7 @@ def jobs_update(request, pk):
     updated_job = serializer.save()
 
     #AUTO REACTIVATE JOB IF MAX APPLICANTS INCREASED
-    total_apps = updated_job.applications.count()
+    total_apps = updated_job.application_count
     if updated_job.max_applicants and total_apps < updated_job.max_applicants:
         if not updated_job.is_active:
             updated_job.is_active = True
@@ -204,38 +308,63 @@ def search(request):
     q = (request.GET.get("q") or "").strip()
     loc = (request.GET.get("loc") or "").strip()
     today = date.today()
-    not_expired = Q(deadline__isnull=True) | Q(deadline__gte=today)
-    qs = Jobs.objects.filter(is_active=True).filter(not_expired)
-    qs = qs.select_related("employer")
-    normalized_q = q.replace(" ", "")
-    normalized_loc = loc.replace(" ", "")
-    qs = qs.annotate(
-        title_nospace=Func(F("title"), Value(" "), Value(""), function="REPLACE", output_field=CharField()),
-        location_nospace=Func(F("location"), Value(" "), Value(""), function="REPLACE", output_field=CharField()),
-        category_name=F("category__name"),
-        category_name_nospace=Func(F("category__name"), Value(" "), Value(""), function="REPLACE", output_field=CharField()),
-        description_nospace=Func(F("description"), Value(" "), Value(""), function="REPLACE", output_field=CharField()),
-        employer_business_name=F("employer__business_name"),
+    with_facets = request.GET.get("facets", "").lower() in ("1", "true", "yes")
+    fuzzy = request.GET.get("fuzzy", "").lower() in ("1", "true", "yes")
+    #?sort=relevance ranks by BM25 (blended with priority) instead of priority / recency
+    relevance = request.GET.get("sort", "").lower() == "relevance"
+    #?near=Sittwe&within=40 expands to the townships in range and sorts nearest first
+    near = (request.GET.get("near") or "").strip()
+    nearby = None
+    if near:
+        try:
+            radius = float(request.GET.get("within") or NEAR_DEFAULT_KM)
+        except ValueError:
+            return Response({"error": "within must be a distance in km."}, status=status.HTTP_400_BAD_REQUEST)
+        radius = max(0, min(radius, NEAR_MAX_KM))
+        nearby = Jobs.distances.within(Jobs.locations.resolve(near), radius)
+    key = (
+        "search", " ".join(split_words(q)), Jobs.locations.resolve(loc) if loc else None,
+        request_role(request.user), today, with_facets, fuzzy, relevance,
+        tuple(sorted(nearby.items())) if nearby is not None else None,
     )
+    data = cached_result(key, lambda: _search_results(q, loc, today, with_facets, fuzzy, relevance, nearby))
+    #same audience as jobs_list: staff and employers are not impressions
+    if request_role(request.user) in ("seeker", "anonymous"):
+        record_impressions([row["id"] for row in data["results"]])
+    return Response(data, status=status.HTTP_200_OK)
 
-    if q:
-        qs = qs.filter(
-            Q(title__icontains=q) |
-            Q(location__icontains=q) |
-            Q(category__name__icontains=q) |
-            Q(description__icontains=q) |
-            Q(title_nospace__icontains=normalized_q) |
-            Q(location_nospace__icontains=normalized_q) |
-            Q(category_name_nospace__icontains=normalized_q) |
-            Q(description_nospace__icontains=normalized_q)
-        )
 
-    if loc:
-        qs = qs.filter(
-            Q(location__icontains=loc) |
-            Q(location_nospace__icontains=normalized_loc)
-        )
+NEAR_DEFAULT_KM = 50
+NEAR_MAX_KM = 500
+SEARCH_LIMIT = 30
+#trigram similarities are at most 1.0; exact matches in a fuzzy result get the top score
+EXACT_MATCH_SCORE = 1.0
+
+
+def fuzzy_job_scores(q):
+    """
+    {job_id: similarity} for jobs whose title, category name or company name
+    is trigram-similar to ``q``; a job keeps its best score of the three.
+    """
+    scores = {}
+
+    def keep(job_id, score):
+        if score > scores.get(job_id, 0):
+            scores[job_id] = score
 
+    for job_id, score in trigram.similar("job", q):
+        keep(job_id, score)
+    for kind, field in (("category", "category_id"), ("company", "employer_id")):
+        matched = dict(trigram.similar(kind, q))
+        if matched:
+            rows = Jobs.objects.filter(**{f"{field}__in": matched}).values_list("id", field)
+            for job_id, owner_id in rows:
+                keep(job_id, matched[owner_id])
+    return scores
+
+
+def _ordered(qs, nearby=None):
+    #the usual result order: nearest first (with ?near), then priority, then recency
     qs = qs.annotate(
         priority_rank=Case(
             When(priority="FEATURED", then=Value(3)),
@@ -244,26 +373,146 @@ def search(request):
             output_field=IntegerField(),
         )
     ).order_by("-priority_rank", "-created_at")
+    if nearby:
+        #distance comes from the precomputed matrix, one WHEN per township in range
+        qs = qs.annotate(
+            distance_km=Case(
+                *[When(location=code, then=Value(km)) for code, km in nearby.items()],
+                output_field=IntegerField(),
+            )
+        ).order_by("distance_km", "-priority_rank", "-created_at")
+    return qs
+
+
+def _search_results(q, loc, today, with_facets=False, fuzzy=False, relevance=False, nearby=None):
+    not_expired = Q(deadline__isnull=True) | Q(deadline__gte=today)
+    base = Jobs.objects.filter(is_active=True).filter(not_expired)
+    qs = base
+    scores = None
+    used_fuzzy = False
+
+    #postings lookup replaces the per-row REPLACE()/icontains scan
+    if q:
+        qs = qs.filter(search_filter(q))
+        #typo tolerance: trigram matches are added to the exact ones when asked for,
+        #and used alone only when nothing matched exactly
+        exact_ids = list(
+            _ordered(_location_filter(qs, loc, nearby), nearby).values_list("id", flat=True)[:SEARCH_LIMIT]
+        )
+        if fuzzy or not exact_ids:
+            scores = fuzzy_job_scores(q)
+            #exact hits rank with a perfect similarity, ahead of every typo match
+            scores.update(dict.fromkeys(exact_ids, EXACT_MATCH_SCORE))
+            qs = base.filter(id__in=scores)
+            used_fuzzy = True
+
+    qs = _location_filter(qs, loc, nearby)
+    filtered = qs
+    ranked = None
+    if relevance and q and not used_fuzzy:
+        #ordering only: matches BM25 does not score (location, substring) stay in with score 0
+        ranked = dict(rank_jobs(q, filtered.values("id")))
+
+    qs = qs.select_related("employer")
+    qs = qs.annotate(
+        category_name=F("category__name"),
+        employer_business_name=F("employer__business_name"),
+    )
+    qs = _ordered(qs, nearby)
+    if ranked is not None:
+        qs = qs.annotate(
+            score=Case(
+                *[When(id=job_id, then=Value(score)) for job_id, score in ranked.items()],
+                default=Value(0.0),
+                output_field=FloatField(),
+            )
+        ).order_by("-score", *qs.query.order_by)
 
     #Use employer_business_name not employer__business_name
-    data = list(
-        qs.values(
-            "id",
-            "title",
-            "location",
-            "category_name",
-            "employer_business_name",
-            "description",
-            "deadline",
-            "created_at",
-            "priority"
-        )[:30]
+    fields = (
+        "id",
+        "title",
+        "location",
+        "category_name",
+        "employer_business_name",
+        "description",
+        "deadline",
+        "created_at",
+        "priority"
     )
+    if nearby:
+        fields += ("distance_km",)
+    if ranked is not None:
+        fields += ("score",)
+    if scores is None:
+        data = list(qs.values(*fields)[:SEARCH_LIMIT])
+    else:
+        #similarity / relevance first, then the usual priority / recency order
+        data = sorted(
+            qs.values(*fields, "priority_rank"),
+            key=lambda row: (
+                -scores[row["id"]],
+                row.get("distance_km") or 0,
+                -row["priority_rank"],
+                -row["created_at"].timestamp() if row["created_at"] else 0,
+            ),
+        )[:SEARCH_LIMIT]
+        for row in data:
+            row["score"] = scores[row["id"]]
+            row.pop("priority_rank")
 
-    return Response({
+    result = {
         "count": len(data),
         "results": data
-    }, status=status.HTTP_200_OK)
+    }
+    if used_fuzzy:
+        result["fuzzy"] = True
+    if with_facets:
+        result["facets"] = search_facets(filtered)
+    return result
+
+
+def _location_filter(qs, loc, nearby=None):
+    #township names / codes / spellings resolved to codes, then an indexed IN
+    if loc:
+        qs = qs.filter(location__in=Jobs.locations.resolve(loc))
+    if nearby is not None:
+        qs = qs.filter(location__in=nearby)
+    return qs
+
+
+FACET_LIMIT = 20
+
+
+def search_facets(qs, limit=FACET_LIMIT):
+    """
+    Per-location / job_type / category / priority counts for a filtered jobs
+    queryset, from a single GROUP BY over the four columns folded in Python.
+    """
+    rows = (
+        qs.order_by()
+        .values("location", "job_type", "category_id", "category__name", "priority")
+        .annotate(n=Count("id"))
+    )
+    location_labels = dict(Jobs.LOCATION_CHOICES)
+    job_type_labels = dict(Jobs.JOB_TYPE_CHOICES)
+    priority_labels = dict(Jobs.PRIORITY_CHOICES)
+
+    buckets = {"location": {}, "job_type": {}, "category": {}, "priority": {}}
+    for row in rows:
+        for facet, value, label in (
+            ("location", row["location"], location_labels.get(row["location"])),
+            ("job_type", row["job_type"], job_type_labels.get(row["job_type"])),
+            ("category", row["category_id"], row["category__name"]),
+            ("priority", row["priority"], priority_labels.get(row["priority"])),
+        ):
+            entry = buckets[facet].setdefault(value, {"value": value, "label": label, "count": 0})
+            entry["count"] += row["n"]
+
+    return {
+        facet: sorted(entries.values(), key=lambda e: -e["count"])[:limit]
+        for facet, entries in buckets.items()
+    }
 
 
 
@@ -272,18 +521,139 @@ def search(request):
 @permission_classes([IsAuthenticated])
 def quick_search_by_location(request):
    location=request.GET.get("city_name")
-   jobs=Jobs.objects.quick_search_by_city(location)
-   serializer=JobsSerializer(jobs,many=True)
-   return Response({"jobs":serializer.data},status=status.HTTP_200_OK)
+   fields=JobsSerializer.requested_fields(request)
+   def build():
+      jobs=JobsSerializer.optimize(Jobs.objects.quick_search_by_city(location), fields, "created_at")
+      return paginated_response(request, jobs, JobsSerializer, "jobs", fields=fields).data
+   codes=",".join(Jobs.locations.resolve(location)) if location else ""
+   data=cached_result(_quick_search_key(request, "city", codes, fields), build)
+   return Response(data,status=status.HTTP_200_OK)
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def quick_search_by_category(request):
    category=request.GET.get("category")
-   jobs=Jobs.objects.quick_search_by_category(category)
-   serializer=JobsSerializer(jobs,many=True)
-   return Response({"jobs":serializer.data},status=status.HTTP_200_OK)
-        
+   #?include_descendants=1 also returns jobs in nested sub-categories
+   subtree=request.GET.get("include_descendants", "").lower() in ("1", "true", "yes")
+   fields=JobsSerializer.requested_fields(request)
+   def build():
+      jobs=Jobs.objects.quick_search_by_category(category, include_descendants=subtree)
+      jobs=JobsSerializer.optimize(jobs, fields, "created_at")
+      return paginated_response(request, jobs, JobsSerializer, "jobs", fields=fields).data
+   data=cached_result(_quick_search_key(request, "category-tree" if subtree else "category", category, fields), build)
+   return Response(data,status=status.HTTP_200_OK)
+
+
+def _quick_search_key(request, kind, value, fields=None):
+   return (
+      kind,
+      (value or "").strip().casefold(),
+      fields,
+      request_role(request.user),
+      request.GET.get("cursor", ""),
+      request.GET.get("page_size", ""),
+      request.get_host(),
+   )
+
+
+#typeahead suggestions (titles, categories, companies, townships)
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def autocomplete(request):
+   q=request.GET.get("q", "")
+   try:
+      limit=max(1, min(int(request.GET.get("limit", 10)), 25))
+   except ValueError:
+      limit=10
+   return Response({"suggestions":autocomplete_index.suggest(q, limit)},status=status.HTTP_200_OK)
+
+
+#most viewed live jobs
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def popular_jobs(request):
+    try:
+        limit = max(1, min(int(request.GET.get("limit", 10)), 50))
+    except ValueError:
+        limit = 10
+    today = date.today()
+    fields = JobsSerializer.requested_fields(request)
+    jobs = JobsSerializer.optimize(
+        Jobs.objects.filter(is_active=True).filter(Q(deadline__isnull=True) | Q(deadline__gte=today)),
+        fields,
+        "view_count",
+    ).order_by("-view_count", "-created_at")[:limit]
+    data = []
+    for job in jobs:
+        item = JobsSerializer(job, fields=fields).data
+        item["view_count"] = job.view_count
+        data.append(item)
+    return Response({"jobs": data}, status=status.HTTP_200_OK)
+
+
+#views / impressions / applications per job for the employer (all jobs for staff)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsAdminOrEmployer])
+def jobs_stats(request):
+    jobs = _visible_jobs(request.user, date.today()).order_by("-created_at").values(
+        "id", "title", "is_active", "view_count", "impression_count", "application_count"
+    )
+    data = []
+    for job in jobs:
+        impressions = job["impression_count"]
+        job["click_through_rate"] = round(job["view_count"] / impressions, 4) if impressions else None
+        data.append(job)
+    #counts still buffered in this process are not included
+    return Response({"jobs": data, "pending": job_counters.pending()}, status=status.HTTP_200_OK)
+
+
+#hit-rate counters for the search result cache
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def search_cache_stats(request):
+   return Response(search_results.stats(),status=status.HTTP_200_OK)
+
+
+#sitemap and feeds: streamed from a chunked values() iterator, so memory stays flat
+def feed_state(request, *args, **kwargs):
+    today = date.today()
+    last_modified, count = feeds.feed_state(today)
+    return ["feed", request.path, today, count, last_modified]
+
+
+@require_GET
+@conditional(feed_state)
+def sitemap_index(request):
+    last_modified, count = feeds.feed_state(date.today())
+    sections = feeds.sitemap_sections(count)
+    section_url = lambda section: request.build_absolute_uri(reverse("sitemap-jobs", args=[section]))
+    return StreamingHttpResponse(
+        feeds.sitemap_index(section_url, sections, last_modified), content_type="application/xml"
+    )
 
 
+@require_GET
+@conditional(feed_state)
+def sitemap_jobs(request, section):
+    today = date.today()
+    _, count = feeds.feed_state(today)
+    if section < 1 or section > feeds.sitemap_sections(count):
+        raise Http404("No such sitemap section")
+    return StreamingHttpResponse(feeds.sitemap_section(today, section), content_type="application/xml")
+
+
+@require_GET
+@conditional(feed_state)
+def jobs_rss(request):
+    return StreamingHttpResponse(
+        feeds.rss_feed(date.today(), request.build_absolute_uri()), content_type="application/rss+xml; charset=utf-8"
+    )
+
+
+@require_GET
+@conditional(feed_state)
+def jobs_json_feed(request):
+    return StreamingHttpResponse(
+        feeds.json_feed(date.today(), request.build_absolute_uri()), content_type="application/feed+json; charset=utf-8"
+    )
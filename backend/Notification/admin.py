@@ -1,6 +1,6 @@
 # notifications/admin.py
 from django.contrib import admin
-from .models import Notification
+from .models import Notification, OutboxEmail
 
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
@@ -10,7 +10,9 @@ class NotificationAdmin(admin.ModelAdmin):
     ordering = ('-created_at',)
 
 
-
-
-
-
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = ('to_email', 'subject', 'status', 'attempts', 'created_at', 'sent_at')
+    list_filter = ('status', 'created_at')
+    search_fields = ('to_email', 'subject')
+    ordering = ('-created_at',)
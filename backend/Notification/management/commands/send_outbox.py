@@ -0,0 +1,22 @@
+import time
+from django.core.management.base import BaseCommand
+from Notification.outbox import send_pending
+
+
+class Command(BaseCommand):
+    help = "Send queued outbox emails in batches over one mail connection"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument("--loop", action="store_true", help="Keep draining, sleeping when the outbox is empty")
+        parser.add_argument("--interval", type=int, default=30, help="Seconds to sleep between empty polls")
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = send_pending(batch_size=options["batch_size"])
+            if sent or failed:
+                self.stdout.write(f"Sent {sent}, failed {failed}.")
+            if not options["loop"]:
+                break
+            if not sent and not failed:
+                time.sleep(options["interval"])
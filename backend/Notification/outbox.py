@@ -0,0 +1,98 @@
+import logging
+import uuid
+from datetime import timedelta
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import F, Q
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+from .models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+#a claim older than this belongs to a run that died; its rows go back in the queue
+CLAIM_TIMEOUT = getattr(settings, "OUTBOX_CLAIM_TIMEOUT", 10 * 60)
+
+
+def queue_emails(emails):
+    """
+    emails: iterable of dicts with to_email, subject, template and context.
+    One INSERT for the whole batch, nothing is sent in the request.
+    """
+    rows = [OutboxEmail(**email) for email in emails if email.get("to_email")]
+    return OutboxEmail.objects.bulk_create(rows)
+
+
+def _build_message(row, connection):
+    html_content = render_to_string(row.template, row.context)
+    message = EmailMultiAlternatives(
+        subject=row.subject,
+        body=strip_tags(html_content),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[row.to_email],
+        connection=connection,
+    )
+    message.attach_alternative(html_content, "text/html")
+    return message
+
+
+def claim_pending(batch_size=100, max_attempts=MAX_ATTEMPTS):
+    """
+    Mark up to ``batch_size`` pending rows as "sending" under a fresh claim
+    token and return them. The UPDATE re-checks the status, so two
+    send_outbox runs never claim the same row; SKIP LOCKED keeps them from
+    queueing behind each other where the database supports it.
+    """
+    now = timezone.now()
+    claimable = Q(status="pending") | Q(status="sending", claimed_at__lt=now - timedelta(seconds=CLAIM_TIMEOUT))
+    token = uuid.uuid4()
+    with transaction.atomic():
+        ids = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True)
+            .filter(claimable, attempts__lt=max_attempts)
+            .order_by("created_at")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return []
+        OutboxEmail.objects.filter(claimable, id__in=ids).update(
+            status="sending", claim_token=token, claimed_at=now
+        )
+    return list(OutboxEmail.objects.filter(claim_token=token).order_by("created_at"))
+
+
+def send_pending(batch_size=100, max_attempts=MAX_ATTEMPTS):
+    """Claim and send up to ``batch_size`` pending emails over a single mail connection."""
+    rows = claim_pending(batch_size, max_attempts)
+    if not rows:
+        return 0, 0
+
+    sent_ids, failed = [], 0
+    connection = get_connection()
+    connection.open()
+    try:
+        for row in rows:
+            try:
+                _build_message(row, connection).send()
+                sent_ids.append(row.id)
+            except Exception as exc:
+                failed += 1
+                logger.warning("Outbox email %s failed: %s", row.id, exc)
+                OutboxEmail.objects.filter(id=row.id, claim_token=row.claim_token).update(
+                    attempts=F("attempts") + 1,
+                    last_error=str(exc),
+                    status="failed" if row.attempts + 1 >= max_attempts else "pending",
+                    claim_token=None,
+                    claimed_at=None,
+                )
+    finally:
+        connection.close()
+
+    OutboxEmail.objects.filter(id__in=sent_ids).update(
+        status="sent", sent_at=timezone.now(), attempts=F("attempts") + 1, claim_token=None
+    )
+    return len(sent_ids), failed
@@ -1,4 +1,44 @@
+from datetime import timedelta
+
+from django.core import mail
 from django.test import TestCase
+from django.utils import timezone
+
+from .models import OutboxEmail
+from .outbox import CLAIM_TIMEOUT, claim_pending, queue_emails, send_pending
+
+
+def queue(n):
+    return queue_emails(
+        {
+            "to_email": f"seeker{i}@example.com",
+            "subject": "New job",
+            "template": "emails/new_job_notification.html",
+            "context": {"full_name": "Seeker"},
+        }
+        for i in range(n)
+    )
+
+
+class OutboxTests(TestCase):
+    def test_claims_do_not_overlap(self):
+        queue(5)
+        first = claim_pending(batch_size=3)
+        second = claim_pending(batch_size=3)
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(second), 2)
+        self.assertFalse({row.id for row in first} & {row.id for row in second})
+        self.assertEqual(claim_pending(), [])
 
+    def test_stale_claim_is_taken_back(self):
+        queue(1)
+        claim_pending()
+        OutboxEmail.objects.update(claimed_at=timezone.now() - timedelta(seconds=CLAIM_TIMEOUT + 1))
+        self.assertEqual(len(claim_pending()), 1)
 
-# Create your tests here.
\ No newline at end of file
+    def test_each_email_is_sent_once(self):
+        queue(3)
+        self.assertEqual(send_pending(), (3, 0))
+        self.assertEqual(send_pending(), (0, 0))
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(OutboxEmail.objects.filter(status="sent", claim_token__isnull=True).count(), 3)
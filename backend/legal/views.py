@@ -1,15 +1,25 @@
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
 from rest_framework import status
+from django.db.models import Count, Max
 from .models import *
 from .serializers import *
 from Notification.models import Notification
 from legal.utils import notify_admin_contact
+from JobSeeker.conditional import conditional
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.auth import get_user_model
 User=get_user_model()
 
+def _legal_state(model):
+    def state(request):
+        rows = model.objects.aggregate(n=Count("id"), last=Max("updated_at"))
+        return [model.__name__, rows["n"], rows["last"]]
+    return state
+
+
 @api_view(['GET'])
+@conditional(_legal_state(PrivacyPolicy))
 def privacy_policy(request):
     # Get all privacy policies, latest first
     policies = PrivacyPolicy.objects.all()
@@ -17,6 +27,7 @@ def privacy_policy(request):
     return Response(serializer.data)
 
 @api_view(['GET'])
+@conditional(_legal_state(AboutUs))
 def about_us(request):
     try:
         about = AboutUs.objects.latest('updated_at')
@@ -0,0 +1,27 @@
+#!/bin/sh
+# Container entrypoint: setup, the background workers, then gunicorn.
+# Set RUN_WORKERS=0 when send_outbox / expire_jobs run as their own service.
+set -e
+
+# check --deploy fails on Jobs.E002 unless REDIS_URL points at a shared Redis
+python manage.py check --deploy --fail-level ERROR
+python manage.py migrate
+python manage.py createcachetable
+python manage.py create_default_superuser
+
+# restart a worker command whenever it exits
+supervise() {
+    while true; do
+        python manage.py "$@" || echo "$1 exited with $?, restarting" >&2
+        sleep 5
+    done
+}
+
+if [ "${RUN_WORKERS:-1}" != "0" ]; then
+    # queued job-alert / notification emails
+    supervise send_outbox --loop &
+    # close jobs past their deadline (hourly sweep)
+    supervise expire_jobs --loop &
+fi
+
+exec gunicorn JobSeeker.wsgi:application --bind 0.0.0.0:8000